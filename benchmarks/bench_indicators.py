@@ -0,0 +1,130 @@
+"""
+기술적 지표 벤치마크
+다종목 분봉(기본 2,000종목 × 1년 = 250일 × 390분)에 대해 지표 일괄 계산과 봉 단위 갱신 속도를 측정하고,
+종목마다 파이썬 루프로 처음부터 다시 계산하는 방식과 비교합니다.
+
+분봉 전체를 메모리에 올리지 않도록 하루(390봉) 단위로 생성하여 batch를 이어서 호출합니다.
+
+실행:
+    python benchmarks/bench_indicators.py --symbols 2000 --days 250
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.indicators import SMA, EMA, RSI, VWAP, BollingerBands, IndicatorSet
+
+BARS_PER_DAY = 390
+
+
+def make_indicators(n_symbols: int) -> IndicatorSet:
+    return IndicatorSet({
+        "sma20": SMA(n_symbols, 20),
+        "ema20": EMA(n_symbols, 20),
+        "rsi14": RSI(n_symbols, 14),
+        "vwap": VWAP(n_symbols),
+        "bb20": BollingerBands(n_symbols, 20, 2.0),
+    })
+
+
+def generate_day(rng, last_close: np.ndarray) -> dict:
+    """하루치 분봉 (랜덤 워크, 일부 종목은 거래 없는 봉 NaN)"""
+    n_symbols = last_close.shape[0]
+    returns = rng.normal(0.0, 0.0008, (BARS_PER_DAY, n_symbols))
+    close = last_close * np.exp(np.cumsum(returns, axis=0))
+    spread = close * np.abs(rng.normal(0.0, 0.0005, close.shape))
+    volume = rng.integers(1, 5000, close.shape).astype(np.float64)
+
+    missing = rng.random(close.shape) < 0.02
+    close_with_gaps = np.where(missing, np.nan, close)
+    return {
+        "open": close_with_gaps,
+        "high": close_with_gaps + spread,
+        "low": close_with_gaps - spread,
+        "close": close_with_gaps,
+        "volume": np.where(missing, np.nan, volume),
+        "_last": close[-1],
+    }
+
+
+def naive_tick(closes: list, period: int = 20) -> list:
+    """종목마다 파이썬 루프로 SMA / 볼린저 밴드를 처음부터 계산 (기존 방식)"""
+    result = []
+    for series in closes:
+        window = series[-period:]
+        mean = sum(window) / period
+        std = (sum((x - mean) ** 2 for x in window) / period) ** 0.5
+        result.append((mean, mean + 2 * std, mean - 2 * std))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기술적 지표 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2000, help="종목 수")
+    parser.add_argument("--days", type=int, default=250, help="거래일 수 (하루 390분봉)")
+    parser.add_argument("--ticks", type=int, default=200, help="봉 단위 갱신 측정 횟수")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    n = args.symbols
+    last_close = rng.uniform(1000, 300000, n)
+
+    print(f"{n}종목 × {args.days}일 × {BARS_PER_DAY}분 = {n * args.days * BARS_PER_DAY:,}개 봉\n")
+
+    # 1) 결과 동일성: 하루치를 batch와 update로 각각 계산하여 비교
+    day = generate_day(rng, last_close)
+    batch_result = make_indicators(n).batch(day)
+    incremental = make_indicators(n)
+    identical = True
+    for t in range(BARS_PER_DAY):
+        bar = {name: values[t] for name, values in day.items() if name != "_last"}
+        for name, value in incremental.update(bar).items():
+            identical &= np.array_equal(batch_result[name][t], value, equal_nan=True)
+    print(f"batch / update 결과 동일: {'예' if identical else '아니오'}")
+
+    # 2) 일괄 계산 (하루 단위로 이어서 계산)
+    indicators = make_indicators(n)
+    generate_seconds = compute_seconds = 0.0
+    for d in range(args.days):
+        started = time.perf_counter()
+        day = generate_day(rng, last_close)
+        last_close = day.pop("_last")
+        generate_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        indicators.batch(day)
+        compute_seconds += time.perf_counter() - started
+
+    bars = args.days * BARS_PER_DAY
+    print(f"일괄 계산: {compute_seconds:.1f}초 (봉당 {compute_seconds / bars * 1e6:.0f}µs, "
+          f"지표 5종 × {n}종목), 데이터 생성 {generate_seconds:.1f}초 별도")
+
+    # 3) 봉 단위 갱신 (일괄 계산 이후 상태에서 이어서)
+    day = generate_day(rng, last_close)
+    samples = []
+    for t in range(min(args.ticks, BARS_PER_DAY)):
+        bar = {name: values[t] for name, values in day.items() if name != "_last"}
+        started = time.perf_counter()
+        indicators.update(bar)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    print(f"봉 단위 갱신: p50 {samples[len(samples) // 2] * 1e6:.0f}µs, "
+          f"p99 {samples[int(len(samples) * 0.99)] * 1e6:.0f}µs (지표 5종 × {n}종목)")
+
+    # 4) 기존 방식: 종목별 파이썬 루프로 SMA / 볼린저만 다시 계산
+    closes = [list(rng.uniform(1000, 300000, 100)) for _ in range(n)]
+    started = time.perf_counter()
+    naive_tick(closes)
+    naive = time.perf_counter() - started
+    print(f"기존 방식 (종목별 파이썬 루프, SMA / 볼린저만): 봉당 {naive * 1e6:.0f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+JSON 코덱 벤치마크
+키움 응답 형태의 페이로드로 설치된 코덱의 직렬화/파싱 속도를 비교합니다.
+
+실행:
+    python benchmarks/bench_json_codec.py --repeat 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.json_codec import JsonCodec, available_codecs
+
+
+def chart_payload(rows: int = 900) -> dict:
+    """일봉차트(ka10081) 응답 한 페이지"""
+    return {
+        "stk_cd": "005930",
+        "stk_dt_pole_chart_qry": [
+            {
+                "cur_prc": str(70000 + i),
+                "trde_qty": str(10000000 + i * 37),
+                "trde_prica": str(700000 + i * 11),
+                "dt": f"2024{(i % 12) + 1:02d}{(i % 28) + 1:02d}",
+                "open_pric": str(69800 + i),
+                "high_pric": str(70500 + i),
+                "low_pric": str(69500 + i),
+                "upd_stkpc_tp": "",
+                "upd_rt": "",
+                "bic_inds_tp": "",
+                "sm_inds_tp": "",
+                "stk_infr": "",
+                "upd_stkpc_event": "",
+                "pred_close_pric": str(69900 + i),
+            }
+            for i in range(rows)
+        ],
+        "return_code": 0,
+        "return_msg": "정상적으로 처리되었습니다",
+    }
+
+
+def quote_payload() -> dict:
+    """주식호가(ka10004) 응답"""
+    payload = {"bid_req_base_tm": "162000", "return_code": 0, "return_msg": "정상적으로 처리되었습니다"}
+    for i in range(1, 11):
+        payload[f"sel_{i}th_pre_bid"] = f"+{70000 + i * 100}"
+        payload[f"sel_{i}th_pre_req"] = str(1000 * i)
+        payload[f"buy_{i}th_pre_bid"] = f"-{70000 - i * 100}"
+        payload[f"buy_{i}th_pre_req"] = str(900 * i)
+    return payload
+
+
+def balance_payload(positions: int = 50) -> dict:
+    """계좌평가잔고내역(kt00018) 응답"""
+    return {
+        "tot_pur_amt": "150000000",
+        "tot_evlt_amt": "162000000",
+        "tot_evlt_pl": "12000000",
+        "tot_prft_rt": "8.00",
+        "acnt_evlt_remn_indv_tot": [
+            {
+                "stk_cd": f"A{100000 + i}",
+                "stk_nm": f"종목{i}",
+                "evltv_prft": str(10000 * i),
+                "prft_rt": "3.25",
+                "pur_pric": "50000",
+                "rmnd_qty": str(10 + i),
+                "cur_prc": "51625",
+            }
+            for i in range(positions)
+        ],
+        "return_code": 0,
+        "return_msg": "조회가 완료되었습니다",
+    }
+
+
+def bench(codec: JsonCodec, payload: dict, repeat: int) -> tuple:
+    """(직렬화 µs, 파싱 µs) 평균"""
+    encoded = codec.dumps(payload)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        codec.dumps(payload)
+    dumps_us = (time.perf_counter() - start) / repeat * 1e6
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        codec.loads(encoded)
+    loads_us = (time.perf_counter() - start) / repeat * 1e6
+
+    return dumps_us, loads_us, len(encoded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 코덱 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = {
+        "차트 900행": chart_payload(),
+        "호가": quote_payload(),
+        "잔고 50종목": balance_payload(),
+    }
+    codecs = available_codecs()
+
+    print(f"{'페이로드':<12} {'코덱':<8} {'크기(B)':>9} {'직렬화(µs)':>12} {'파싱(µs)':>12}")
+    for payload_name, payload in payloads.items():
+        for codec_name, codec in codecs.items():
+            dumps_us, loads_us, size = bench(codec, payload, args.repeat)
+            print(f"{payload_name:<12} {codec_name:<8} {size:>9,} {dumps_us:>12.1f} {loads_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
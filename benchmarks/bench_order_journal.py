@@ -0,0 +1,71 @@
+"""
+주문 저널 벤치마크
+group commit 주기별 초당 처리 가능한 주문 수를 측정합니다.
+
+실행:
+    python benchmarks/bench_order_journal.py --orders 2000 --threads 8
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.order_journal import OrderJournal, RECORD_SENT, RECORD_SUBMITTED
+
+
+def run(window_ms: float, orders: int, threads: int, directory: str) -> dict:
+    """주문마다 접수 기록 후 전송 기록의 fsync를 기다리는 주문 경로를 흉내냄"""
+    journal = OrderJournal(f"{directory}/orders_{window_ms}.wal", commit_interval_ms=window_ms)
+    per_thread = orders // threads
+    next_id = iter(range(1, orders + 1))
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(per_thread):
+            with lock:
+                order_id = next(next_id)
+            journal.append(RECORD_SUBMITTED, order_id, {"api_id": "kt10000", "stk_cd": "005930"})
+            journal.append(RECORD_SENT, order_id, wait=True)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    journal.close()
+
+    total = per_thread * threads
+    return {
+        "window_ms": window_ms,
+        "orders_per_sec": total / elapsed,
+        "records_per_fsync": journal.records / journal.commits if journal.commits else 0,
+        "fsyncs": journal.commits,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주문 저널 group commit 벤치마크")
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--windows", default="0,0.5,1,2,5,10", help="group commit 주기 목록 (ms)")
+    args = parser.parse_args()
+
+    print(f"{'주기(ms)':>10} {'주문/초':>12} {'fsync당 레코드':>16} {'fsync 횟수':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for window in (float(w) for w in args.windows.split(',')):
+            result = run(window, args.orders, args.threads, directory)
+            print(
+                f"{result['window_ms']:>10.1f} {result['orders_per_sec']:>12,.0f} "
+                f"{result['records_per_fsync']:>16.1f} {result['fsyncs']:>12,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
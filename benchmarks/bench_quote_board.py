@@ -0,0 +1,83 @@
+"""
+관심종목 시세판 벤치마크
+여러 수신 스레드가 QuoteBoard에 시세를 최대 속도로 넣는 동안, 화면 스레드 역할의 루프가 고정 프레임으로
+바뀐 셀을 가져가는 비용을 측정합니다. 프레임 비용이 틱 수가 아니라 종목 수에 묶이는지 확인합니다.
+
+Tk 없이 실행되며, 화면 반영은 보이는 행(기본 30행)에 해당하는 셀 수만 셉니다.
+
+실행:
+    python benchmarks/bench_quote_board.py --symbols 2000 --threads 4 --seconds 5
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.quote_board import QuoteBoard
+
+
+def producer(board: QuoteBoard, symbols: list, stop: threading.Event, seed: int):
+    rng = random.Random(seed)
+    while not stop.is_set():
+        symbol = rng.choice(symbols)
+        board.update(symbol, {
+            "cur_prc": str(rng.randint(10000, 10100)),
+            "trde_qty": str(rng.randint(1, 10 ** 6)),
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관심종목 시세판 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2000, help="종목 수")
+    parser.add_argument("--threads", type=int, default=4, help="수신 스레드 수")
+    parser.add_argument("--seconds", type=float, default=5.0, help="측정 시간 (초)")
+    parser.add_argument("--fps", type=int, default=10, help="화면 갱신 프레임 수")
+    parser.add_argument("--visible", type=int, default=30, help="보이는 행 수")
+    args = parser.parse_args()
+
+    symbols = [f"{i:06d}" for i in range(args.symbols)]
+    board = QuoteBoard(symbols)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=producer, args=(board, symbols, stop, seed), daemon=True)
+        for seed in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+
+    interval = 1.0 / args.fps
+    frame_costs = []
+    changed_cells = visible_cells = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < args.seconds:
+        frame_started = time.perf_counter()
+        changes = board.take_changes()
+        for symbol, cells in changes.items():
+            changed_cells += len(cells)
+            if board.index(symbol) < args.visible:
+                visible_cells += len(cells)
+        frame_costs.append(time.perf_counter() - frame_started)
+        time.sleep(max(0.0, interval - (time.perf_counter() - frame_started)))
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    frame_costs.sort()
+    frames = len(frame_costs)
+    print(f"{args.symbols}종목, 수신 스레드 {args.threads}개, {args.fps}fps, {elapsed:.1f}초")
+    print(f"수신: {board.updates_received / elapsed:,.0f}건/초")
+    print(f"프레임: {frames}회, take_changes p50 {frame_costs[frames // 2] * 1e3:.2f}ms, "
+          f"max {frame_costs[-1] * 1e3:.2f}ms")
+    print(f"바뀐 셀: 프레임당 {changed_cells / frames:,.0f}개 (전체), "
+          f"{visible_cells / frames:,.1f}개 (보이는 {args.visible}행, Treeview에 반영되는 양)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+HTTP 전송 계층 벤치마크
+로컬 대역 서버(HTTP/1.1 + h2c)에 동시 TR 요청을 보내 전송 계층별 처리량과 지연, 사용한 연결 수를 비교합니다.
+HTTP/2 비교에는 httpx[http2]가 필요합니다 (없으면 HTTP/1.1만 측정).
+
+로컬 대역 서버는 TLS를 사용하지 않으므로 연결마다 발생하는 TLS 핸드셰이크 비용은 결과에 포함되지 않습니다.
+
+실행:
+    python benchmarks/bench_transport.py --requests 2000 --concurrency 32 --latency 20
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.json_codec import get_codec
+from src.metrics import LatencyWindow
+from src.transport import HttpxTransport, RequestsTransport
+from standin_server import StandinServer
+
+
+def run(transport, url: str, total: int, concurrency: int) -> dict:
+    """동시 요청 실행 후 처리량 / 지연 백분위수 반환"""
+    codec = get_codec()
+    body = codec.dumps({"stk_cd": "005930", "base_dt": "20241231", "upd_stkpc_tp": "1"})
+    headers = {"Content-Type": "application/json;charset=UTF-8", "api-id": "ka10081",
+               "cont-yn": "N", "next-key": "", "authorization": "Bearer standin-token"}
+
+    latency = LatencyWindow(total)
+    lock = threading.Lock()
+    errors = [0]
+    remaining = iter(range(total))
+
+    def worker():
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            started = time.perf_counter()
+            try:
+                response = transport.post(url, headers=headers, body=body, timeout=(3.05, 10))
+                codec.loads(response.content)
+                ok = response.status_code == 200
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                latency.add(elapsed)
+                if not ok:
+                    errors[0] += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    return {"rps": total / wall, "errors": errors[0], "latency": latency.percentiles()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 전송 계층 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="전송 계층별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 스레드 수")
+    parser.add_argument("--latency", type=float, default=20.0, help="대역 서버 응답 지연 (ms)")
+    parser.add_argument("--h2-connections", type=int, default=1, help="HTTP/2 최대 연결 수")
+    args = parser.parse_args()
+
+    server = StandinServer(latency=args.latency / 1000).start_background()
+    url = f"{server.url}/api/dostk/chart"
+
+    candidates = [("requests (HTTP/1.1)", "HTTP/1.1", lambda: RequestsTransport(pool_size=args.concurrency))]
+    try:
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+        candidates.append((
+            "httpx (HTTP/2)", "HTTP/2",
+            lambda: HttpxTransport(pool_size=args.h2_connections, prior_knowledge=True)
+        ))
+    except ImportError:
+        print("httpx[http2]가 설치되지 않아 HTTP/2는 건너뜁니다.\n")
+
+    print(f"요청 {args.requests}건, 동시 {args.concurrency}, 서버 지연 {args.latency:.0f}ms\n")
+    print(f"{'전송 계층':<22}{'연결':>6}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'오류':>6}")
+
+    for label, protocol, factory in candidates:
+        transport = factory()
+        connections_before = server.connections[protocol]
+        try:
+            # 첫 연결 수립은 측정에서 제외
+            transport.head(server.url)
+            result = run(transport, url, args.requests, args.concurrency)
+        finally:
+            transport.close()
+
+        p = result["latency"]
+        print(
+            f"{label:<22}{server.connections[protocol] - connections_before:>6}"
+            f"{result['rps']:>10.0f}{p['p50'] * 1000:>8.1f}ms{p['p95'] * 1000:>8.1f}ms"
+            f"{p['p99'] * 1000:>8.1f}ms{result['errors']:>6}"
+        )
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
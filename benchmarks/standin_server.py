@@ -0,0 +1,255 @@
+"""
+키움 REST API 로컬 대역 서버
+벤치마크용으로 토큰 발급과 TR 호출에 고정 응답을 돌려주는 서버입니다.
+연결의 첫 바이트로 HTTP/2 사전 합의(h2c) 여부를 판별하므로 하나의 포트에서 HTTP/1.1과 HTTP/2를 모두 받습니다.
+HTTP/2 처리에는 h2 패키지가 필요합니다.
+
+실행:
+    python benchmarks/standin_server.py --port 8900 --latency 20
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+from typing import Dict, Optional, Tuple
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+TOKEN_RESPONSE = {
+    "expires_dt": "99991231235959",
+    "token_type": "Bearer",
+    "token": "standin-token",
+    "return_code": 0,
+    "return_msg": "정상적으로 처리되었습니다",
+}
+
+
+def chart_response(rows: int) -> dict:
+    """일봉차트(ka10081) 형태의 응답"""
+    return {
+        "stk_cd": "005930",
+        "stk_dt_pole_chart_qry": [
+            {
+                "cur_prc": str(70000 + i),
+                "trde_qty": str(10000000 + i * 37),
+                "dt": f"2024{(i % 12) + 1:02d}{(i % 28) + 1:02d}",
+                "open_pric": str(69800 + i),
+                "high_pric": str(70500 + i),
+                "low_pric": str(69500 + i),
+            }
+            for i in range(rows)
+        ],
+        "return_code": 0,
+        "return_msg": "정상적으로 처리되었습니다",
+    }
+
+
+class StandinServer:
+    """HTTP/1.1 + h2c 대역 서버 (asyncio)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.02, rows: int = 20):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 임의 포트)
+            latency: 응답 전 지연 (초, 서버 처리 시간 대역)
+            rows: TR 응답의 행 수 (HTTP/2 기본 흐름 제어 창 64KB 이하로 유지)
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self._token_body = json.dumps(TOKEN_RESPONSE).encode("utf-8")
+        self._tr_body = json.dumps(chart_response(rows)).encode("utf-8")
+
+        # 프로토콜별 수락한 연결 수 / 처리한 요청 수
+        self.connections = {"HTTP/1.1": 0, "HTTP/2": 0}
+        self.requests = {"HTTP/1.1": 0, "HTTP/2": 0}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _respond(self, method: str, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        if method == "HEAD":
+            return 200, {}, b""
+        if path == "/oauth2/token":
+            return 200, {}, self._token_body
+        return 200, {"cont-yn": "N", "next-key": ""}, self._tr_body
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            first = await reader.readexactly(len(H2_PREFACE))
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+
+        try:
+            if first == H2_PREFACE:
+                self.connections["HTTP/2"] += 1
+                await self._serve_h2(first, reader, writer)
+            else:
+                self.connections["HTTP/1.1"] += 1
+                await self._serve_http1(first, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # stop()에 의한 취소는 정상 종료로 처리 (취소된 채 끝나면 스트림 콜백이 예외 로그를 남김)
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http1(self, buffered: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """HTTP/1.1 keep-alive (연결당 요청 하나씩 순서대로 처리)"""
+        while True:
+            head = buffered + await reader.readuntil(b"\r\n\r\n")
+            buffered = b""
+
+            lines = head.decode("latin-1").split("\r\n")
+            method, path, _ = lines[0].split(" ", 2)
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length", 0))
+            if length:
+                await reader.readexactly(length)
+
+            await asyncio.sleep(self.latency)
+            status, extra, body = self._respond(method, path)
+            self.requests["HTTP/1.1"] += 1
+
+            response = [f"HTTP/1.1 {status} OK", "Content-Type: application/json;charset=UTF-8",
+                        f"Content-Length: {len(body)}"]
+            response += [f"{name}: {value}" for name, value in extra.items()]
+            writer.write(("\r\n".join(response) + "\r\n\r\n").encode("latin-1"))
+            if method != "HEAD":
+                writer.write(body)
+            await writer.drain()
+
+            if headers.get("connection", "").lower() == "close":
+                return
+
+    async def _serve_h2(self, preface: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """HTTP/2 (스트림마다 별도 태스크로 응답하여 하나의 연결에서 다중화)"""
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+
+        streams: Dict[int, Tuple[str, str]] = {}
+
+        async def respond(stream_id: int, method: str, path: str):
+            await asyncio.sleep(self.latency)
+            status, extra, body = self._respond(method, path)
+            headers = [(":status", str(status)), ("content-type", "application/json;charset=UTF-8"),
+                       ("content-length", str(len(body)))]
+            headers += list(extra.items())
+            try:
+                conn.send_headers(stream_id, headers, end_stream=not body)
+                if body:
+                    conn.send_data(stream_id, body, end_stream=True)
+            except h2.exceptions.StreamClosedError:
+                return
+            self.requests["HTTP/2"] += 1
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+        data = preface
+        while True:
+            events = conn.receive_data(data)
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = dict(event.headers)
+                    streams[event.stream_id] = (headers[":method"], headers[":path"])
+                elif isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    method, path = streams.pop(event.stream_id)
+                    asyncio.ensure_future(respond(event.stream_id, method, path))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    writer.write(conn.data_to_send())
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+            data = await reader.read(65536)
+            if not data:
+                return
+
+    async def _start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+
+    async def _shutdown(self):
+        """리스너를 닫고 연결 / 응답 태스크를 취소한 뒤 루프 종료"""
+        self._server.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop.stop()
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (stop()으로 종료되면 루프를 닫고 반환)"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._start())
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    def start_background(self) -> "StandinServer":
+        """데몬 스레드에서 서버 시작 (포트가 열릴 때까지 대기)"""
+        self._thread = threading.Thread(target=self.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """서버 종료 (start_background로 시작했으면 서버 스레드가 끝날 때까지 대기)"""
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        except RuntimeError:
+            # 이미 닫힌 루프
+            return
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키움 REST API 로컬 대역 서버 (HTTP/1.1 + h2c)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=20.0, help="응답 지연 (ms)")
+    parser.add_argument("--rows", type=int, default=20, help="TR 응답 행 수")
+    args = parser.parse_args()
+
+    server = StandinServer(args.host, args.port, args.latency / 1000, args.rows)
+    print(f"대역 서버 시작: {server.url} (응답 지연 {args.latency:.0f}ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n연결 수: {server.connections}, 요청 수: {server.requests}")
+
+
+if __name__ == "__main__":
+    main()
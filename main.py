@@ -4,6 +4,7 @@
 
 import sys
 import os
+import argparse
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -14,10 +15,119 @@ from src.config_manager import ConfigManager
 from src.logger import Logger
 from src.kiwoom_client import KiwoomAPIClient
 from src.gui import KiwoomTokenGUI
+from src.rate_limiter import RateLimiter
+from src.response_cache import ResponseCache
+from src.json_codec import get_codec
+from src.client_registry import ClientRegistry
+from src.transport import create_transport
+from src.event_bus import EventBus
+from src.profiling import ProfileSession, CPU_MODES
+from src.recording import CassetteWriter, RecordingTransport, ReplayTransport, read_cassette, replay_calls
+from src.condition_search import ConditionTracker, ConditionSearchFeed
+from src.backfill import ChartBackfill, BackfillCheckpoint
+from src.backfill_scheduler import BackfillScheduler, format_progress
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="키움증권 REST API 토큰 관리 시스템")
+    parser.add_argument(
+        "--backfill",
+        metavar="SYMBOLS_FILE",
+        help="GUI 없이 차트 백필 실행 (한 줄에 종목코드 하나인 파일)"
+    )
+    parser.add_argument(
+        "--api-id",
+        default="ka10081",
+        help="백필할 차트 TR 코드 (기본값: ka10081 일봉)"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="요청 / 응답 / 응답 시간을 카세트 파일에 기록 (.gz이면 압축, 키 / 토큰 / 계좌번호는 가림)"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="GUI 없이 카세트의 호출 패턴과 응답을 클라이언트로 재생하고 처리 시간 출력"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="재생 배속 (기본값: 1, 0이면 기다리지 않고 연속 실행)"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=CPU_MODES,
+        help="CPU 프로파일러 ([PROFILING] cpu 대신 사용, 보고서는 로그 디렉토리에 저장)"
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="tracemalloc으로 할당 위치 추적"
+    )
+    parser.add_argument(
+        "--profile-duration",
+        type=float,
+        metavar="SECONDS",
+        help="프로파일링 구간 (초, 0이면 종료 시까지)"
+    )
+    args = parser.parse_args()
+    # 재생 결과 출력이 재생 전송 계층(client.transport.misses)을 읽으므로 기록 전송 계층으로 감쌀 수 없음
+    if args.record and args.replay:
+        parser.error("--record와 --replay는 함께 사용할 수 없습니다.")
+    return args
+
+
+def run_backfill(client, config, symbols_file: str, api_id: str):
+    """헤드리스 백필 실행"""
+    with open(symbols_file, 'r', encoding='utf-8') as f:
+        symbols = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+    success, data = client.get_access_token()
+    if not success:
+        print(f"토큰 발급 실패: {data.get('error', data.get('message'))}")
+        return 1
+
+    backfill = ChartBackfill(client, BackfillCheckpoint(config.get_backfill_checkpoint_dir()))
+    scheduler = BackfillScheduler(
+        backfill,
+        workers=config.get_backfill_workers(),
+        max_retries=config.get_backfill_max_retries()
+    )
+    scheduler.start(symbols, api_id)
+
+    # 완료까지 주기적으로 진행 상황 출력
+    while not scheduler.join(timeout=5):
+        print(format_progress(scheduler.progress.snapshot()))
+
+    result = scheduler.progress.snapshot()
+    print(format_progress(result))
+    if result["failed_symbols"]:
+        print(f"실패 종목: {', '.join(result['failed_symbols'])}")
+    return 0 if not result["failed"] else 1
+
+
+def run_replay(client, cassette: str, speed: float):
+    """헤드리스 카세트 재생"""
+    header, records = read_cassette(cassette)
+    print(f"카세트: {cassette} (기록 {header.get('recorded_at')}, {len(records)}건, {speed}배속)")
+
+    report = replay_calls(client, records, speed=speed)
+    print(f"호출 {report['calls']}건, 오류 {report['errors']}건, "
+          f"기록 {report['recorded_seconds']:.1f}초 → 재생 {report['replay_seconds']:.1f}초")
+    for name in ("latency_ms", "overhead_ms", "start_lag_ms"):
+        values = ", ".join(f"{k} {v:.2f}" for k, v in report[name].items())
+        print(f"  {name}: {values}")
+    print(f"  카세트 불일치: {client.transport.misses}건")
+    return 0 if not report["errors"] else 1
 
 
 def main():
     """메인 함수"""
+    args = parse_args()
+
     print("=" * 60)
     print("키움증권 REST API 토큰 관리 시스템 v1.0")
     print("=" * 60)
@@ -30,25 +140,124 @@ def main():
         log_file=config.get_log_file(),
         log_level=config.get_log_level(),
         max_bytes=config.get_max_log_size(),
-        backup_count=config.get_backup_count()
+        backup_count=config.get_backup_count(),
+        **config.get_log_rotation()
     )
 
-    # API 클라이언트 초기화
-    client = KiwoomAPIClient(
-        appkey=config.get_appkey(),
-        secretkey=config.get_secretkey(),
-        environment=config.get_environment()
-    )
+    # 프로파일러 (명령행 인자가 [PROFILING] 설정보다 우선, 켜지 않으면 아무것도 설치하지 않음)
+    profiling = config.get_profiling_settings()
+    if args.profile:
+        profiling['cpu'] = args.profile
+    if args.profile_memory:
+        profiling['memory'] = True
+    if args.profile_duration is not None:
+        profiling['duration'] = args.profile_duration
+    profile_duration = profiling.pop('duration')
+    profiler = ProfileSession(str(Path(config.get_log_file()).parent), **profiling)
+    profile_on_start = profiler.cpu != "none" or profiler.memory
+
+    # 응답 캐시 초기화 (재생 시에는 카세트의 모든 호출이 재생 전송 계층을 거치도록 사용하지 않음)
+    cache = None
+    if config.get_cache_enabled() and not args.replay:
+        cache = ResponseCache(
+            ttls=config.get_cache_ttls(),
+            max_bytes=config.get_cache_max_memory(),
+            disk_path=config.get_cache_disk_path()
+        )
+
+    # API 클라이언트 초기화 (환경별로 토큰, 커넥션 풀, 호출 제한기를 따로 유지)
+    codec = get_codec(config.get_json_codec())
+
+    # 모든 환경의 클라이언트가 같은 이벤트 버스에 발행 (이벤트의 source로 환경 구분)
+    events = EventBus()
+
+    # 기록 모드: 모든 환경의 요청을 하나의 카세트에 기록
+    writer = CassetteWriter(args.record) if args.record else None
+
+    def create_client(environment: str) -> KiwoomAPIClient:
+        if args.replay:
+            # 재생: 응답은 카세트에서, 호출 제한은 배속만큼 완화
+            transport = ReplayTransport(args.replay, speed=args.speed, codec=codec)
+            rate = config.get_rate_limit() * args.speed if args.speed > 0 else 0
+        else:
+            transport = create_transport(config.get_http_version(), config.get_pool_size())
+            rate = config.get_rate_limit()
+        if writer is not None:
+            transport = RecordingTransport(transport, writer, codec)
+
+        client = KiwoomAPIClient(
+            appkey=config.get_appkey(environment),
+            secretkey=config.get_secretkey(environment),
+            environment=environment,
+            rate_limiter=RateLimiter(rate),
+            cache=cache,
+            codec=codec,
+            transport=transport,
+            event_bus=events
+        )
+        if args.replay:
+            return client
+        # 첫 요청이 DNS / TCP / TLS 연결 비용을 치르지 않도록 백그라운드 예열
+        if config.get_warm_connections() > 0:
+            client.warm_up(
+                connections=config.get_warm_connections(),
+                keepalive_interval=config.get_keepalive_interval(),
+                dns_ttl=config.get_dns_ttl()
+            )
+        if config.get_hedging_enabled():
+            client.enable_hedging(
+                percentile=config.get_hedge_percentile(),
+                budget_ratio=config.get_hedge_budget()
+            )
+        # 조건검색 실시간 추적 (토큰이 발급되면 웹소켓 접속)
+        if config.get_condition_enabled():
+            tracker = ConditionTracker(events, environment, **config.get_condition_limits())
+            try:
+                # 종료 시 client.close()로 함께 닫히도록 클라이언트에 보관
+                client.condition_feed = ConditionSearchFeed(client, tracker, config.get_condition_list())
+                tracker.start()
+            except ImportError:
+                print("websocket-client가 설치되지 않아 조건검색 실시간 수신을 사용할 수 없습니다.")
+        return client
+
+    clients = ClientRegistry(create_client, active=config.get_environment())
+
+    # 시작 환경의 클라이언트를 바로 생성하여 예열 시작
+    clients.get(config.get_environment())
+
+    try:
+        if args.replay or args.backfill:
+            if profile_on_start:
+                if profiler.cpu == "cprofile":
+                    # 헤드리스 작업은 작업자 스레드에서 실행되고 cProfile은 메인 스레드만 기록
+                    print("cProfile은 메인 스레드만 기록하며 실행 전체를 기록합니다. "
+                          "작업자 스레드까지 보려면 --profile sampling을 사용하세요.")
+                    profile_duration = 0
+                profiler.start(profile_duration)
+
+            # 헤드리스 재생
+            if args.replay:
+                return run_replay(clients.active, args.replay, args.speed)
+
+            # 헤드리스 백필
+            return run_backfill(clients.active, config, args.backfill, args.api_id)
 
-    # GUI 실행
-    print("\nGUI를 시작합니다...")
-    app = KiwoomTokenGUI(client, config)
-    app.run()
+        # GUI 실행
+        print("\nGUI를 시작합니다...")
+        app = KiwoomTokenGUI(clients, config, profiler)
+        if profile_on_start:
+            app.start_profiling(profile_duration)
+        app.run()
+    finally:
+        clients.close()
+        reports = profiler.stop()
+        if reports:
+            print(f"프로파일링 보고서: {', '.join(reports)}")
 
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\n\n프로그램을 종료합니다.")
         sys.exit(0)
@@ -3,14 +3,24 @@
 """
 
 from .kiwoom_client import KiwoomAPIClient
+from .client_registry import ClientRegistry
 from .config_manager import ConfigManager
 from .logger import Logger
 from .gui import KiwoomTokenGUI
+from .backfill import ChartBackfill, BackfillCheckpoint, BackfillError
+from .symbol_master import SymbolMaster
+from .event_bus import EventBus
 
 __version__ = "1.0.0"
 __all__ = [
     'KiwoomAPIClient',
+    'ClientRegistry',
     'ConfigManager',
     'Logger',
-    'KiwoomTokenGUI'
+    'KiwoomTokenGUI',
+    'ChartBackfill',
+    'BackfillCheckpoint',
+    'BackfillError',
+    'SymbolMaster',
+    'EventBus'
 ]
@@ -0,0 +1,358 @@
+"""
+계좌 상태 폴링
+예수금 / 보유종목 / 미체결 주문을 주기적으로 조회하고, 이전 스냅샷과 비교하여 변경분만 전달합니다.
+변경이 잦으면 주기를 줄이고, 변화가 없거나 장 시간이 아니면 주기를 늘립니다.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+
+class AccountFeed:
+    """폴링 대상 하나의 정의와 상태"""
+
+    def __init__(self, name: str, api_id: str, body: Dict, list_key: Optional[str] = None, item_key: Optional[str] = None):
+        """
+        Args:
+            name: 피드 이름
+            api_id: 조회 TR 코드
+            body: 요청 본문
+            list_key: 응답 목록 필드 (None이면 단일 레코드)
+            item_key: 목록 항목 식별 필드
+        """
+        self.name = name
+        self.api_id = api_id
+        self.body = body
+        self.list_key = list_key
+        self.item_key = item_key
+
+        self.interval = 0.0
+        self.next_poll = 0.0
+        self.snapshot: Optional[Dict] = None
+        # 마지막 스냅샷이 연속조회 모든 페이지를 담았는지 (페이지 상한에 걸리면 False)
+        self.complete = True
+
+
+def diff_snapshot(old: Optional[Dict], new: Dict) -> Dict:
+    """
+    두 스냅샷의 차이 계산
+
+    Args:
+        old: 이전 스냅샷 (키 → 레코드)
+        new: 새 스냅샷 (키 → 레코드)
+
+    Returns:
+        Dict: {"added": {...}, "removed": {...}, "changed": {키: {필드: (이전값, 새값)}}}
+    """
+    old = old or {}
+    added = {key: new[key] for key in new.keys() - old.keys()}
+    removed = {key: old[key] for key in old.keys() - new.keys()}
+
+    changed = {}
+    for key in new.keys() & old.keys():
+        before, after = old[key], new[key]
+        if before == after:
+            continue
+        fields = {
+            field: (before.get(field), after.get(field))
+            for field in before.keys() | after.keys()
+            if before.get(field) != after.get(field)
+        }
+        if fields:
+            changed[key] = fields
+
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+class AccountPoller:
+    """계좌 상태 적응형 폴링 스케줄러"""
+
+    ACCOUNT_ENDPOINT = "/api/dostk/acnt"
+
+    # 폴링을 촘촘히 하는 시간 (HHMM, 기본값은 장전 시간외 08:30 ~ 시간외 단일가 종료 18:00)
+    MARKET_OPEN = 830
+    MARKET_CLOSE = 1800
+
+    # 응답 공통 필드 (비교 대상에서 제외)
+    _META_FIELDS = ("return_code", "return_msg")
+
+    def __init__(
+        self,
+        kiwoom_client,
+        account: str = "default",
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        off_hours_interval: float = 300.0,
+        backoff: float = 1.5,
+        market_open: int = MARKET_OPEN,
+        market_close: int = MARKET_CLOSE,
+        max_pages: int = 20
+    ):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient 인스턴스 (호출 제한기 공유)
+            account: 계좌 식별자
+            min_interval: 변경이 감지된 직후의 폴링 주기 (초)
+            max_interval: 장중 최대 폴링 주기 (초)
+            off_hours_interval: 장 시간 외 폴링 주기 (초)
+            backoff: 변화가 없을 때 주기 증가 배율
+            market_open: 장 시작 시각 (HHMM)
+            market_close: 장 종료 시각 (HHMM, 이 시각부터 장 시간 외)
+            max_pages: 목록 피드의 최대 연속조회 페이지 수
+        """
+        self.client = kiwoom_client
+        self.account = account
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.off_hours_interval = off_hours_interval
+        self.backoff = backoff
+        self.market_open = market_open
+        self.market_close = market_close
+        self.max_pages = max_pages
+        self.logger = logging.getLogger(__name__)
+
+        self.feeds: Dict[str, AccountFeed] = {
+            "balance": AccountFeed("balance", "kt00001", {"qry_tp": "3"}),
+            "positions": AccountFeed(
+                "positions", "kt00018", {"qry_tp": "1", "dmst_stex_tp": "KRX"},
+                list_key="acnt_evlt_remn_indv_tot", item_key="stk_cd"
+            ),
+            "unfilled": AccountFeed(
+                "unfilled", "ka10075", {"all_stk_tp": "0", "trde_tp": "0", "stex_tp": "0"},
+                list_key="oso", item_key="ord_no"
+            ),
+        }
+
+        self._subscribers: List[Callable[[str, str, Dict], None]] = []
+        self._lock = threading.Lock()
+        # 피드 주기 / 다음 조회 시각 (폴링 스레드와 notify_activity 호출 스레드가 함께 변경)
+        self._schedule_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callable[[str, str, Dict], None]):
+        """
+        변경 구독 (폴링 스레드에서 호출됨)
+
+        Args:
+            callback: callback(계좌, 피드 이름, 변경 내용)
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str, Dict], None]):
+        """구독 해제"""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def track_fills(self):
+        """
+        체결(ka10076) 조회 추가 (주문번호별 누적 체결 수량 / 체결가)
+
+        같은 시각에 조회할 때 보유종목보다 먼저 조회하여, 체결을 반영한 직후의 잔고 대사가
+        방금 반영한 체결을 누락으로 보고 다시 교정하는 일을 줄입니다.
+        """
+        feed = AccountFeed(
+            "fills", "ka10076", {"stk_cd": "", "qry_tp": "0", "sell_tp": "0", "ord_no": "", "stex_tp": "0"},
+            list_key="cntr", item_key="ord_no"
+        )
+        with self._schedule_lock:
+            if feed.name in self.feeds:
+                return
+            self.feeds = {feed.name: feed, **self.feeds}
+        self._wakeup.set()
+
+    def get_snapshot(self, feed: str) -> Optional[Dict]:
+        """피드의 마지막 스냅샷"""
+        return self.feeds[feed].snapshot
+
+    def is_complete(self, feed: str) -> bool:
+        """피드의 마지막 스냅샷이 모든 페이지를 담았는지 (페이지 상한에 걸렸으면 False)"""
+        feed = self.feeds[feed]
+        return feed.snapshot is not None and feed.complete
+
+    def is_market_hours(self, now: Optional[datetime] = None) -> bool:
+        """장 운영 시간 여부 (평일 기준)"""
+        now = now or datetime.now()
+        if now.weekday() >= 5:
+            return False
+        hhmm = now.hour * 100 + now.minute
+        return self.market_open <= hhmm < self.market_close
+
+    def notify_activity(self):
+        """주문 전송 등 외부 활동 알림 (모든 피드를 최소 주기로 즉시 조회, 어느 스레드에서나 호출 가능)"""
+        now = time.monotonic()
+        with self._schedule_lock:
+            for feed in self.feeds.values():
+                feed.interval = self.min_interval
+                feed.next_poll = now
+        self._wakeup.set()
+
+    def start(self):
+        """폴링 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"account-poller-{self.account}", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"[{self.account}] 계좌 폴링 시작")
+
+    def stop(self):
+        """폴링 스레드 종료"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.logger.info(f"[{self.account}] 계좌 폴링 종료")
+
+    def _run(self):
+        while not self._stop.is_set():
+            now = time.monotonic()
+            with self._schedule_lock:
+                due = [feed for feed in self.feeds.values() if feed.next_poll <= now]
+
+            for feed in due:
+                if self._stop.is_set():
+                    return
+                try:
+                    self.poll(feed.name)
+                except Exception:
+                    # 예기치 못한 응답 형식 등으로 폴링 스레드가 끝나지 않도록 다음 주기에 다시 시도
+                    self.logger.exception(f"[{self.account}] {feed.name} 폴링 중 예외 발생")
+                    with self._schedule_lock:
+                        feed.next_poll = time.monotonic() + max(feed.interval, self.min_interval)
+
+            with self._schedule_lock:
+                next_poll = min(feed.next_poll for feed in self.feeds.values())
+            self._wakeup.wait(max(0.0, next_poll - time.monotonic()))
+            self._wakeup.clear()
+
+    def _to_snapshot(self, feed: AccountFeed, body: Dict) -> Dict:
+        """응답 본문을 비교용 스냅샷(키 → 레코드)으로 변환"""
+        if feed.list_key is None:
+            return {
+                "account": {
+                    key: value for key, value in body.items()
+                    if key not in self._META_FIELDS and not isinstance(value, list)
+                }
+            }
+        return {
+            item.get(feed.item_key, str(i)): item
+            for i, item in enumerate(body.get(feed.list_key) or [])
+        }
+
+    def poll(self, name: str) -> Optional[Dict]:
+        """
+        피드 하나를 즉시 조회하고 주기 조정
+
+        Args:
+            name: 피드 이름
+
+        Returns:
+            Optional[Dict]: 변경 내용 (실패하거나 변경이 없으면 None)
+        """
+        feed = self.feeds[name]
+        success, result = self._fetch(feed)
+
+        changes = None
+        if success:
+            body, complete = result
+            snapshot = self._to_snapshot(feed, body)
+            changes = diff_snapshot(feed.snapshot, snapshot)
+            if not complete:
+                # 상한 너머의 항목은 받지 못했을 뿐이므로 삭제로 알리지 않음
+                changes["removed"] = {}
+            feed.snapshot = snapshot
+            feed.complete = complete
+            if not any(changes.values()):
+                changes = None
+        else:
+            self.logger.warning(f"[{self.account}] {name} 조회 실패: {result}")
+
+        # 변경이 있으면 최소 주기로, 없으면 점차 늘림
+        market_hours = self.is_market_hours()
+        with self._schedule_lock:
+            if not market_hours:
+                feed.interval = self.off_hours_interval
+            elif changes:
+                feed.interval = self.min_interval
+            else:
+                feed.interval = min(self.max_interval, max(self.min_interval, feed.interval * self.backoff))
+            feed.next_poll = time.monotonic() + feed.interval
+
+        if changes:
+            self._publish(name, changes)
+        return changes
+
+    def _fetch(self, feed: AccountFeed):
+        """
+        피드 조회 (목록 피드는 연속조회 페이지를 max_pages까지 받아 목록을 합침)
+
+        Returns:
+            Tuple: (True, (합친 응답 본문, 모든 페이지 수신 여부)) 또는 (False, 오류 정보)
+        """
+        cont_yn, next_key = "N", ""
+        body = None
+        for _ in range(self.max_pages):
+            success, result = self.client.call_api(
+                feed.api_id, self.ACCOUNT_ENDPOINT, feed.body, cont_yn, next_key
+            )
+            if not success:
+                # 일부 페이지만으로는 이전 스냅샷과 비교할 수 없으므로 조회 실패로 처리
+                return False, result
+
+            page = result["body"]
+            if body is None:
+                body = dict(page)
+                if feed.list_key is None:
+                    return True, (body, True)
+                body[feed.list_key] = list(page.get(feed.list_key) or [])
+            else:
+                body[feed.list_key].extend(page.get(feed.list_key) or [])
+
+            if result.get("cont_yn") != "Y":
+                return True, (body, True)
+            cont_yn, next_key = "Y", result.get("next_key", "")
+
+        self.logger.warning(
+            f"[{self.account}] {feed.name} 조회가 {self.max_pages}페이지를 넘어 일부만 반영합니다."
+        )
+        return True, (body, False)
+
+    def _publish(self, name: str, changes: Dict):
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(self.account, name, changes)
+            except Exception:
+                self.logger.exception("계좌 변경 구독자 오류")
+
+
+def describe_changes(feed: str, changes: Dict) -> str:
+    """
+    변경 내용을 한 줄 요약 문자열로 변환
+
+    Args:
+        feed: 피드 이름
+        changes: diff_snapshot 결과
+
+    Returns:
+        str: 요약 문자열
+    """
+    parts = []
+    if changes["added"]:
+        parts.append(f"추가 {len(changes['added'])}건")
+    if changes["removed"]:
+        parts.append(f"삭제 {len(changes['removed'])}건")
+    if changes["changed"]:
+        parts.append(f"변경 {len(changes['changed'])}건")
+    return f"{feed}: {', '.join(parts)}"
@@ -0,0 +1,171 @@
+"""
+적응형 타임아웃과 요청 헤징
+클라이언트가 기록한 TR 코드별 응답 지연 백분위수로 연결 / 읽기 타임아웃을 정하고,
+조회 요청이 p95를 넘기면 두 번째 요청을 보내 먼저 도착한 응답을 사용합니다(헤징).
+헤징은 예산 안에서만 수행하여 호출량이 두 배로 늘지 않도록 합니다.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .metrics import ClientMetrics
+
+
+class AdaptiveTimeouts:
+    """TR 코드별 (연결, 읽기) 타임아웃 계산"""
+
+    def __init__(
+        self,
+        metrics: ClientMetrics,
+        min_samples: int = 20,
+        connect_multiplier: float = 4.0,
+        read_multiplier: float = 3.0,
+        min_timeout: float = 0.5,
+        max_connect: float = 3.05,
+        max_read: float = 10.0,
+        refresh_interval: float = 1.0
+    ):
+        """
+        Args:
+            metrics: 지연 표본을 가진 ClientMetrics
+            min_samples: 적응형 타임아웃을 적용하기 위한 최소 표본 수 (부족하면 최대값 사용)
+            connect_multiplier: 연결 타임아웃 = p50 × 배율 (연결 수립은 왕복 1~2회 수준)
+            read_multiplier: 읽기 타임아웃 = p99 × 배율
+            min_timeout: 타임아웃 하한 (초)
+            max_connect: 연결 타임아웃 상한 및 기본값 (초)
+            max_read: 읽기 타임아웃 상한 및 기본값 (초)
+            refresh_interval: 백분위수 재계산 주기 (초, 요청마다 정렬하지 않도록 캐시)
+        """
+        self.metrics = metrics
+        self.min_samples = min_samples
+        self.connect_multiplier = connect_multiplier
+        self.read_multiplier = read_multiplier
+        self.min_timeout = min_timeout
+        self.max_connect = max_connect
+        self.max_read = max_read
+        self.refresh_interval = refresh_interval
+
+        # api_id -> (재계산 시각, (연결, 읽기))
+        self._cache: Dict[str, Tuple[float, Tuple[float, float]]] = {}
+
+    def get(self, api_id: str) -> Tuple[float, float]:
+        """
+        TR 코드의 (연결, 읽기) 타임아웃
+
+        Returns:
+            Tuple[float, float]: requests의 timeout 인자로 사용할 값 (초)
+        """
+        now = time.monotonic()
+        cached = self._cache.get(api_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        if self.metrics.sample_count(api_id) < self.min_samples:
+            timeouts = (self.max_connect, self.max_read)
+        else:
+            p50 = self.metrics.latency_percentile(api_id, 50)
+            p99 = self.metrics.latency_percentile(api_id, 99)
+            timeouts = (
+                min(self.max_connect, max(self.min_timeout, p50 * self.connect_multiplier)),
+                min(self.max_read, max(self.min_timeout, p99 * self.read_multiplier)),
+            )
+
+        self._cache[api_id] = (now + self.refresh_interval, timeouts)
+        return timeouts
+
+
+class HedgePolicy:
+    """조회 요청 헤징 정책 (지연 기준 + 예산)"""
+
+    def __init__(
+        self,
+        metrics: ClientMetrics,
+        percentile: float = 95,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.02,
+        max_burst: float = 10.0,
+        refresh_interval: float = 1.0
+    ):
+        """
+        Args:
+            metrics: 지연 표본을 가진 ClientMetrics
+            percentile: 이 백분위수를 넘기면 두 번째 요청 전송
+            budget_ratio: 일반 요청 1건당 적립되는 헤징 예산 (0.05 = 최대 5%)
+            min_samples: 헤징을 시작하기 위한 최소 표본 수
+            min_delay: 최소 헤징 대기 시간 (초)
+            max_burst: 적립 가능한 최대 헤징 예산
+            refresh_interval: 기준 지연 재계산 주기 (초)
+        """
+        self.metrics = metrics
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_burst = max_burst
+        self.refresh_interval = refresh_interval
+
+        self._delays: Dict[str, Tuple[float, Optional[float]]] = {}
+        self._budget = 0.0
+        self._lock = threading.Lock()
+
+        self.primaries = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self.hedges_denied = 0
+
+    def hedge_delay(self, api_id: str) -> Optional[float]:
+        """
+        두 번째 요청까지 기다릴 시간
+
+        Returns:
+            Optional[float]: 대기 시간 (초, 표본이 부족하면 None → 헤징 안 함)
+        """
+        now = time.monotonic()
+        cached = self._delays.get(api_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        delay = None
+        if self.metrics.sample_count(api_id) >= self.min_samples:
+            delay = max(self.min_delay, self.metrics.latency_percentile(api_id, self.percentile))
+
+        self._delays[api_id] = (now + self.refresh_interval, delay)
+        return delay
+
+    def record_primary(self):
+        """일반 요청 전송 기록 (예산 적립)"""
+        with self._lock:
+            self.primaries += 1
+            self._budget = min(self.max_burst, self._budget + self.budget_ratio)
+
+    def try_spend(self) -> bool:
+        """
+        헤징 예산 사용 시도
+
+        Returns:
+            bool: 두 번째 요청을 보내도 되는지 여부
+        """
+        with self._lock:
+            if self._budget >= 1.0:
+                self._budget -= 1.0
+                self.hedges += 1
+                return True
+            self.hedges_denied += 1
+            return False
+
+    def record_win(self):
+        """두 번째 요청이 먼저 도착한 경우 기록"""
+        with self._lock:
+            self.hedges_won += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "primaries": self.primaries,
+                "hedges": self.hedges,
+                "hedges_won": self.hedges_won,
+                "hedges_denied": self.hedges_denied,
+                "hedge_ratio": self.hedges / self.primaries if self.primaries else 0.0,
+            }
@@ -0,0 +1,275 @@
+"""
+차트 과거 데이터 백필
+연속조회 키(cont-yn / next-key)를 따라 페이지 단위로 차트 데이터를 내려받습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+
+class BackfillError(Exception):
+    """백필 중 API 호출 실패"""
+
+    def __init__(self, message: str, outcome: Optional[str] = None):
+        """
+        Args:
+            message: 오류 메시지
+            outcome: 실패 응답의 결과 유형 (return_codes)
+        """
+        super().__init__(message)
+        self.outcome = outcome
+
+
+class BackfillCheckpoint:
+    """종목별 연속조회 키 체크포인트 저장소"""
+
+    def __init__(self, checkpoint_dir: str = "data/backfill"):
+        """
+        Args:
+            checkpoint_dir: 체크포인트 파일 저장 디렉토리
+        """
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.checkpoint_dir / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict]:
+        """
+        체크포인트 읽기
+
+        Args:
+            key: 체크포인트 키 (api_id + 종목코드)
+
+        Returns:
+            Optional[Dict]: 저장된 상태 (없으면 None)
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key: str, state: Dict):
+        """
+        체크포인트 저장 (임시 파일 기록 후 교체하여 중단 시에도 파일이 깨지지 않음)
+
+        Args:
+            key: 체크포인트 키
+            state: 저장할 상태
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+
+    def clear(self, key: str):
+        """체크포인트 삭제"""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ChartBackfill:
+    """연속조회 기반 차트 백필 (페이지 단위 제너레이터)"""
+
+    # TR 코드별 응답 리스트 필드
+    CHART_LIST_KEYS = {
+        "ka10079": "stk_tic_chart_qry",       # 틱차트
+        "ka10080": "stk_min_pole_chart_qry",  # 분봉차트
+        "ka10081": "stk_dt_pole_chart_qry",   # 일봉차트
+        "ka10082": "stk_stk_pole_chart_qry",  # 주봉차트
+        "ka10083": "stk_mth_pole_chart_qry",  # 월봉차트
+        "ka10094": "stk_yr_pole_chart_qry",   # 년봉차트
+    }
+
+    def __init__(
+        self,
+        kiwoom_client,
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        max_pages: Optional[int] = None
+    ):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient 인스턴스
+            checkpoint: 체크포인트 저장소 (None이면 재개 기능 비활성화)
+            max_pages: 종목당 최대 페이지 수 (None이면 끝까지)
+        """
+        self.client = kiwoom_client
+        self.checkpoint = checkpoint
+        self.max_pages = max_pages
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def checkpoint_key(symbol: str, api_id: str) -> str:
+        """체크포인트 키 생성"""
+        return f"{api_id}_{symbol}"
+
+    @staticmethod
+    def _row_date(row: Dict) -> str:
+        """차트 레코드의 일자 (YYYYMMDD, 일/주/월/년봉은 dt, 분/틱봉은 cntr_tm)"""
+        return str(row.get("dt") or row.get("cntr_tm") or "")[:8]
+
+    def iter_pages(
+        self,
+        symbol: str,
+        api_id: str = "ka10081",
+        params: Optional[Dict] = None,
+        resume: bool = True
+    ) -> Iterator[List[Dict]]:
+        """
+        차트 데이터를 페이지 단위로 반환하는 제너레이터
+
+        한 번에 한 페이지만 메모리에 유지하며, 각 페이지를 소비한 뒤
+        다음 연속조회 키를 체크포인트에 기록합니다.
+
+        끝까지 받은 종목은 완료 일자(completed_dt)를 기록해 두고, 이후 다른 날 실행하면
+        오늘부터 완료 일자까지의 새 봉만 받습니다 (완료 일자의 봉은 다시 받으므로 page 처리는 덮어쓰기로 구현).
+        max_pages에 걸려 멈춘 종목은 완료로 기록하지 않고 다음 실행에서 이어받습니다.
+
+        Args:
+            symbol: 종목코드
+            api_id: 차트 TR 코드 (기본값: 일봉 'ka10081')
+            params: 추가 요청 파라미터 (기본값: 오늘 기준 수정주가)
+            resume: 체크포인트에서 이어받기 여부
+
+        Yields:
+            List[Dict]: 페이지의 차트 레코드 목록
+        """
+        list_key = self.CHART_LIST_KEYS.get(api_id)
+        if list_key is None:
+            raise ValueError(f"지원하지 않는 차트 TR 코드입니다: {api_id}")
+
+        key = self.checkpoint_key(symbol, api_id)
+        state = self.checkpoint.load(key) if (self.checkpoint and resume) else None
+        today = datetime.now().strftime("%Y%m%d")
+
+        # 갱신 구간 하한 (이 일자보다 오래된 봉은 이미 받았음, 빈 문자열이면 전체 백필)
+        since = ""
+        if state and state.get("done"):
+            # 이전 버전 체크포인트에는 completed_dt가 없으므로 마지막 기록 일자 사용
+            completed_dt = state.get("completed_dt") or state.get("updated_at", "")[:8]
+            if completed_dt >= today:
+                self.logger.info(f"[{key}] 오늘 이미 완료된 백필입니다.")
+                return
+            since = completed_dt
+            state = None
+        elif state:
+            since = state.get("since", "")
+
+        if state and state.get("next_key"):
+            # 재개 시 기준일자가 바뀌지 않도록 최초 요청 본문을 그대로 사용
+            body = state["body"]
+            cont_yn, next_key = "Y", state["next_key"]
+            pages, rows = state.get("pages", 0), state.get("rows", 0)
+            self.logger.info(f"[{key}] {pages}페이지부터 백필을 재개합니다.")
+        else:
+            body = {
+                "stk_cd": symbol,
+                "base_dt": today,
+                "upd_stkpc_tp": "1",
+            }
+            if params:
+                body.update(params)
+            cont_yn, next_key = "N", ""
+            pages, rows = 0, 0
+            if since:
+                self.logger.info(f"[{key}] {since} 이후 봉을 갱신합니다.")
+
+        run_pages = 0
+        while True:
+            success, result = self.client.call_api(
+                api_id, self.client.CHART_ENDPOINT, body, cont_yn, next_key
+            )
+            if not success:
+                error_msg = result.get('error', result.get('message', '알 수 없는 오류'))
+                raise BackfillError(f"[{key}] 차트 조회 실패: {error_msg}", result.get("outcome"))
+
+            records = result["body"].get(list_key) or []
+            cont_yn = result.get("cont_yn", "N")
+            next_key = result.get("next_key", "")
+            pages += 1
+            run_pages += 1
+
+            # 갱신 중에는 이미 받은 구간(since 이전)에 닿으면 멈춤
+            reached = False
+            if since:
+                fresh = [row for row in records if self._row_date(row) >= since]
+                reached = len(fresh) < len(records)
+                records = fresh
+            rows += len(records)
+
+            if records:
+                yield records
+
+            done = reached or cont_yn != "Y" or not next_key or not records
+            capped = not done and self.max_pages is not None and run_pages >= self.max_pages
+
+            # 페이지 소비가 끝난 뒤에 기록 (중단 시 마지막 페이지는 다시 받음)
+            if self.checkpoint:
+                state = {
+                    "symbol": symbol,
+                    "api_id": api_id,
+                    "body": body,
+                    "next_key": "" if done else next_key,
+                    "pages": pages,
+                    "rows": rows,
+                    "done": done,
+                    "updated_at": datetime.now().strftime("%Y%m%d%H%M%S"),
+                }
+                if done:
+                    state["completed_dt"] = body.get("base_dt", today)
+                elif since:
+                    state["since"] = since
+                self.checkpoint.save(key, state)
+
+            if done:
+                self.logger.info(f"[{key}] 백필 완료 - {pages}페이지, {rows}건")
+                return
+            if capped:
+                self.logger.info(f"[{key}] 최대 페이지 수({self.max_pages})에 도달해 중단합니다. 다음 실행에서 이어받습니다.")
+                return
+
+    async def aiter_pages(
+        self,
+        symbol: str,
+        api_id: str = "ka10081",
+        params: Optional[Dict] = None,
+        resume: bool = True
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        iter_pages의 비동기 버전 (HTTP 호출은 실행기 스레드에서 수행)
+
+        Args:
+            symbol: 종목코드
+            api_id: 차트 TR 코드
+            params: 추가 요청 파라미터
+            resume: 체크포인트에서 이어받기 여부
+
+        Yields:
+            List[Dict]: 페이지의 차트 레코드 목록
+        """
+        loop = asyncio.get_running_loop()
+        pages = self.iter_pages(symbol, api_id, params, resume)
+        sentinel = object()
+
+        while True:
+            page = await loop.run_in_executor(None, next, pages, sentinel)
+            if page is sentinel:
+                return
+            yield page
@@ -0,0 +1,349 @@
+"""
+다종목 병렬 백필 스케줄러
+여러 종목의 백필 작업을 작업자 스레드에 분배합니다.
+호출 속도는 클라이언트의 공용 호출 제한기로 제어됩니다.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .backfill import BackfillError, ChartBackfill
+from .return_codes import INVALID
+
+
+class BackfillProgress:
+    """백필 진행 상황 (스레드 안전)"""
+
+    def __init__(self, total: int = 0):
+        self._lock = threading.Lock()
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.retrying = 0
+        self.pages = 0
+        self.rows = 0
+        self.started_at = time.monotonic()
+        self.failed_symbols: List[str] = []
+
+    def add_page(self, rows: int):
+        with self._lock:
+            self.pages += 1
+            self.rows += rows
+
+    def mark_completed(self):
+        with self._lock:
+            self.completed += 1
+
+    def mark_retry(self):
+        with self._lock:
+            self.retrying += 1
+
+    def mark_retry_done(self):
+        with self._lock:
+            self.retrying -= 1
+
+    def mark_failed(self, symbol: str):
+        with self._lock:
+            self.failed += 1
+            self.failed_symbols.append(symbol)
+
+    def snapshot(self) -> Dict:
+        """
+        현재 진행 상황 반환
+
+        Returns:
+            Dict: 진행률, 처리량, 예상 남은 시간(초) 등
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self.started_at
+            finished = self.completed + self.failed
+            remaining = self.total - finished
+
+            # 완료 종목 기준 평균 처리 시간으로 남은 시간 추정
+            eta = None
+            if finished > 0 and remaining > 0:
+                eta = elapsed / finished * remaining
+            elif remaining == 0:
+                eta = 0.0
+
+            return {
+                "total": self.total,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retrying": self.retrying,
+                "remaining": remaining,
+                "pages": self.pages,
+                "rows": self.rows,
+                "elapsed": elapsed,
+                "percent": (finished / self.total * 100) if self.total else 100.0,
+                "eta": eta,
+                "failed_symbols": list(self.failed_symbols),
+            }
+
+
+class BackfillScheduler:
+    """다종목 백필 스케줄러"""
+
+    def __init__(
+        self,
+        backfill: ChartBackfill,
+        workers: int = 4,
+        max_retries: int = 3,
+        retry_delay: float = 5.0,
+        page_handler: Optional[Callable[[str, List[Dict]], None]] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None
+    ):
+        """
+        Args:
+            backfill: ChartBackfill 인스턴스 (체크포인트 공유)
+            workers: 작업자 스레드 수
+            max_retries: 실패 종목 재시도 횟수
+            retry_delay: 재시도 기본 대기 시간 (초, 시도마다 배로 증가)
+            page_handler: 페이지 처리 함수 (종목코드, 레코드 목록) - 작업자 스레드에서 호출됨
+            progress_callback: 진행 상황 콜백 (작업자 스레드에서 호출됨)
+        """
+        self.backfill = backfill
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.page_handler = page_handler
+        self.progress_callback = progress_callback
+        self.logger = logging.getLogger(__name__)
+
+        self.progress = BackfillProgress()
+
+        # (실행 가능 시각, 우선순위, 순번, 종목코드, 시도 횟수)
+        self._queue: List = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._outstanding = 0
+        # start()마다 증가하며, 중단된 실행의 작업자가 끝내는 작업은 세지 않음
+        self._generation = 0
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def _staleness(self, symbol: str, api_id: str) -> str:
+        """
+        우선순위 키 (작을수록 먼저 처리)
+        한 번도 받지 않은 종목 → 오래 전에 갱신된 종목 순
+        """
+        checkpoint = self.backfill.checkpoint
+        if checkpoint is None:
+            return ""
+
+        state = checkpoint.load(ChartBackfill.checkpoint_key(symbol, api_id))
+        if state is None:
+            return ""
+        return state.get("updated_at", "")
+
+    def start(
+        self,
+        symbols: Iterable[str],
+        api_id: str = "ka10081",
+        params: Optional[Dict] = None
+    ):
+        """
+        백필 시작 (즉시 반환)
+
+        종목별 체크포인트를 읽어 우선순위를 정하는 작업도 백그라운드 스레드에서 수행하므로
+        GUI 스레드에서 호출해도 종목 수만큼 파일을 읽느라 멈추지 않습니다.
+
+        Args:
+            symbols: 종목코드 목록
+            api_id: 차트 TR 코드
+            params: 추가 요청 파라미터
+        """
+        self.api_id = api_id
+        self.params = params
+
+        symbols = list(dict.fromkeys(symbols))
+        self.progress = BackfillProgress(total=len(symbols))
+
+        # 이전 실행의 작업자는 자기 중단 이벤트를 보고 끝나도록 실행마다 새 이벤트 사용
+        stop = threading.Event()
+        with self._cond:
+            self._generation += 1
+            generation = self._generation
+            self._queue.clear()
+            self._outstanding = len(symbols)
+            self._stop = stop
+
+        self.logger.info(f"백필 시작 - {len(symbols)}종목, 작업자 {self.workers}개")
+
+        self._threads = [threading.Thread(
+            target=self._enqueue, args=(symbols, api_id, generation, stop), name="backfill-loader", daemon=True
+        )]
+        self._threads += [
+            threading.Thread(target=self._worker, args=(generation, stop), name=f"backfill-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _enqueue(self, symbols: List[str], api_id: str, generation: int, stop: threading.Event):
+        """체크포인트 기준 우선순위를 계산해 작업 큐에 넣기 (백그라운드 스레드)"""
+        jobs = []
+        for symbol in symbols:
+            if stop.is_set():
+                return
+            jobs.append((0.0, self._staleness(symbol, api_id), next(self._counter), symbol, 0))
+
+        with self._cond:
+            if generation != self._generation:
+                return
+            for job in jobs:
+                heapq.heappush(self._queue, job)
+            self._cond.notify_all()
+
+    def run(
+        self,
+        symbols: Iterable[str],
+        api_id: str = "ka10081",
+        params: Optional[Dict] = None
+    ) -> Dict:
+        """
+        백필 실행 후 완료까지 대기
+
+        Returns:
+            Dict: 최종 진행 상황
+        """
+        self.start(symbols, api_id, params)
+        self.join()
+        return self.progress.snapshot()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        모든 작업 완료까지 대기
+
+        Returns:
+            bool: 완료 여부 (timeout 초과 시 False)
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._outstanding == 0, timeout)
+
+    def stop(self):
+        """백필 중단 (진행 중인 페이지까지만 처리, 체크포인트로 재개 가능)"""
+        with self._cond:
+            self._stop.set()
+            # 진행 중이던 작업이 나중에 끝나도 다음 실행의 남은 작업 수를 건드리지 않도록 세대 변경
+            self._generation += 1
+            self._queue.clear()
+            self._outstanding = 0
+            self._cond.notify_all()
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def _next_job(self, stop: threading.Event):
+        """실행 가능한 다음 작업 꺼내기 (없으면 None)"""
+        with self._cond:
+            while not stop.is_set():
+                if self._outstanding == 0:
+                    return None
+                if self._queue:
+                    wait = self._queue[0][0] - time.monotonic()
+                    if wait <= 0:
+                        return heapq.heappop(self._queue)
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+            return None
+
+    def _finish_job(self, generation: int):
+        with self._cond:
+            if generation != self._generation:
+                return
+            self._outstanding -= 1
+            self._cond.notify_all()
+
+    def _notify(self, progress: BackfillProgress):
+        if self.progress_callback:
+            try:
+                self.progress_callback(progress.snapshot())
+            except Exception:
+                self.logger.exception("진행 상황 콜백 오류")
+
+    def _worker(self, generation: int, stop: threading.Event):
+        """작업자 스레드"""
+        # 다음 실행이 시작돼도 이 실행의 진행 상황에만 기록
+        progress = self.progress
+        while True:
+            job = self._next_job(stop)
+            if job is None:
+                return
+
+            _, priority, _, symbol, attempt = job
+            if attempt > 0:
+                progress.mark_retry_done()
+
+            try:
+                for page in self.backfill.iter_pages(symbol, self.api_id, self.params):
+                    if self.page_handler:
+                        self.page_handler(symbol, page)
+                    progress.add_page(len(page))
+                    self._notify(progress)
+
+                    if stop.is_set():
+                        return
+
+                progress.mark_completed()
+                self._finish_job(generation)
+
+            except Exception as e:
+                if isinstance(e, BackfillError):
+                    self.logger.warning(str(e))
+                else:
+                    self.logger.exception(f"[{symbol}] 백필 중 예외 발생")
+
+                # 잘못된 요청(종목코드, 입력 값 등)은 다시 보내도 같으므로 재시도하지 않음
+                retryable = not (isinstance(e, BackfillError) and e.outcome == INVALID)
+                if retryable and attempt < self.max_retries and not stop.is_set():
+                    # 체크포인트가 있으므로 재시도는 실패한 페이지부터 이어받음
+                    delay = self.retry_delay * (2 ** attempt)
+                    self.logger.info(f"[{symbol}] {delay:.0f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                    progress.mark_retry()
+                    with self._cond:
+                        if generation == self._generation:
+                            heapq.heappush(
+                                self._queue,
+                                (time.monotonic() + delay, priority, next(self._counter), symbol, attempt + 1)
+                            )
+                            self._cond.notify()
+                else:
+                    reason = "재시도 횟수 초과" if retryable else "잘못된 요청"
+                    self.logger.error(f"[{symbol}] 백필 실패 - {reason}")
+                    progress.mark_failed(symbol)
+                    self._finish_job(generation)
+
+            self._notify(progress)
+
+
+def format_progress(snapshot: Dict) -> str:
+    """
+    진행 상황을 한 줄 문자열로 변환
+
+    Args:
+        snapshot: BackfillProgress.snapshot() 결과
+
+    Returns:
+        str: 표시용 문자열
+    """
+    eta = snapshot.get("eta")
+    if eta is None:
+        eta_text = "계산 중"
+    else:
+        minutes, seconds = divmod(int(eta), 60)
+        hours, minutes = divmod(minutes, 60)
+        eta_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    return (
+        f"{snapshot['percent']:5.1f}% "
+        f"({snapshot['completed']}/{snapshot['total']} 완료, "
+        f"실패 {snapshot['failed']}, 재시도 대기 {snapshot['retrying']}) "
+        f"| {snapshot['rows']:,}건 | 남은 시간 {eta_text}"
+    )
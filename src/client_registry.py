@@ -0,0 +1,103 @@
+"""
+환경별 클라이언트 레지스트리
+모의투자 / 운영 환경의 클라이언트를 각각 독립적으로(토큰, 커넥션 풀, 호출 제한기) 유지합니다.
+환경 전환은 활성 클라이언트 참조만 바꾸므로 토큰을 다시 발급받지 않습니다.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List
+
+
+class ClientRegistry:
+    """환경별 KiwoomAPIClient 레지스트리"""
+
+    ENVIRONMENTS = ("mock", "production")
+
+    def __init__(self, factory: Callable[[str], object], active: str = "mock"):
+        """
+        Args:
+            factory: 환경 이름을 받아 KiwoomAPIClient를 생성하는 함수
+            active: 초기 활성 환경
+        """
+        self._validate(active)
+        self.factory = factory
+        self._clients: Dict[str, object] = {}
+        self._active = active
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[str, object], None]] = []
+        self.logger = logging.getLogger(__name__)
+
+    def _validate(self, environment: str):
+        if environment not in self.ENVIRONMENTS:
+            raise ValueError(f"알 수 없는 환경입니다: {environment}")
+
+    def get(self, environment: str):
+        """
+        환경별 클라이언트 가져오기 (처음 요청 시 생성)
+
+        Args:
+            environment: 'mock' 또는 'production'
+
+        Returns:
+            KiwoomAPIClient: 해당 환경의 클라이언트
+        """
+        self._validate(environment)
+        client = self._clients.get(environment)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(environment)
+                if client is None:
+                    client = self._clients[environment] = self.factory(environment)
+                    self.logger.info(f"'{environment}' 환경 클라이언트 생성")
+        return client
+
+    @property
+    def active(self):
+        """현재 활성 환경의 클라이언트"""
+        return self.get(self._active)
+
+    @property
+    def active_environment(self) -> str:
+        return self._active
+
+    def switch(self, environment: str):
+        """
+        활성 환경 전환 (클라이언트와 토큰은 그대로 유지)
+
+        Args:
+            environment: 전환할 환경
+
+        Returns:
+            KiwoomAPIClient: 새 활성 클라이언트
+        """
+        client = self.get(environment)
+        if environment == self._active:
+            return client
+
+        self._active = environment
+        self.logger.info(f"활성 환경 전환: {environment}")
+
+        for listener in list(self._listeners):
+            try:
+                listener(environment, client)
+            except Exception:
+                self.logger.exception("환경 전환 리스너 오류")
+        return client
+
+    def add_listener(self, callback: Callable[[str, object], None]):
+        """환경 전환 리스너 등록 (callback(환경, 클라이언트))"""
+        self._listeners.append(callback)
+
+    def clients(self) -> Dict[str, object]:
+        """생성된 모든 클라이언트 (섀도 트레이딩 등 동시 사용)"""
+        with self._lock:
+            return dict(self._clients)
+
+    def close(self):
+        """생성된 모든 클라이언트의 백그라운드 작업 종료 (프로그램 종료 시)"""
+        for environment, client in self.clients().items():
+            try:
+                client.close()
+            except Exception:
+                self.logger.exception(f"'{environment}' 환경 클라이언트 종료 오류")
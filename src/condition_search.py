@@ -0,0 +1,384 @@
+"""
+조건검색 실시간 추적
+조건식별 편입 종목을 집합으로 유지하고, 실시간 편입(I) / 이탈(D) 신호를 증분 반영하여
+새로 편입되거나 이탈한 종목만 이벤트 버스로 발행합니다.
+
+조건식마다 아직 발행하지 않은 변경을 종목 단위로 합쳐 두고(편입 후 이탈은 상쇄) flush_interval마다 한 번씩 발행합니다.
+대기 중인 변경이 max_pending을 넘으면 개별 변경 대신 전체 편입 목록(resync)을 한 번 발행하므로
+신호가 많은 조건식이 구독자를 넘치게 하지 못합니다.
+
+실시간 수신(ConditionSearchFeed)은 웹소켓을 사용하며 websocket-client 패키지가 필요합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from .event_bus import (
+    CONDITION_CHANGED, TOKEN_EXPIRED, TOKEN_ISSUED, TOKEN_REFRESHED, TOKEN_REVOKED, ThreadDispatcher
+)
+
+# 편입 / 이탈 구분 (실시간 843 필드)
+INSERT = "I"
+DELETE = "D"
+
+
+def _normalize_symbol(code: str) -> str:
+    """'A005930' → '005930'"""
+    return code[1:] if code[:1] == "A" else code
+
+
+class _ConditionState:
+    """조건식 하나의 편입 목록과 미발행 변경"""
+
+    __slots__ = ('members', 'pending', 'overflowed', 'name')
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.members: Set[str] = set()
+        # 종목 → INSERT / DELETE (마지막 발행 이후 실제로 바뀐 것만)
+        self.pending: Dict[str, str] = {}
+        self.overflowed = False
+
+
+class ConditionTracker:
+    """조건식별 편입 종목 집합 추적"""
+
+    def __init__(
+        self,
+        event_bus,
+        source: str = "",
+        max_pending: int = 500,
+        flush_interval: float = 0.2
+    ):
+        """
+        Args:
+            event_bus: 변경을 발행할 EventBus
+            source: 이벤트 발행자 (클라이언트 환경)
+            max_pending: 조건식별 미발행 변경 상한 (넘으면 전체 목록으로 재동기화)
+            flush_interval: 변경 발행 주기 (초)
+        """
+        self.events = event_bus
+        self.source = source
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._conditions: Dict[str, _ConditionState] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _state(self, condition: str) -> _ConditionState:
+        state = self._conditions.get(condition)
+        if state is None:
+            state = self._conditions[condition] = _ConditionState()
+        return state
+
+    def _mark(self, state: _ConditionState, symbol: str, action: str):
+        """미발행 변경 기록 (반대 변경이 대기 중이면 상쇄)"""
+        if state.overflowed:
+            return
+        if state.pending.get(symbol) not in (None, action):
+            del state.pending[symbol]
+            return
+        state.pending[symbol] = action
+        if len(state.pending) > self.max_pending:
+            state.pending.clear()
+            state.overflowed = True
+
+    def set_name(self, condition: str, name: str):
+        """조건식 이름 등록 (이벤트에 함께 전달)"""
+        with self._lock:
+            self._state(condition).name = name
+
+    def load(self, condition: str, symbols: Iterable[str]):
+        """
+        조건검색 결과 전체 목록 반영 (최초 조회 / 재접속 시, 기존 집합과 비교하여 차이만 발행)
+
+        Args:
+            condition: 조건식 번호
+            symbols: 현재 편입 종목
+        """
+        members = {_normalize_symbol(s) for s in symbols}
+        with self._lock:
+            state = self._state(condition)
+            for symbol in members - state.members:
+                self._mark(state, symbol, INSERT)
+            for symbol in state.members - members:
+                self._mark(state, symbol, DELETE)
+            state.members = members
+
+    def apply(self, condition: str, symbol: str, action: str) -> bool:
+        """
+        실시간 편입 / 이탈 신호 반영
+
+        Args:
+            condition: 조건식 번호
+            symbol: 종목코드
+            action: INSERT('I') 또는 DELETE('D')
+
+        Returns:
+            bool: 편입 목록이 바뀌었는지 여부 (중복 신호는 False)
+        """
+        symbol = _normalize_symbol(symbol)
+        with self._lock:
+            state = self._state(condition)
+            if action == INSERT:
+                if symbol in state.members:
+                    return False
+                state.members.add(symbol)
+            elif action == DELETE:
+                if symbol not in state.members:
+                    return False
+                state.members.discard(symbol)
+            else:
+                return False
+            self._mark(state, symbol, action)
+            return True
+
+    def remove(self, condition: str):
+        """조건식 추적 중단"""
+        with self._lock:
+            self._conditions.pop(condition, None)
+
+    def members(self, condition: str) -> FrozenSet[str]:
+        """조건식의 현재 편입 종목"""
+        with self._lock:
+            state = self._conditions.get(condition)
+            return frozenset(state.members) if state else frozenset()
+
+    def conditions(self) -> List[str]:
+        with self._lock:
+            return list(self._conditions)
+
+    def flush(self) -> int:
+        """
+        미발행 변경을 조건식별로 한 번씩 발행
+
+        이벤트 데이터: condition, name, entered, exited, resync, count
+        (resync이면 entered는 전체 편입 목록, exited는 빈 목록)
+
+        Returns:
+            int: 발행한 이벤트 수
+        """
+        batches = []
+        with self._lock:
+            for condition, state in self._conditions.items():
+                if state.overflowed:
+                    batches.append((condition, state.name, sorted(state.members), [], True, len(state.members)))
+                    state.overflowed = False
+                elif state.pending:
+                    entered = sorted(s for s, action in state.pending.items() if action == INSERT)
+                    exited = sorted(s for s, action in state.pending.items() if action == DELETE)
+                    batches.append((condition, state.name, entered, exited, False, len(state.members)))
+                    state.pending.clear()
+
+        for condition, name, entered, exited, resync, count in batches:
+            self.events.publish(
+                CONDITION_CHANGED, self.source, condition=condition, name=name,
+                entered=entered, exited=exited, resync=resync, count=count
+            )
+        return len(batches)
+
+    def start(self):
+        """주기적 발행 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="condition-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """발행 스레드 종료 (남은 변경은 발행)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                self.logger.exception("조건검색 변경 발행 오류")
+
+
+class ConditionSearchFeed:
+    """
+    조건검색 실시간 수신 (웹소켓)
+
+    토큰이 발급 / 갱신되면 접속하여 로그인 후 등록된 조건식을 실시간 조회(CNSRREQ, search_type=1)하고,
+    토큰이 만료 / 폐기되면 접속을 끊습니다. 토큰 이벤트는 전용 스레드에서 처리하므로 재접속 대기가
+    토큰을 발급한 스레드(GUI 등)를 막지 않습니다. 연결이 끊기면 지수 백오프로 재접속하며,
+    재접속 시 받은 전체 목록은 ConditionTracker.load로 기존 집합과 비교됩니다.
+    """
+
+    SOCKET_PATH = ":10000/api/dostk/websocket"
+
+    def __init__(
+        self,
+        kiwoom_client,
+        tracker: ConditionTracker,
+        conditions: Iterable[str] = (),
+        exchange: str = "K",
+        max_backoff: float = 60.0
+    ):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient 인스턴스 (토큰 및 이벤트 버스)
+            tracker: 변경을 반영할 ConditionTracker
+            conditions: 실시간 조회할 조건식 번호 (비어 있으면 조건식 목록 전체)
+            exchange: 거래소 구분 (K: KRX)
+            max_backoff: 재접속 최대 대기 (초)
+
+        Raises:
+            ImportError: websocket-client가 설치되지 않은 경우
+        """
+        import websocket
+
+        self._websocket = websocket
+        self.client = kiwoom_client
+        self.tracker = tracker
+        self.conditions = list(conditions)
+        self.exchange = exchange
+        self.max_backoff = max_backoff
+        self.url = kiwoom_client.base_url.replace("https://", "wss://") + self.SOCKET_PATH
+        self.logger = logging.getLogger(__name__)
+
+        self._ws = None
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._connected = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # 접속 종료는 수신 스레드 종료를 최대 5초 기다리므로 발행 스레드가 아닌 전용 스레드에서 처리
+        self._dispatcher = ThreadDispatcher(name="condition-feed-events")
+        self._subscriptions = [
+            kiwoom_client.events.subscribe(topic, self._on_token_event, self._dispatcher)
+            for topic in (TOKEN_ISSUED, TOKEN_REFRESHED, TOKEN_EXPIRED, TOKEN_REVOKED)
+        ]
+
+    def _on_token_event(self, event):
+        if event.source != self.client.environment:
+            return
+        if event.topic in (TOKEN_ISSUED, TOKEN_REFRESHED):
+            # 새 토큰으로 다시 로그인
+            self.disconnect()
+            self.start()
+        else:
+            self.disconnect()
+
+    def start(self):
+        """수신 스레드 시작 (토큰이 없으면 발급 이벤트를 기다림)"""
+        if not self.client.access_token or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="condition-feed", daemon=True)
+        self._thread.start()
+
+    def disconnect(self):
+        """접속 종료 (재접속하지 않음)"""
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+    def close(self):
+        """수신 종료 및 토큰 이벤트 구독 해제"""
+        for subscription in self._subscriptions:
+            self.client.events.unsubscribe(subscription)
+        self._dispatcher.stop()
+        self.disconnect()
+        self.tracker.stop()
+
+    def _send(self, message: Dict):
+        with self._send_lock:
+            self._ws.send(json.dumps(message))
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._session()
+            except Exception as e:
+                if not self._stop.is_set():
+                    self.logger.warning(f"조건검색 웹소켓 연결 끊김: {e}")
+            finally:
+                self._connected.clear()
+                self._ws = None
+
+            # 오래 유지된 연결이었다면 백오프 초기화
+            if time.monotonic() - started > self.max_backoff:
+                backoff = 1.0
+            if self._stop.wait(backoff):
+                return
+            backoff = min(self.max_backoff, backoff * 2)
+
+    def _session(self):
+        """접속 → 로그인 → 조건식 실시간 등록 → 수신 루프"""
+        self._ws = self._websocket.create_connection(self.url, timeout=30)
+        self._send({"trnm": "LOGIN", "token": self.client.access_token})
+
+        while not self._stop.is_set():
+            raw = self._ws.recv()
+            if not raw:
+                return
+            message = json.loads(raw)
+            trnm = message.get("trnm")
+
+            if trnm == "PING":
+                # 서버 keep-alive: 받은 메시지를 그대로 돌려보냄
+                with self._send_lock:
+                    self._ws.send(raw)
+            elif trnm == "LOGIN":
+                if message.get("return_code") != 0:
+                    raise ConnectionError(f"웹소켓 로그인 실패: {message.get('return_msg')}")
+                self._connected.set()
+                self._send({"trnm": "CNSRLST"})
+            elif trnm == "CNSRLST":
+                self._on_condition_list(message.get("data") or [])
+            elif trnm == "CNSRREQ":
+                self._on_search_result(message)
+            elif trnm == "REAL":
+                self._on_real(message.get("data") or [])
+
+    def _on_condition_list(self, rows: List):
+        """조건식 목록 수신 ([[번호, 이름], ...]) 후 실시간 조회 요청"""
+        names = {str(row[0]): row[1] for row in rows if len(row) >= 2}
+        targets = self.conditions or list(names)
+        for condition in targets:
+            if condition not in names:
+                self.logger.warning(f"조건식 {condition}이(가) 목록에 없습니다.")
+                continue
+            self.tracker.set_name(condition, names[condition])
+            self._send({
+                "trnm": "CNSRREQ", "seq": condition, "search_type": "1", "stex_tp": self.exchange
+            })
+
+    def _on_search_result(self, message: Dict):
+        if message.get("return_code") != 0:
+            self.logger.warning(f"조건검색 {message.get('seq')} 실패: {message.get('return_msg')}")
+            return
+        symbols = [
+            item.get("jmcode") or item.get("9001", "")
+            for item in message.get("data") or []
+        ]
+        self.tracker.load(str(message.get("seq")), [s for s in symbols if s])
+
+    def _on_real(self, items: List):
+        """실시간 편입 / 이탈 (841: 조건식 번호, 9001: 종목코드, 843: I / D)"""
+        for item in items:
+            values = item.get("values") or {}
+            condition = values.get("841")
+            symbol = values.get("9001") or item.get("item", "")
+            action = values.get("843")
+            if condition and symbol and action:
+                self.tracker.apply(str(condition), symbol, action)
@@ -6,7 +6,7 @@ config.ini 및 .env 파일을 관리합니다.
 import os
 import configparser
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
 
@@ -41,14 +41,78 @@ class ConfigManager:
             'production_domain': 'https://api.kiwoom.com',
             'mock_domain': 'https://mockapi.kiwoom.com',
             'appkey': 'YOUR_APP_KEY',
-            'secretkey': 'YOUR_SECRET_KEY'
+            'secretkey': 'YOUR_SECRET_KEY',
+            'rate_limit': '5',
+            'json_codec': 'auto'
         }
 
         self.config['LOGGING'] = {
             'log_level': 'INFO',
             'log_file': 'logs/kiwoom_api.log',
             'max_log_size': '10',
-            'backup_count': '5'
+            'backup_count': '5',
+            'rotate_when': 'midnight',
+            'max_total_size': '200',
+            'compression': 'gzip'
+        }
+
+        self.config['BACKFILL'] = {
+            'checkpoint_dir': 'data/backfill',
+            'workers': '4',
+            'max_retries': '3'
+        }
+
+        self.config['CACHE'] = {
+            'enabled': 'true',
+            'max_memory_mb': '32',
+            'disk_path': 'data/cache/response_cache.db',
+            'ttls': ''
+        }
+
+        self.config['POLLING'] = {
+            'enabled': 'false',
+            'min_interval': '2',
+            'max_interval': '30',
+            'off_hours_interval': '300',
+            'market_open': '0830',
+            'market_close': '1800'
+        }
+
+        self.config['CONDITION'] = {
+            'enabled': 'false',
+            'conditions': '',
+            'max_pending': '500',
+            'flush_interval': '0.2'
+        }
+
+        self.config['PORTFOLIO'] = {
+            'reconcile_interval': '60'
+        }
+
+        self.config['QUOTES'] = {
+            'watchlist': '',
+            'poll_interval': '1',
+            'fps': '10'
+        }
+
+        self.config['PROFILING'] = {
+            'cpu': 'none',
+            'memory': 'false',
+            'duration': '0',
+            'sample_interval': '5',
+            'memory_frames': '10',
+            'top': '30'
+        }
+
+        self.config['CONNECTION'] = {
+            'http_version': 'http1',
+            'pool_size': '10',
+            'warm_connections': '4',
+            'keepalive_interval': '60',
+            'dns_ttl': '300',
+            'hedging': 'false',
+            'hedge_percentile': '95',
+            'hedge_budget': '0.05'
         }
 
         self.save_config()
@@ -80,6 +144,14 @@ class ConfigManager:
         # config.ini에서 확인
         return self.config.get(section, key, fallback=fallback)
 
+    def get_float(self, section: str, key: str, fallback: float = 0.0) -> float:
+        """실수형 설정 값 가져오기"""
+        value = self.get(section, key, str(fallback))
+        try:
+            return float(value)
+        except ValueError:
+            return fallback
+
     def get_int(self, section: str, key: str, fallback: int = 0) -> int:
         """정수형 설정 값 가져오기"""
         value = self.get(section, key, str(fallback))
@@ -104,14 +176,40 @@ class ConfigManager:
         """환경 가져오기"""
         return self.get('KIWOOM', 'environment', 'mock')
 
-    def get_appkey(self) -> str:
-        """App Key 가져오기"""
+    def get_appkey(self, environment: Optional[str] = None) -> str:
+        """
+        App Key 가져오기
+
+        Args:
+            environment: 환경 이름 ('{environment}_appkey'가 있으면 우선 사용)
+        """
+        if environment:
+            value = self.get('KIWOOM', f'{environment}_appkey', '')
+            if value:
+                return value
         return self.get('KIWOOM', 'appkey', '')
 
-    def get_secretkey(self) -> str:
-        """Secret Key 가져오기"""
+    def get_secretkey(self, environment: Optional[str] = None) -> str:
+        """
+        Secret Key 가져오기
+
+        Args:
+            environment: 환경 이름 ('{environment}_secretkey'가 있으면 우선 사용)
+        """
+        if environment:
+            value = self.get('KIWOOM', f'{environment}_secretkey', '')
+            if value:
+                return value
         return self.get('KIWOOM', 'secretkey', '')
 
+    def get_rate_limit(self) -> float:
+        """초당 API 호출 제한 가져오기"""
+        return self.get_float('KIWOOM', 'rate_limit', 5.0)
+
+    def get_json_codec(self) -> str:
+        """JSON 코덱 이름 가져오기 (auto, orjson, ujson, json)"""
+        return self.get('KIWOOM', 'json_codec', 'auto')
+
     # Logging 관련 설정
     def get_log_level(self) -> str:
         """로그 레벨 가져오기"""
@@ -129,3 +227,154 @@ class ConfigManager:
     def get_backup_count(self) -> int:
         """로그 백업 개수 가져오기"""
         return self.get_int('LOGGING', 'backup_count', 5)
+
+    def get_log_rotation(self) -> Dict:
+        """로그 시각 기준 회전 / 백업 합계 크기 / 압축 방식 가져오기"""
+        return {
+            'when': self.get('LOGGING', 'rotate_when', 'midnight'),
+            'max_total_bytes': self.get_int('LOGGING', 'max_total_size', 200) * 1024 * 1024,
+            'compression': self.get('LOGGING', 'compression', 'gzip'),
+        }
+
+    # Backfill 관련 설정
+    def get_backfill_checkpoint_dir(self) -> str:
+        """백필 체크포인트 디렉토리 가져오기"""
+        return self.get('BACKFILL', 'checkpoint_dir', 'data/backfill')
+
+    def get_backfill_workers(self) -> int:
+        """백필 작업자 수 가져오기"""
+        return self.get_int('BACKFILL', 'workers', 4)
+
+    def get_backfill_max_retries(self) -> int:
+        """백필 실패 종목 재시도 횟수 가져오기"""
+        return self.get_int('BACKFILL', 'max_retries', 3)
+
+    # Cache 관련 설정
+    def get_cache_enabled(self) -> bool:
+        """응답 캐시 사용 여부 가져오기"""
+        return self.get_bool('CACHE', 'enabled', True)
+
+    def get_cache_max_memory(self) -> int:
+        """응답 캐시 메모리 상한 가져오기 (바이트)"""
+        size_mb = self.get_int('CACHE', 'max_memory_mb', 32)
+        return size_mb * 1024 * 1024
+
+    def get_cache_disk_path(self) -> Optional[str]:
+        """응답 캐시 디스크 파일 경로 가져오기 (비어 있으면 None)"""
+        return self.get('CACHE', 'disk_path', '') or None
+
+    def get_cache_ttls(self) -> Dict[str, int]:
+        """
+        TR 코드별 캐시 TTL 가져오기
+
+        형식: 'ka10099:86400, ka10101:3600'
+
+        Returns:
+            Dict[str, int]: TR 코드별 TTL (초)
+        """
+        ttls = {}
+        for item in self.get('CACHE', 'ttls', '').split(','):
+            api_id, _, ttl = item.strip().partition(':')
+            if api_id and ttl.strip().isdigit():
+                ttls[api_id.strip()] = int(ttl)
+        return ttls
+
+    # Polling 관련 설정
+    def get_polling_enabled(self) -> bool:
+        """계좌 상태 자동 폴링 사용 여부 가져오기"""
+        return self.get_bool('POLLING', 'enabled', False)
+
+    def get_polling_intervals(self) -> Dict[str, float]:
+        """계좌 폴링 주기 가져오기 (초)"""
+        return {
+            'min_interval': self.get_float('POLLING', 'min_interval', 2.0),
+            'max_interval': self.get_float('POLLING', 'max_interval', 30.0),
+            'off_hours_interval': self.get_float('POLLING', 'off_hours_interval', 300.0),
+        }
+
+    def get_polling_session(self) -> Dict[str, int]:
+        """계좌 폴링 장 시간 가져오기 (HHMM, 이 구간 밖에서는 off_hours_interval 주기)"""
+        return {
+            'market_open': self.get_int('POLLING', 'market_open', 830),
+            'market_close': self.get_int('POLLING', 'market_close', 1800),
+        }
+
+    # Condition 관련 설정
+    def get_condition_enabled(self) -> bool:
+        """조건검색 실시간 추적 사용 여부 가져오기"""
+        return self.get_bool('CONDITION', 'enabled', False)
+
+    def get_condition_list(self) -> List[str]:
+        """실시간 조회할 조건식 번호 목록 가져오기 (비어 있으면 전체)"""
+        value = self.get('CONDITION', 'conditions', '')
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    def get_condition_limits(self) -> Dict[str, float]:
+        """조건식별 미발행 변경 상한 / 발행 주기 가져오기"""
+        return {
+            'max_pending': self.get_int('CONDITION', 'max_pending', 500),
+            'flush_interval': self.get_float('CONDITION', 'flush_interval', 0.2),
+        }
+
+    # Portfolio 관련 설정
+    def get_reconcile_interval(self) -> float:
+        """포트폴리오 잔고 대사 주기 가져오기 (초, 계좌 폴링을 사용하지 않을 때)"""
+        return self.get_float('PORTFOLIO', 'reconcile_interval', 60.0)
+
+    # Quotes 관련 설정
+    def get_watchlist(self) -> List[str]:
+        """관심종목 시세판 종목코드 목록 가져오기"""
+        value = self.get('QUOTES', 'watchlist', '')
+        return [item.strip() for item in value.replace(' ', ',').split(',') if item.strip()]
+
+    def get_quote_settings(self) -> Dict[str, float]:
+        """관심종목 시세 조회 주기 / 화면 갱신 프레임 수 가져오기"""
+        return {
+            'poll_interval': self.get_float('QUOTES', 'poll_interval', 1.0),
+            'fps': self.get_int('QUOTES', 'fps', 10),
+        }
+
+    # Profiling 관련 설정
+    def get_profiling_settings(self) -> Dict:
+        """프로파일러 설정 가져오기 (CPU 방식, 메모리 추적, 기록 구간, 표본 주기, 보고서 항목 수)"""
+        return {
+            'cpu': self.get('PROFILING', 'cpu', 'none'),
+            'memory': self.get_bool('PROFILING', 'memory', False),
+            'duration': self.get_float('PROFILING', 'duration', 0.0),
+            'sample_interval': self.get_float('PROFILING', 'sample_interval', 5.0) / 1000,
+            'memory_frames': self.get_int('PROFILING', 'memory_frames', 10),
+            'top': self.get_int('PROFILING', 'top', 30),
+        }
+
+    # Connection 관련 설정
+    def get_http_version(self) -> str:
+        """HTTP 전송 프로토콜 가져오기 ('http1', 'http2', 'auto')"""
+        return self.get('CONNECTION', 'http_version', 'http1')
+
+    def get_pool_size(self) -> int:
+        """호스트당 커넥션 풀 크기 가져오기"""
+        return self.get_int('CONNECTION', 'pool_size', 10)
+
+    def get_warm_connections(self) -> int:
+        """시작 시 미리 열어둘 커넥션 수 가져오기 (0이면 예열 안 함)"""
+        return self.get_int('CONNECTION', 'warm_connections', 4)
+
+    def get_keepalive_interval(self) -> float:
+        """유휴 keep-alive 주기 가져오기 (초)"""
+        return self.get_float('CONNECTION', 'keepalive_interval', 60.0)
+
+    def get_dns_ttl(self) -> float:
+        """DNS 캐시 유지 시간 가져오기 (초)"""
+        return self.get_float('CONNECTION', 'dns_ttl', 300.0)
+
+    def get_hedging_enabled(self) -> bool:
+        """조회 요청 헤징 사용 여부 가져오기"""
+        return self.get_bool('CONNECTION', 'hedging', False)
+
+    def get_hedge_percentile(self) -> float:
+        """헤징 기준 지연 백분위수 가져오기"""
+        return self.get_float('CONNECTION', 'hedge_percentile', 95.0)
+
+    def get_hedge_budget(self) -> float:
+        """일반 요청 대비 최대 헤징 비율 가져오기"""
+        return self.get_float('CONNECTION', 'hedge_budget', 0.05)
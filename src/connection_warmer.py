@@ -0,0 +1,155 @@
+"""
+커넥션 예열
+시작 시 API 호스트의 DNS를 미리 조회해 캐시하고, 커넥션 풀에 연결을 미리 열어둡니다.
+유휴 상태가 길어지면 주기적으로 keep-alive 요청을 보내 연결이 끊기지 않게 유지합니다.
+"""
+
+import logging
+import socket
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class DNSCache:
+    """
+    프로세스 전역 DNS 캐시
+
+    등록된 호스트에 대해서만 socket.getaddrinfo 결과를 TTL 동안 재사용합니다.
+    """
+
+    _lock = threading.Lock()
+    _entries: Dict[Tuple, Tuple[float, list]] = {}
+    _hosts: Dict[str, float] = {}
+    _original_getaddrinfo = None
+
+    @classmethod
+    def install(cls):
+        """socket.getaddrinfo에 캐시 적용 (한 번만 설치)"""
+        with cls._lock:
+            if cls._original_getaddrinfo is not None:
+                return
+            cls._original_getaddrinfo = socket.getaddrinfo
+            socket.getaddrinfo = cls._getaddrinfo
+
+    @classmethod
+    def register(cls, host: str, ttl: float = 300.0):
+        """캐시할 호스트 등록"""
+        cls.install()
+        with cls._lock:
+            cls._hosts[host] = ttl
+
+    @classmethod
+    def resolve(cls, host: str, port: int) -> list:
+        """호스트를 미리 조회하여 캐시에 저장"""
+        return socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+
+    @classmethod
+    def _getaddrinfo(cls, host, port, family=0, type=0, proto=0, flags=0):
+        ttl = cls._hosts.get(host)
+        if ttl is None:
+            return cls._original_getaddrinfo(host, port, family, type, proto, flags)
+
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        entry = cls._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        result = cls._original_getaddrinfo(host, port, family, type, proto, flags)
+        with cls._lock:
+            cls._entries[key] = (now + ttl, result)
+        return result
+
+
+class ConnectionWarmer:
+    """클라이언트 커넥션 예열 및 유휴 keep-alive"""
+
+    def __init__(
+        self,
+        kiwoom_client,
+        connections: int = 4,
+        keepalive_interval: float = 60.0,
+        dns_ttl: float = 300.0
+    ):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient 인스턴스
+            connections: 미리 열어둘 커넥션 수 (커넥션 풀 크기 이하)
+            keepalive_interval: 유휴 keep-alive 주기 (초, 0이면 사용 안 함)
+            dns_ttl: DNS 캐시 유지 시간 (초)
+        """
+        self.client = kiwoom_client
+        self.connections = max(1, connections)
+        self.keepalive_interval = keepalive_interval
+        self.dns_ttl = dns_ttl
+        self.logger = logging.getLogger(__name__)
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """백그라운드에서 예열 시작 (즉시 반환)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"warmer-{self.client.environment}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """keep-alive 중지"""
+        self._stop.set()
+
+    def warm_up(self):
+        """DNS 조회 후 커넥션을 동시에 열어 풀에 채움 (호출 스레드에서 실행)"""
+        parsed = urlparse(self.client.base_url)
+        host = parsed.hostname
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+
+        started = time.perf_counter()
+        try:
+            DNSCache.register(host, self.dns_ttl)
+            DNSCache.resolve(host, port)
+        except OSError as e:
+            self.logger.warning(f"DNS 조회 실패 ({host}): {e}")
+            return
+
+        self._open_connections(self.connections)
+        self.logger.info(
+            f"[{self.client.environment}] 커넥션 예열 완료 - "
+            f"{self.connections}개, {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+
+    def _open_connections(self, count: int):
+        """동시에 요청을 보내 서로 다른 커넥션을 count개 열고 풀에 반납"""
+        threads = [
+            threading.Thread(target=self._probe, daemon=True)
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _probe(self):
+        """가벼운 HEAD 요청 (응답 코드는 무시, 연결 수립이 목적)"""
+        try:
+            self.client.transport.head(self.client.base_url, timeout=5)
+        except Exception as e:
+            self.logger.debug(f"keep-alive 요청 실패: {e}")
+
+    def _run(self):
+        self.warm_up()
+
+        if self.keepalive_interval <= 0:
+            return
+
+        while not self._stop.wait(self.keepalive_interval):
+            # 최근에 실제 요청이 있었다면 연결이 살아 있으므로 생략
+            idle = time.monotonic() - self.client.last_request_at
+            if idle >= self.keepalive_interval:
+                self.logger.debug(f"[{self.client.environment}] 유휴 keep-alive")
+                self._open_connections(self.connections)
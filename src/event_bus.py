@@ -0,0 +1,187 @@
+"""
+내부 이벤트 버스
+클라이언트의 토큰 / 요청 이벤트를 GUI, 로깅, 지표 등 구독자에게 전달하는 프로세스 내 발행/구독 버스입니다.
+구독자는 발행 스레드(기본), 전용 스레드(ThreadDispatcher), Tk 메인 루프(TkDispatcher) 중에서 실행 위치를 고릅니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+# 토픽
+TOKEN_ISSUED = "token.issued"
+TOKEN_REFRESHED = "token.refreshed"
+TOKEN_EXPIRED = "token.expired"
+TOKEN_REVOKED = "token.revoked"
+REQUEST_COMPLETED = "request.completed"
+BREAKER_OPENED = "breaker.opened"
+CONDITION_CHANGED = "condition.changed"
+
+# 모든 토픽 구독
+ALL_TOPICS = "*"
+
+
+class Event:
+    """발행된 이벤트"""
+
+    __slots__ = ('topic', 'source', 'data', 'timestamp')
+
+    def __init__(self, topic: str, source: str, data: Dict):
+        self.topic = topic
+        self.source = source
+        self.data = data
+        self.timestamp = time.time()
+
+    def __repr__(self):
+        return f"Event(topic={self.topic!r}, source={self.source!r}, data={self.data!r})"
+
+
+class ThreadDispatcher:
+    """구독자 콜백을 전용 스레드에서 순서대로 실행"""
+
+    _STOP = object()
+
+    def __init__(self, name: str = "event-dispatcher"):
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.logger = logging.getLogger(__name__)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __call__(self, callback: Callable[[Event], None], event: Event):
+        self._queue.put((callback, event))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            callback, event = item
+            try:
+                callback(event)
+            except Exception:
+                self.logger.exception(f"이벤트 구독자 오류 ({event.topic})")
+
+    def stop(self):
+        """대기 중인 이벤트를 모두 처리한 뒤 스레드 종료"""
+        self._queue.put(self._STOP)
+
+
+class TkDispatcher:
+    """
+    구독자 콜백을 Tk 메인 루프에서 실행
+
+    다른 스레드에서는 큐에만 넣고, 메인 루프의 주기적 after 호출이 큐를 비웁니다.
+    """
+
+    def __init__(self, root, interval_ms: int = 50):
+        """
+        Args:
+            root: Tk 루트 윈도우 (메인 스레드에서 생성)
+            interval_ms: 큐 확인 주기 (ms)
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self._pending: deque = deque()
+        self.logger = logging.getLogger(__name__)
+        self.root.after(self.interval_ms, self._drain)
+
+    def __call__(self, callback: Callable[[Event], None], event: Event):
+        self._pending.append((callback, event))
+
+    def _drain(self):
+        while self._pending:
+            callback, event = self._pending.popleft()
+            try:
+                callback(event)
+            except Exception:
+                self.logger.exception(f"이벤트 구독자 오류 ({event.topic})")
+        try:
+            self.root.after(self.interval_ms, self._drain)
+        except Exception:
+            # 윈도우가 닫힌 경우
+            pass
+
+
+class Subscription:
+    """구독 정보 (EventBus.unsubscribe에 전달)"""
+
+    __slots__ = ('topic', 'callback', 'dispatcher')
+
+    def __init__(self, topic: str, callback: Callable[[Event], None], dispatcher):
+        self.topic = topic
+        self.callback = callback
+        self.dispatcher = dispatcher
+
+
+class EventBus:
+    """
+    스레드 안전 발행/구독 버스
+
+    구독 목록은 변경 시에만 복사(copy-on-write)하므로 발행은 잠금 없이 수행됩니다.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Tuple[Subscription, ...]] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def subscribe(
+        self,
+        topic: str,
+        callback: Callable[[Event], None],
+        dispatcher: Optional[Callable] = None
+    ) -> Subscription:
+        """
+        구독 등록
+
+        Args:
+            topic: 토픽 (ALL_TOPICS이면 모든 토픽)
+            callback: callback(event)
+            dispatcher: 실행 위치 (None이면 발행 스레드에서 바로 실행, ThreadDispatcher / TkDispatcher)
+
+        Returns:
+            Subscription: 구독 해제 시 사용
+        """
+        subscription = Subscription(topic, callback, dispatcher)
+        with self._lock:
+            self._subscribers[topic] = self._subscribers.get(topic, ()) + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """구독 해제"""
+        with self._lock:
+            remaining = tuple(s for s in self._subscribers.get(subscription.topic, ()) if s is not subscription)
+            if remaining:
+                self._subscribers[subscription.topic] = remaining
+            else:
+                self._subscribers.pop(subscription.topic, None)
+
+    def has_subscribers(self, topic: str) -> bool:
+        """토픽 구독자 존재 여부 (이벤트 데이터 생성 비용을 피할 때 사용)"""
+        return topic in self._subscribers or ALL_TOPICS in self._subscribers
+
+    def publish(self, topic: str, source: str = "", **data):
+        """
+        이벤트 발행
+
+        Args:
+            topic: 토픽
+            source: 발행자 (예: 클라이언트 환경 'mock' / 'production')
+            **data: 이벤트 데이터
+        """
+        subscribers = self._subscribers.get(topic, ()) + self._subscribers.get(ALL_TOPICS, ())
+        if not subscribers:
+            return
+
+        event = Event(topic, source, data)
+        for subscription in subscribers:
+            if subscription.dispatcher is not None:
+                subscription.dispatcher(subscription.callback, event)
+                continue
+            try:
+                subscription.callback(event)
+            except Exception:
+                self.logger.exception(f"이벤트 구독자 오류 ({topic})")
@@ -5,11 +5,24 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import os
 import threading
 from datetime import datetime
 from typing import Optional
 import logging
 
+from .backfill import ChartBackfill, BackfillCheckpoint
+from .backfill_scheduler import BackfillScheduler, format_progress
+from .account_poller import AccountPoller, describe_changes
+from .portfolio import Portfolio
+from .quote_board import QuoteBoard, QuotePoller, QUOTE_HEADINGS
+from .symbol_master import SymbolMaster
+from .log_index import LogTail, LogFilter, LEVEL_NAMES, level_code
+from .profiling import ProfileSession, CPU_MODES
+from .event_bus import (
+    TkDispatcher, CONDITION_CHANGED, TOKEN_EXPIRED, TOKEN_ISSUED, TOKEN_REFRESHED, TOKEN_REVOKED
+)
+
 
 class ModernButton(tk.Button):
     """모던한 스타일의 버튼"""
@@ -90,6 +103,128 @@ class SidebarButton(tk.Button):
             self['font'] = ('맑은 고딕', 10)
 
 
+class VirtualQuoteTable(tk.Frame):
+    """
+    가상화 시세 테이블
+
+    Treeview에는 화면에 보이는 행 수만큼만 항목을 만들고, 스크롤하면 같은 항목에 다른 종목을 다시 채웁니다.
+    QuoteBoard에 쌓인 변경은 초당 fps번만 가져와 보이는 행의 바뀐 셀에만 반영하므로,
+    프레임당 작업량은 틱 수와 관계없이 (보이는 행 수 × 열 수) 이하입니다.
+    """
+
+    ROW_HEIGHT = 22
+
+    def __init__(self, master, board, headings, fps: int = 10, **kwargs):
+        """
+        Args:
+            master: 부모 위젯
+            board: QuoteBoard 인스턴스
+            headings: board.columns에 대응하는 열 제목
+            fps: 초당 화면 갱신 횟수
+        """
+        super().__init__(master, **kwargs)
+        self.board = board
+        self.interval_ms = max(1, int(1000 / max(fps, 1)))
+        self.offset = 0
+        self.frames = 0
+        self.cells_applied = 0
+        self._items = []
+        self._after_id = None
+
+        ttk.Style(self).configure('Quote.Treeview', rowheight=self.ROW_HEIGHT)
+
+        columns = ("symbol",) + tuple(board.columns)
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', style='Quote.Treeview', selectmode='none')
+        self.tree.heading("symbol", text="종목코드")
+        self.tree.column("symbol", width=80, anchor='w')
+        for column, heading in zip(board.columns, headings):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=90, anchor='w' if column == "stk_nm" else 'e')
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll_to(self.offset - 3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_to(self.offset + 3))
+
+    def _on_resize(self, event=None):
+        """보이는 행 수에 맞춰 Treeview 항목 수 조정"""
+        visible = max(1, self.tree.winfo_height() // self.ROW_HEIGHT - 1)
+        count = min(visible, len(self.board.symbols))
+        while len(self._items) < count:
+            self._items.append(self.tree.insert('', tk.END))
+        while len(self._items) > count:
+            self.tree.delete(self._items.pop())
+        self.scroll_to(self.offset)
+
+    def refresh(self):
+        """종목 목록 변경 후 다시 채움"""
+        self._on_resize()
+
+    def scroll_to(self, offset: int):
+        """offset번째 종목부터 표시"""
+        symbols = self.board.symbols
+        self.offset = max(0, min(offset, len(symbols) - len(self._items)))
+        for i, item in enumerate(self._items):
+            symbol = symbols[self.offset + i]
+            self.tree.item(item, values=(symbol,) + self.board.row(symbol))
+
+        total = len(symbols)
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(self._items)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_scrollbar(self, action, *args):
+        if action == 'moveto':
+            self.scroll_to(int(float(args[0]) * len(self.board.symbols)))
+        elif action == 'scroll':
+            step = len(self._items) if args[1] == 'pages' else 1
+            self.scroll_to(self.offset + int(args[0]) * step)
+
+    def _on_mousewheel(self, event):
+        self.scroll_to(self.offset - (3 if event.delta > 0 else -3))
+        return 'break'
+
+    def start(self):
+        """프레임 갱신 시작"""
+        if self._after_id is None:
+            self._after_id = self.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        """프레임 갱신 중지"""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    def destroy(self):
+        self.stop()
+        super().destroy()
+
+    def _tick(self):
+        """한 프레임: 바뀐 셀 중 보이는 행만 반영"""
+        changes = self.board.take_changes()
+        first = self.offset
+        last = first + len(self._items)
+        for symbol, cells in changes.items():
+            index = self.board.index(symbol)
+            if index is None or not first <= index < last:
+                continue
+            item = self._items[index - first]
+            if len(cells) == 1:
+                column, value = next(iter(cells.items()))
+                self.tree.set(item, column, value)
+            else:
+                self.tree.item(item, values=(symbol,) + self.board.row(symbol))
+            self.cells_applied += len(cells)
+
+        self.frames += 1
+        self._after_id = self.after(self.interval_ms, self._tick)
+
+
 class KiwoomTokenGUI:
     """키움증권 토큰 관리 GUI"""
 
@@ -104,13 +239,14 @@ class KiwoomTokenGUI:
     COLOR_BG = '#F5F6FA'
     COLOR_WHITE = '#FFFFFF'
 
-    def __init__(self, kiwoom_client, config_manager):
+    def __init__(self, client_registry, config_manager, profiler: Optional[ProfileSession] = None):
         """
         Args:
-            kiwoom_client: KiwoomAPIClient 인스턴스
+            client_registry: ClientRegistry 인스턴스 (환경별 KiwoomAPIClient)
             config_manager: ConfigManager 인스턴스
+            profiler: 설정 페이지에서 켜고 끌 프로파일러 (None이면 [PROFILING] 설정으로 생성)
         """
-        self.client = kiwoom_client
+        self.clients = client_registry
         self.config = config_manager
         self.logger = logging.getLogger(__name__)
 
@@ -120,6 +256,43 @@ class KiwoomTokenGUI:
         # 로그 메시지 저장소 (페이지 전환 시에도 유지)
         self.log_messages = []
 
+        # 백필 스케줄러 (페이지 전환 시에도 유지)
+        self.backfill_scheduler: Optional[BackfillScheduler] = None
+        self._backfill_after_id = None
+
+        # 계좌 상태 폴링 (토큰 발급 후 시작)
+        self.account_poller: Optional[AccountPoller] = None
+
+        # 포트폴리오 손익 (토큰 발급 후 시작, 화면은 스냅샷만 표시)
+        self.portfolio: Optional[Portfolio] = None
+        self._portfolio_after_id = None
+        self._portfolio_version = None
+
+        # 관심종목 시세판 (종목별 최신 시세는 페이지 전환 시에도 유지, 조회는 페이지가 열려 있을 때만)
+        self.quote_board = QuoteBoard(self.config.get_watchlist())
+        self.quote_poller: Optional[QuotePoller] = None
+        self.quote_table: Optional[VirtualQuoteTable] = None
+        self._quote_stats_after_id = None
+
+        # 종목 마스터 (시세 페이지 종목 검색, 토큰이 있을 때 백그라운드에서 불러옴)
+        self.symbol_master: Optional[SymbolMaster] = None
+
+        # 로그 파일 뷰어 (색인은 페이지 전환 시에도 유지, 색인 / 검색은 백그라운드 스레드에서)
+        self.log_tail: Optional[LogTail] = None
+        self._log_lock = threading.Lock()
+        self._log_busy = False
+        self._log_pending = None
+        self._log_page = -1
+        self._log_after_id = None
+
+        # 프로파일러 (설정 페이지에서 켜고 끔, 보고서는 로그 디렉토리에 저장)
+        if profiler is None:
+            settings = self.config.get_profiling_settings()
+            settings.pop('duration')
+            profiler = ProfileSession(os.path.dirname(self.config.get_log_file()) or ".", **settings)
+        self.profiler = profiler
+        self._profile_after_id = None
+
         # 메인 윈도우 생성
         self.root = tk.Tk()
         self.root.title("키움증권 토큰 관리 시스템")
@@ -134,6 +307,13 @@ class KiwoomTokenGUI:
         except:
             pass
 
+        # 클라이언트 토큰 이벤트 구독 (Tk 메인 루프에서 처리, 모든 환경의 클라이언트가 같은 버스 사용)
+        self.events = self.client.events
+        self._tk_dispatcher = TkDispatcher(self.root)
+        for topic in (TOKEN_ISSUED, TOKEN_REFRESHED, TOKEN_EXPIRED, TOKEN_REVOKED):
+            self.events.subscribe(topic, self._on_token_event, self._tk_dispatcher)
+        self.events.subscribe(CONDITION_CHANGED, self._on_condition_changed, self._tk_dispatcher)
+
         # 메인 컨테이너
         self.main_container = tk.Frame(self.root, bg=self.COLOR_BG)
         self.main_container.pack(fill=tk.BOTH, expand=True)
@@ -152,6 +332,11 @@ class KiwoomTokenGUI:
         # 초기 페이지 표시
         self._show_token_issue_page()
 
+    @property
+    def client(self):
+        """현재 활성 환경의 KiwoomAPIClient"""
+        return self.clients.active
+
     def _create_sidebar(self):
         """사이드바 생성"""
         sidebar = tk.Frame(
@@ -228,6 +413,30 @@ class KiwoomTokenGUI:
         )
         self.nav_buttons['token_info'].pack(fill=tk.X, padx=15, pady=2)
 
+        # 백필
+        self.nav_buttons['backfill'] = SidebarButton(
+            sidebar,
+            text="📈  차트 백필",
+            command=lambda: self._switch_page('backfill')
+        )
+        self.nav_buttons['backfill'].pack(fill=tk.X, padx=15, pady=2)
+
+        # 포트폴리오
+        self.nav_buttons['portfolio'] = SidebarButton(
+            sidebar,
+            text="💼  포트폴리오",
+            command=lambda: self._switch_page('portfolio')
+        )
+        self.nav_buttons['portfolio'].pack(fill=tk.X, padx=15, pady=2)
+
+        # 관심종목 시세
+        self.nav_buttons['quotes'] = SidebarButton(
+            sidebar,
+            text="📊  관심종목 시세",
+            command=lambda: self._switch_page('quotes')
+        )
+        self.nav_buttons['quotes'].pack(fill=tk.X, padx=15, pady=2)
+
         # 설정
         self.nav_buttons['settings'] = SidebarButton(
             sidebar,
@@ -284,6 +493,10 @@ class KiwoomTokenGUI:
         if page_name in self.nav_buttons:
             self.nav_buttons[page_name].set_active(True)
 
+        # 시세판을 떠나면 조회 / 화면 갱신 중지
+        if self.current_page == 'quotes' and page_name != 'quotes':
+            self._stop_quotes()
+
         # 현재 페이지 업데이트
         self.current_page = page_name
 
@@ -296,6 +509,12 @@ class KiwoomTokenGUI:
             self._show_token_issue_page()
         elif page_name == 'token_info':
             self._show_token_info_page()
+        elif page_name == 'backfill':
+            self._show_backfill_page()
+        elif page_name == 'portfolio':
+            self._show_portfolio_page()
+        elif page_name == 'quotes':
+            self._show_quotes_page()
         elif page_name == 'settings':
             self._show_settings_page()
         elif page_name == 'logs':
@@ -357,6 +576,7 @@ class KiwoomTokenGUI:
             fg=self.COLOR_DANGER
         )
         self.status_label.pack(side=tk.LEFT)
+        self._update_status_label()
 
         # 토큰 발급 카드
         issue_card = self._create_card(content, "토큰 발급")
@@ -513,6 +733,451 @@ class KiwoomTokenGUI:
         token_text.insert('1.0', token_value if token_value else '토큰이 발급되지 않았습니다.')
         token_text.config(state=tk.DISABLED)
 
+    def _show_backfill_page(self):
+        """차트 백필 페이지"""
+        self._create_page_header("차트 백필", "여러 종목의 과거 차트를 병렬로 내려받습니다")
+
+        content = tk.Frame(self.content_frame, bg=self.COLOR_BG)
+        content.pack(fill=tk.BOTH, expand=True, padx=40, pady=20)
+
+        # 종목 입력 카드
+        input_card = self._create_card(content, "백필 대상")
+        input_card.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+
+        input_inner = tk.Frame(input_card, bg=self.COLOR_WHITE)
+        input_inner.pack(padx=30, pady=20, fill=tk.BOTH, expand=True)
+
+        tk.Label(
+            input_inner,
+            text="종목코드 (공백 또는 줄바꿈으로 구분):",
+            font=('맑은 고딕', 10, 'bold'),
+            bg=self.COLOR_WHITE,
+            fg=self.COLOR_DARK,
+            anchor='w'
+        ).pack(fill=tk.X, pady=(0, 5))
+
+        self.backfill_symbols_text = scrolledtext.ScrolledText(
+            input_inner,
+            height=6,
+            font=('Consolas', 10),
+            bg=self.COLOR_LIGHT,
+            fg=self.COLOR_DARK,
+            relief=tk.FLAT,
+            borderwidth=1
+        )
+        self.backfill_symbols_text.pack(fill=tk.BOTH, expand=True)
+
+        button_frame = tk.Frame(input_inner, bg=self.COLOR_WHITE)
+        button_frame.pack(fill=tk.X, pady=(15, 0))
+
+        self.backfill_start_button = ModernButton(
+            button_frame,
+            text="▶  백필 시작",
+            bg=self.COLOR_PRIMARY,
+            fg=self.COLOR_WHITE,
+            activebackground='#357ABD',
+            command=self._start_backfill
+        )
+        self.backfill_start_button.pack(side=tk.LEFT)
+
+        ModernButton(
+            button_frame,
+            text="■  중지",
+            bg=self.COLOR_DANGER,
+            fg=self.COLOR_WHITE,
+            activebackground='#C0392B',
+            command=self._stop_backfill
+        ).pack(side=tk.LEFT, padx=(10, 0))
+
+        # 진행 상황 카드
+        progress_card = self._create_card(content, "진행 상황")
+        progress_card.pack(fill=tk.X)
+
+        progress_inner = tk.Frame(progress_card, bg=self.COLOR_WHITE)
+        progress_inner.pack(padx=30, pady=20, fill=tk.X)
+
+        self.backfill_progressbar = ttk.Progressbar(
+            progress_inner,
+            orient=tk.HORIZONTAL,
+            mode='determinate',
+            maximum=100
+        )
+        self.backfill_progressbar.pack(fill=tk.X)
+
+        self.backfill_status_label = tk.Label(
+            progress_inner,
+            text="대기 중",
+            font=('맑은 고딕', 10),
+            bg=self.COLOR_WHITE,
+            fg=self.COLOR_DARK,
+            anchor='w'
+        )
+        self.backfill_status_label.pack(fill=tk.X, pady=(10, 0))
+
+        if self.backfill_scheduler and self.backfill_scheduler.is_running:
+            self.backfill_start_button.config(state=tk.DISABLED)
+            self._update_backfill_progress()
+
+    def _start_backfill(self):
+        """백필 시작"""
+        symbols = self.backfill_symbols_text.get('1.0', tk.END).split()
+        if not symbols:
+            messagebox.showinfo("차트 백필", "백필할 종목코드를 입력하세요.")
+            return
+
+        if not self.client.is_token_valid():
+            messagebox.showwarning("차트 백필", "먼저 토큰을 발급받아야 합니다.")
+            return
+
+        backfill = ChartBackfill(
+            self.client,
+            BackfillCheckpoint(self.config.get_backfill_checkpoint_dir())
+        )
+        self.backfill_scheduler = BackfillScheduler(
+            backfill,
+            workers=self.config.get_backfill_workers(),
+            max_retries=self.config.get_backfill_max_retries()
+        )
+        self.backfill_scheduler.start(symbols)
+
+        self.backfill_start_button.config(state=tk.DISABLED)
+        self.log_message(f"차트 백필을 시작합니다. ({len(symbols)}종목)", 'INFO')
+        self._update_backfill_progress()
+
+    def _stop_backfill(self):
+        """백필 중지"""
+        if self.backfill_scheduler and self.backfill_scheduler.is_running:
+            self.backfill_scheduler.stop()
+            self.log_message("차트 백필을 중지했습니다. 다음 시작 시 이어받습니다.", 'WARNING')
+
+    def _update_backfill_progress(self):
+        """백필 진행 상황 갱신 (페이지가 열려 있는 동안 주기적으로 호출)"""
+        # 중복 예약 방지
+        if self._backfill_after_id:
+            self.root.after_cancel(self._backfill_after_id)
+            self._backfill_after_id = None
+
+        if self.current_page != 'backfill' or not self.backfill_scheduler:
+            return
+
+        try:
+            snapshot = self.backfill_scheduler.progress.snapshot()
+            self.backfill_progressbar['value'] = snapshot['percent']
+            self.backfill_status_label.config(text=format_progress(snapshot))
+        except tk.TclError:
+            # 위젯이 삭제된 경우 무시
+            return
+
+        if self.backfill_scheduler.is_running:
+            self._backfill_after_id = self.root.after(500, self._update_backfill_progress)
+        else:
+            self.backfill_start_button.config(state=tk.NORMAL)
+            level = 'ERROR' if snapshot['failed'] else 'SUCCESS'
+            self.log_message(f"차트 백필 종료 - {format_progress(snapshot)}", level)
+
+    def _show_portfolio_page(self):
+        """포트폴리오 페이지 (손익 엔진의 스냅샷을 그대로 표시)"""
+        self._create_page_header("포트폴리오", "보유 종목과 실현 / 평가 손익을 확인합니다")
+
+        content = tk.Frame(self.content_frame, bg=self.COLOR_BG)
+        content.pack(fill=tk.BOTH, expand=True, padx=40, pady=20)
+
+        # 계좌 합계 카드
+        totals_card = self._create_card(content, "계좌 합계")
+        totals_card.pack(fill=tk.X, pady=(0, 20))
+
+        totals_inner = tk.Frame(totals_card, bg=self.COLOR_WHITE)
+        totals_inner.pack(padx=30, pady=20, fill=tk.X)
+
+        self.portfolio_totals_label = tk.Label(
+            totals_inner,
+            text="토큰 발급 후 잔고 대사가 완료되면 표시됩니다.",
+            font=('맑은 고딕', 10),
+            bg=self.COLOR_WHITE,
+            fg=self.COLOR_DARK,
+            justify=tk.LEFT,
+            anchor='w'
+        )
+        self.portfolio_totals_label.pack(fill=tk.X)
+
+        # 보유 종목 카드
+        positions_card = self._create_card(content, "보유 종목")
+        positions_card.pack(fill=tk.BOTH, expand=True)
+
+        positions_inner = tk.Frame(positions_card, bg=self.COLOR_WHITE)
+        positions_inner.pack(padx=30, pady=20, fill=tk.BOTH, expand=True)
+
+        columns = ("account", "symbol", "quantity", "avg_price", "last_price", "market_value", "unrealized", "realized")
+        headings = ("계좌", "종목", "수량", "평균단가", "현재가", "평가금액", "평가손익", "실현손익")
+        self.portfolio_tree = ttk.Treeview(positions_inner, columns=columns, show='headings', height=12)
+        for column, heading in zip(columns, headings):
+            self.portfolio_tree.heading(column, text=heading)
+            self.portfolio_tree.column(column, width=90, anchor='e' if column not in ("account", "symbol") else 'w')
+        self.portfolio_tree.pack(fill=tk.BOTH, expand=True)
+
+        self._portfolio_version = None
+        self._update_portfolio_view()
+
+    def _update_portfolio_view(self):
+        """포트폴리오 화면 갱신 (페이지가 열려 있는 동안 1초마다, 스냅샷이 바뀐 경우에만 다시 그림)"""
+        if self._portfolio_after_id:
+            self.root.after_cancel(self._portfolio_after_id)
+            self._portfolio_after_id = None
+
+        if self.current_page != 'portfolio':
+            return
+
+        if self.portfolio:
+            snapshot = self.portfolio.snapshot()
+            if snapshot["version"] != self._portfolio_version:
+                try:
+                    self._render_portfolio(snapshot)
+                except tk.TclError:
+                    # 위젯이 삭제된 경우 무시
+                    return
+                self._portfolio_version = snapshot["version"]
+
+        self._portfolio_after_id = self.root.after(1000, self._update_portfolio_view)
+
+    def _render_portfolio(self, snapshot: dict):
+        lines = []
+        for account, totals in snapshot["accounts"].items():
+            lines.append(
+                f"[{account}] 평가금액 {totals['market_value']:,.0f}  |  평가손익 {totals['unrealized_pnl']:+,.0f}  |  "
+                f"실현손익 {totals['realized_pnl']:+,.0f}  |  총노출 {totals['gross_exposure']:,.0f}  |  "
+                f"{totals['positions']}종목"
+            )
+        if snapshot["last_reconciled"]:
+            reconciled = datetime.fromtimestamp(snapshot["last_reconciled"]).strftime("%H:%M:%S")
+            lines.append(f"마지막 잔고 대사: {reconciled}")
+        self.portfolio_totals_label.config(text="\n".join(lines) or "보유 종목이 없습니다.")
+
+        self.portfolio_tree.delete(*self.portfolio_tree.get_children())
+        for p in snapshot["positions"]:
+            self.portfolio_tree.insert('', tk.END, values=(
+                p["account"], p["symbol"], f"{p['quantity']:,.0f}", f"{p['avg_price']:,.0f}",
+                f"{p['last_price']:,.0f}", f"{p['market_value']:,.0f}",
+                f"{p['unrealized_pnl']:+,.0f}", f"{p['realized_pnl']:+,.0f}"
+            ))
+
+    def _show_quotes_page(self):
+        """관심종목 시세 페이지 (가상화 테이블, 바뀐 셀만 고정 프레임으로 반영)"""
+        # 토큰 발급 후 등 같은 페이지를 다시 그릴 때 이전 화면의 갱신 루프가 쌓이지 않도록 정리
+        if self._quote_stats_after_id:
+            self.root.after_cancel(self._quote_stats_after_id)
+            self._quote_stats_after_id = None
+        if self.quote_table:
+            self.quote_table.stop()
+            self.quote_table = None
+
+        self._create_page_header("관심종목 시세", "관심종목의 실시간 시세를 확인합니다")
+
+        content = tk.Frame(self.content_frame, bg=self.COLOR_BG)
+        content.pack(fill=tk.BOTH, expand=True, padx=40, pady=20)
+
+        # 종목 입력 카드
+        input_card = self._create_card(content, "관심종목")
+        input_card.pack(fill=tk.X, pady=(0, 20))
+
+        input_inner = tk.Frame(input_card, bg=self.COLOR_WHITE)
+        input_inner.pack(padx=30, pady=20, fill=tk.X)
+
+        tk.Label(
+            input_inner,
+            text="종목코드 (쉼표 또는 공백으로 구분):",
+            font=('맑은 고딕', 10, 'bold'),
+            bg=self.COLOR_WHITE,
+            fg=self.COLOR_DARK,
+            anchor='w'
+        ).pack(fill=tk.X, pady=(0, 5))
+
+        entry_frame = tk.Frame(input_inner, bg=self.COLOR_WHITE)
+        entry_frame.pack(fill=tk.X)
+
+        self.quote_symbols_entry = tk.Entry(
+            entry_frame,
+            font=('Consolas', 10),
+            bg=self.COLOR_LIGHT,
+            fg=self.COLOR_DARK,
+            relief=tk.FLAT,
+            borderwidth=1
+        )
+        self.quote_symbols_entry.insert(0, " ".join(self.quote_board.symbols))
+        self.quote_symbols_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5)
+
+        ModernButton(
+            entry_frame,
+            text="적용",
+            bg=self.COLOR_PRIMARY,
+            fg=self.COLOR_WHITE,
+            activebackground='#357ABD',
+            command=self._apply_watchlist
+        ).pack(side=tk.LEFT, padx=(10, 0))
+
+        # 종목 검색 (종목코드, 종목명, 초성, '삼성ㅈ'처럼 섞어 입력 가능 / 더블클릭 또는 Enter로 추가)
+        search_frame = tk.Frame(input_inner, bg=self.COLOR_WHITE)
+        search_frame.pack(fill=tk.X, pady=(10, 0))
+
+        tk.Label(
+            search_frame,
+            text="종목 검색:",
+            font=('맑은 고딕', 10),
+            bg=self.COLOR_WHITE,
+            fg=self.COLOR_DARK
+        ).pack(side=tk.LEFT, anchor='n')
+
+        search_column = tk.Frame(search_frame, bg=self.COLOR_WHITE)
+        search_column.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0))
+
+        self.symbol_search_entry = tk.Entry(
+            search_column,
+            font=('맑은 고딕', 10),
+            bg=self.COLOR_LIGHT,
+            fg=self.COLOR_DARK,
+            relief=tk.FLAT,
+            borderwidth=1
+        )
+        self.symbol_search_entry.pack(fill=tk.X, ipady=3)
+        self.symbol_search_entry.bind('<KeyRelease>', self._on_symbol_search)
+        self.symbol_search_entry.bind('<Return>', self._add_searched_symbol)
+
+        self.symbol_search_list = tk.Listbox(
+            search_column,
+            height=5,
+            font=('맑은 고딕', 9),
+            bg=self.COLOR_WHITE,
+            fg=self.COLOR_DARK,
+            relief=tk.FLAT,
+            activestyle='none'
+        )
+        self.symbol_search_list.pack(fill=tk.X, pady=(3, 0))
+        self.symbol_search_list.bind('<Double-Button-1>', self._add_searched_symbol)
+        self.symbol_search_list.bind('<Return>', self._add_searched_symbol)
+        self._symbol_search_results = []
+        self._ensure_symbol_master()
+
+        # 시세 카드
+        table_card = self._create_card(content, "시세")
+        table_card.pack(fill=tk.BOTH, expand=True)
+
+        table_inner = tk.Frame(table_card, bg=self.COLOR_WHITE)
+        table_inner.pack(padx=30, pady=20, fill=tk.BOTH, expand=True)
+
+        self.quote_stats_label = tk.Label(
+            table_inner,
+            text="",
+            font=('맑은 고딕', 9),
+            bg=self.COLOR_WHITE,
+            fg='#7F8C8D',
+            anchor='w'
+        )
+        self.quote_stats_label.pack(fill=tk.X, pady=(0, 5))
+
+        settings = self.config.get_quote_settings()
+        self.quote_table = VirtualQuoteTable(
+            table_inner, self.quote_board, QUOTE_HEADINGS, fps=settings['fps'], bg=self.COLOR_WHITE
+        )
+        self.quote_table.pack(fill=tk.BOTH, expand=True)
+        self.quote_table.start()
+
+        self._start_quote_poller()
+        self._update_quote_stats(self.quote_board.updates_received, 0)
+
+    def _apply_watchlist(self):
+        """입력한 종목으로 시세판 변경"""
+        text = self.quote_symbols_entry.get().replace(',', ' ')
+        symbols = [s.strip() for s in text.split() if s.strip()]
+        self.quote_board.set_symbols(symbols)
+        if self.quote_poller:
+            self.quote_poller.set_symbols(self.quote_board.symbols)
+        if self.quote_table:
+            self.quote_table.refresh()
+        self.log_message(f"관심종목 {len(self.quote_board.symbols)}개 적용", 'INFO')
+
+    def _ensure_symbol_master(self):
+        """현재 환경의 종목 마스터 준비 (토큰이 있고 아직 불러오지 않았으면 백그라운드에서 불러옴)"""
+        if self.symbol_master is None or self.symbol_master.client is not self.client:
+            self.symbol_master = SymbolMaster(self.client)
+        if not self.symbol_master.is_loaded and self.client.access_token:
+            self.symbol_master.refresh_async()
+
+    def _on_symbol_search(self, event=None):
+        """검색어가 바뀔 때마다 종목 검색 결과 갱신"""
+        if event is not None and event.keysym in ('Return', 'Up', 'Down'):
+            return
+        self._ensure_symbol_master()
+
+        query = self.symbol_search_entry.get()
+        self._symbol_search_results = self.symbol_master.search(query, limit=20)
+        self.symbol_search_list.delete(0, tk.END)
+        for symbol in self._symbol_search_results:
+            self.symbol_search_list.insert(tk.END, f"{symbol['code']}  {symbol['name']}")
+        if query.strip() and not self.symbol_master.is_loaded:
+            self.symbol_search_list.insert(tk.END, "종목 리스트를 불러오는 중입니다 (토큰 필요)...")
+
+    def _add_searched_symbol(self, event=None):
+        """선택한 (없으면 첫 번째) 검색 결과를 관심종목 입력란에 추가"""
+        if not self._symbol_search_results:
+            return
+        selection = self.symbol_search_list.curselection()
+        index = selection[0] if selection else 0
+        if index >= len(self._symbol_search_results):
+            return
+
+        code = self._symbol_search_results[index]['code']
+        current = self.quote_symbols_entry.get().replace(',', ' ').split()
+        if code not in current:
+            self.quote_symbols_entry.insert(tk.END, f" {code}" if current else code)
+        self.symbol_search_entry.delete(0, tk.END)
+        self._on_symbol_search()
+
+    def _update_quote_stats(self, last_updates: int, last_frames: int):
+        """시세판 수신 / 화면 갱신 통계 (1초마다)"""
+        self._quote_stats_after_id = None
+        if self.current_page != 'quotes' or not self.quote_table:
+            return
+
+        updates = self.quote_board.updates_received
+        frames = self.quote_table.frames
+        if not self.client.access_token:
+            status = "토큰 발급 후 시세 조회가 시작됩니다."
+        else:
+            status = (f"{len(self.quote_board.symbols)}종목  |  수신 {updates - last_updates:,}건/초  |  "
+                      f"화면 {frames - last_frames}fps  |  반영 셀 누적 {self.quote_table.cells_applied:,}")
+        try:
+            self.quote_stats_label.config(text=status)
+        except tk.TclError:
+            # 위젯이 삭제된 경우 무시
+            return
+        self._quote_stats_after_id = self.root.after(1000, self._update_quote_stats, updates, frames)
+
+    def _start_quote_poller(self):
+        """관심종목 시세 조회 시작 (토큰이 있을 때만)"""
+        if self.quote_poller or not self.client.access_token:
+            return
+        self.quote_poller = QuotePoller(
+            self.client, self.quote_board, interval=self.config.get_quote_settings()['poll_interval']
+        )
+        if self.portfolio:
+            self.portfolio.attach_quotes(self.quote_poller)
+        self.quote_poller.start()
+
+    def _stop_quote_poller(self):
+        """관심종목 시세 조회 중지"""
+        if self.quote_poller:
+            self.quote_poller.stop()
+            self.quote_poller = None
+
+    def _stop_quotes(self):
+        """시세판 화면 갱신 / 조회 중지"""
+        self._stop_quote_poller()
+        if self._quote_stats_after_id:
+            self.root.after_cancel(self._quote_stats_after_id)
+            self._quote_stats_after_id = None
+        if self.quote_table:
+            self.quote_table.stop()
+            self.quote_table = None
+
     def _show_settings_page(self):
         """설정 페이지"""
         self._create_page_header("설정", "API 및 애플리케이션 설정을 관리합니다")
@@ -592,19 +1257,152 @@ class KiwoomTokenGUI:
                 anchor='w'
             ).pack(side=tk.LEFT)
 
+        # 프로파일링 카드
+        profile_card = self._create_card(content, "프로파일링")
+        profile_card.pack(fill=tk.X, pady=(20, 0))
+
+        profile_inner = tk.Frame(profile_card, bg=self.COLOR_WHITE)
+        profile_inner.pack(padx=30, pady=20, fill=tk.X)
+
+        option_row = tk.Frame(profile_inner, bg=self.COLOR_WHITE)
+        option_row.pack(fill=tk.X, pady=(0, 10))
+
+        tk.Label(
+            option_row, text="CPU:", font=('맑은 고딕', 10, 'bold'),
+            bg=self.COLOR_WHITE, fg=self.COLOR_DARK
+        ).pack(side=tk.LEFT)
+        self.profile_cpu_var = tk.StringVar(value=self.profiler.cpu)
+        ttk.Combobox(
+            option_row, textvariable=self.profile_cpu_var, state='readonly', width=10, values=CPU_MODES
+        ).pack(side=tk.LEFT, padx=(5, 20))
+
+        self.profile_memory_var = tk.BooleanVar(value=self.profiler.memory)
+        tk.Checkbutton(
+            option_row, text="메모리 (tracemalloc)", variable=self.profile_memory_var,
+            font=('맑은 고딕', 10), bg=self.COLOR_WHITE, fg=self.COLOR_DARK,
+            activebackground=self.COLOR_WHITE
+        ).pack(side=tk.LEFT, padx=(0, 20))
+
+        tk.Label(
+            option_row, text="구간(초, 0이면 중지할 때까지):", font=('맑은 고딕', 10, 'bold'),
+            bg=self.COLOR_WHITE, fg=self.COLOR_DARK
+        ).pack(side=tk.LEFT)
+        self.profile_duration_var = tk.StringVar(value="30")
+        tk.Entry(
+            option_row, textvariable=self.profile_duration_var, width=6, font=('Consolas', 10),
+            bg=self.COLOR_LIGHT, fg=self.COLOR_DARK, relief=tk.FLAT
+        ).pack(side=tk.LEFT, padx=(5, 0), ipady=3)
+
+        control_row = tk.Frame(profile_inner, bg=self.COLOR_WHITE)
+        control_row.pack(fill=tk.X)
+
+        self.profile_button = ModernButton(
+            control_row,
+            text="",
+            bg=self.COLOR_PRIMARY,
+            fg=self.COLOR_WHITE,
+            activebackground='#357ABD',
+            command=self._toggle_profiling
+        )
+        self.profile_button.pack(side=tk.LEFT)
+
+        self.profile_status_label = tk.Label(
+            control_row, text="", font=('맑은 고딕', 9), bg=self.COLOR_WHITE,
+            fg='#7F8C8D', anchor='w', justify=tk.LEFT
+        )
+        self.profile_status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(15, 0))
+
+        self._update_profile_status()
+
+    def start_profiling(self, duration: float = 0.0):
+        """
+        프로파일링 시작 (구간이 끝나면 Tk 메인 스레드에서 보고서 저장)
+
+        Args:
+            duration: 기록 구간 (초, 0이면 중지할 때까지)
+        """
+        try:
+            self.profiler.start(
+                duration,
+                scheduler=lambda delay, callback: self.root.after(int(delay * 1000), callback),
+                on_finished=self._on_profiling_finished
+            )
+        except (RuntimeError, ValueError) as e:
+            self.log_message(f"프로파일링 시작 실패: {e}", 'ERROR')
+            return
+        self.log_message(
+            f"프로파일링 시작 - CPU {self.profiler.cpu}, 메모리 {'사용' if self.profiler.memory else '안 함'}"
+            + (f", {duration:g}초" if duration else ""), 'INFO'
+        )
+        self._update_profile_status()
+
+    def _toggle_profiling(self):
+        """설정 페이지 프로파일링 시작 / 중지 버튼"""
+        if self.profiler.active:
+            self._on_profiling_finished(self.profiler.stop())
+            return
+
+        try:
+            duration = max(0.0, float(self.profile_duration_var.get() or 0))
+        except ValueError:
+            messagebox.showwarning("입력 오류", "구간은 초 단위 숫자로 입력하세요.")
+            return
+        self.profiler.cpu = self.profile_cpu_var.get()
+        self.profiler.memory = self.profile_memory_var.get()
+        self.start_profiling(duration)
+
+    def _on_profiling_finished(self, reports):
+        """프로파일링 보고서 저장 후 (Tk 메인 스레드)"""
+        if reports:
+            self.log_message(f"프로파일링 보고서 저장: {', '.join(reports)}", 'SUCCESS')
+        self._update_profile_status()
+
+    def _update_profile_status(self):
+        """프로파일링 상태 표시 (기록 중이면 1초마다 남은 시간 갱신)"""
+        if self._profile_after_id:
+            self.root.after_cancel(self._profile_after_id)
+            self._profile_after_id = None
+
+        if self.current_page != 'settings':
+            return
+
+        active = self.profiler.active
+        if active:
+            remaining = self.profiler.remaining()
+            status = "기록 중" + (f" (남은 시간 {remaining:.0f}초)" if remaining is not None else "")
+        elif self.profiler.last_reports:
+            status = "최근 보고서: " + ", ".join(os.path.basename(path) for path in self.profiler.last_reports)
+        else:
+            status = f"보고서 위치: {self.profiler.output_dir}"
+
+        try:
+            self.profile_button.config(
+                text="⏹  중지 및 저장" if active else "▶  시작",
+                bg=self.COLOR_DANGER if active else self.COLOR_PRIMARY
+            )
+            self.profile_button.default_bg = self.profile_button['bg']
+            self.profile_button.hover_bg = '#C0392B' if active else '#357ABD'
+            self.profile_status_label.config(text=status)
+        except tk.TclError:
+            # 위젯이 삭제된 경우 무시
+            return
+
+        if active:
+            self._profile_after_id = self.root.after(1000, self._update_profile_status)
+
     def _show_logs_page(self):
-        """실행 로그 페이지"""
+        """실행 로그 페이지 (세션 로그 / 로그 파일)"""
         self._create_page_header("실행 로그", "API 호출 내역 및 시스템 로그를 확인합니다")
 
         content = tk.Frame(self.content_frame, bg=self.COLOR_BG)
         content.pack(fill=tk.BOTH, expand=True, padx=40, pady=20)
 
-        # 로그 카드
-        log_card = self._create_card(content, "로그")
-        log_card.pack(fill=tk.BOTH, expand=True)
+        notebook = ttk.Notebook(content)
+        notebook.pack(fill=tk.BOTH, expand=True)
 
-        log_inner = tk.Frame(log_card, bg=self.COLOR_WHITE)
-        log_inner.pack(padx=30, pady=20, fill=tk.BOTH, expand=True)
+        # 세션 로그 탭
+        log_inner = tk.Frame(notebook, bg=self.COLOR_WHITE)
+        notebook.add(log_inner, text="  세션 로그  ")
 
         self.log_text = scrolledtext.ScrolledText(
             log_inner,
@@ -615,7 +1413,7 @@ class KiwoomTokenGUI:
             borderwidth=0,
             wrap=tk.WORD
         )
-        self.log_text.pack(fill=tk.BOTH, expand=True)
+        self.log_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         self.log_text.config(state=tk.DISABLED)
 
         # 로그 색상 태그
@@ -631,6 +1429,183 @@ class KiwoomTokenGUI:
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
+        # 로그 파일 탭
+        file_inner = tk.Frame(notebook, bg=self.COLOR_WHITE)
+        notebook.add(file_inner, text="  로그 파일  ")
+        self._create_log_file_view(file_inner)
+
+    def _create_log_file_view(self, parent):
+        """로그 파일 뷰어 (필터 결과를 한 페이지씩 표시, 마지막 페이지에서는 새 줄을 따라감)"""
+        filter_frame = tk.Frame(parent, bg=self.COLOR_WHITE)
+        filter_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
+
+        tk.Label(filter_frame, text="레벨", font=('맑은 고딕', 9), bg=self.COLOR_WHITE).pack(side=tk.LEFT)
+        self.log_level_var = tk.StringVar(value="전체")
+        level_combo = ttk.Combobox(
+            filter_frame, textvariable=self.log_level_var, state='readonly', width=9,
+            values=["전체"] + [LEVEL_NAMES[code] for code in sorted(LEVEL_NAMES)]
+        )
+        level_combo.pack(side=tk.LEFT, padx=(5, 15))
+        level_combo.bind('<<ComboboxSelected>>', lambda e: self._apply_log_filter())
+
+        tk.Label(filter_frame, text="로거", font=('맑은 고딕', 9), bg=self.COLOR_WHITE).pack(side=tk.LEFT)
+        self.log_logger_var = tk.StringVar(value="")
+        self.log_logger_combo = ttk.Combobox(
+            filter_frame, textvariable=self.log_logger_var, width=22,
+            values=self.log_tail.logger_names() if self.log_tail else []
+        )
+        self.log_logger_combo.pack(side=tk.LEFT, padx=(5, 15))
+        self.log_logger_combo.bind('<<ComboboxSelected>>', lambda e: self._apply_log_filter())
+        self.log_logger_combo.bind('<Return>', lambda e: self._apply_log_filter())
+
+        tk.Label(filter_frame, text="검색", font=('맑은 고딕', 9), bg=self.COLOR_WHITE).pack(side=tk.LEFT)
+        self.log_search_var = tk.StringVar(value="")
+        search_entry = tk.Entry(
+            filter_frame, textvariable=self.log_search_var, font=('Consolas', 9),
+            bg=self.COLOR_LIGHT, relief=tk.FLAT
+        )
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0), ipady=3)
+        search_entry.bind('<Return>', lambda e: self._apply_log_filter())
+
+        nav_frame = tk.Frame(parent, bg=self.COLOR_WHITE)
+        nav_frame.pack(fill=tk.X, padx=10, pady=(0, 5))
+
+        for text, step in (("◀  이전", -1), ("다음  ▶", 1)):
+            ModernButton(
+                nav_frame, text=text, bg=self.COLOR_LIGHT, fg=self.COLOR_DARK,
+                activebackground='#D5DBDB', pady=4,
+                command=lambda step=step: self._move_log_page(step)
+            ).pack(side=tk.LEFT, padx=(0, 5))
+
+        ModernButton(
+            nav_frame, text="최신", bg=self.COLOR_PRIMARY, fg=self.COLOR_WHITE,
+            activebackground='#357ABD', pady=4,
+            command=lambda: self._request_log_page(-1)
+        ).pack(side=tk.LEFT)
+
+        self.log_page_label = tk.Label(
+            nav_frame, text="", font=('맑은 고딕', 9), bg=self.COLOR_WHITE, fg='#7F8C8D', anchor='e'
+        )
+        self.log_page_label.pack(side=tk.RIGHT)
+
+        self.log_file_text = scrolledtext.ScrolledText(
+            parent,
+            font=('Consolas', 9),
+            bg='#1E1E1E',
+            fg='#D4D4D4',
+            relief=tk.FLAT,
+            borderwidth=0,
+            wrap=tk.NONE
+        )
+        self.log_file_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.log_file_text.config(state=tk.DISABLED)
+
+        for code, color in ((1, '#808080'), (2, '#4EC9B0'), (3, '#DCDCAA'), (4, '#F48771'), (5, '#FF5555')):
+            self.log_file_text.tag_config(LEVEL_NAMES[code], foreground=color)
+
+        if self.log_tail is None:
+            self.log_tail = LogTail(self.config.get_log_file())
+        self._request_log_page(self._log_page)
+
+    def _current_log_filter(self) -> LogFilter:
+        level = self.log_level_var.get()
+        return LogFilter(
+            level_code(level) if level != "전체" else 0,
+            self.log_logger_var.get().strip(),
+            self.log_search_var.get()
+        )
+
+    def _apply_log_filter(self):
+        self._request_log_page(-1)
+
+    def _move_log_page(self, step: int):
+        if self._log_page < 0:
+            # 마지막 페이지에서는 뒤로만 이동
+            self._request_log_page(min(-1, step - 1))
+        else:
+            self._request_log_page(max(0, self._log_page + step))
+
+    def _request_log_page(self, page: int, page_size: int = 500):
+        """
+        로그 파일 한 페이지 요청 (색인 갱신 / 필터 / 읽기는 스레드에서, 표시는 메인 스레드에서)
+
+        Args:
+            page: 페이지 번호 (0부터, 음수이면 끝에서부터: -1은 마지막 페이지)
+            page_size: 페이지당 줄 수
+        """
+        request = (self._current_log_filter(), page, page_size)
+        if self._log_busy:
+            # 진행 중인 요청이 끝나면 마지막 요청만 처리
+            self._log_pending = request
+            return
+        self._log_busy = True
+        threading.Thread(target=self._load_log_page, args=request, daemon=True).start()
+
+    def _load_log_page(self, log_filter: LogFilter, page: int, page_size: int):
+        """로그 파일 색인 갱신 후 페이지 읽기 (스레드)"""
+        try:
+            with self._log_lock:
+                self.log_tail.refresh()
+                self.log_tail.set_filter(log_filter)
+                total = self.log_tail.match_count()
+                pages = max(1, (total + page_size - 1) // page_size)
+                page = max(0, min(page + pages if page < 0 else page, pages - 1))
+                lines = self.log_tail.page(page, page_size)
+                names = self.log_tail.logger_names()
+            result = (page, pages, total, lines, names)
+        except Exception as e:
+            self.logger.exception("로그 파일 읽기 실패")
+            result = e
+        self.root.after(0, lambda: self._render_log_page(result))
+
+    def _render_log_page(self, result):
+        """로그 파일 페이지 표시 (메인 스레드)"""
+        self._log_busy = False
+        if self.current_page != 'logs':
+            self._log_pending = None
+            return
+
+        if self._log_pending:
+            request, self._log_pending = self._log_pending, None
+            self._request_log_page(request[1], request[2])
+            return
+
+        try:
+            if isinstance(result, Exception):
+                self.log_page_label.config(text=f"로그 파일을 읽을 수 없습니다: {result}")
+                return
+
+            page, pages, total, lines, names = result
+            last_page = page == pages - 1
+            self._log_page = -1 if last_page else page
+            self.log_logger_combo.config(values=names)
+            self.log_page_label.config(
+                text=f"{page + 1} / {pages} 페이지  |  {total:,}줄" + ("  |  새 로그 따라가는 중" if last_page else "")
+            )
+
+            self.log_file_text.config(state=tk.NORMAL)
+            self.log_file_text.delete('1.0', tk.END)
+            for code, line in lines:
+                self.log_file_text.insert(tk.END, line + "\n", LEVEL_NAMES.get(code, ''))
+            if last_page:
+                self.log_file_text.see(tk.END)
+            self.log_file_text.config(state=tk.DISABLED)
+        except tk.TclError:
+            # 위젯이 삭제된 경우 무시
+            return
+
+        # 마지막 페이지를 보고 있으면 1초 뒤 새 줄 확인
+        if self._log_after_id:
+            self.root.after_cancel(self._log_after_id)
+            self._log_after_id = None
+        if last_page:
+            self._log_after_id = self.root.after(1000, self._follow_log)
+
+    def _follow_log(self):
+        self._log_after_id = None
+        if self.current_page == 'logs' and self._log_page == -1:
+            self._request_log_page(-1)
+
     def _create_page_header(self, title: str, description: str):
         """페이지 헤더 생성"""
         header_frame = tk.Frame(self.content_frame, bg=self.COLOR_WHITE, height=120)
@@ -685,13 +1660,63 @@ class KiwoomTokenGUI:
     def _on_env_changed(self, event):
         """환경 변경 이벤트"""
         new_env = self.env_var.get()
-        self.client.environment = new_env
-        self.client.base_url = (
-            self.client.PRODUCTION_DOMAIN if new_env == 'production'
-            else self.client.MOCK_DOMAIN
-        )
-        if hasattr(self, 'log_text'):
-            self.log_message(f"환경이 '{new_env}'로 변경되었습니다.", 'INFO')
+
+        # 활성 클라이언트만 교체 (각 환경의 토큰과 커넥션은 그대로 유지)
+        previous = self.client
+        self.clients.switch(new_env)
+        self.log_message(f"환경이 '{new_env}'로 변경되었습니다.", 'INFO')
+
+        self._update_status_label()
+
+        # 계좌 폴링 / 포트폴리오 / 시세 조회는 이전 환경 클라이언트로 만들어졌으므로 새 환경 기준으로 다시 시작
+        if self.client is not previous:
+            self._stop_account_poller()
+            self._stop_portfolio()
+            self._stop_quote_poller()
+            if self.client.is_token_valid():
+                self._start_account_poller()
+                self._start_portfolio()
+                if self.current_page == 'quotes':
+                    self._start_quote_poller()
+
+    def _update_status_label(self, text: Optional[str] = None, color: Optional[str] = None):
+        """토큰 발급 페이지의 연결 상태 표시 (기본값은 활성 클라이언트의 토큰 유효성)"""
+        if not hasattr(self, 'status_label') or not self.status_label.winfo_exists():
+            return
+        if text is None:
+            if self.client.is_token_valid():
+                text, color = "연결됨", self.COLOR_SUCCESS
+            else:
+                text, color = "미연결", self.COLOR_DANGER
+        self.status_label.config(text=text, fg=color)
+
+    def _on_token_event(self, event):
+        """클라이언트 토큰 이벤트 처리 (TkDispatcher가 메인 루프에서 호출)"""
+        messages = {
+            TOKEN_ISSUED: ("✓ 토큰 발급 성공!", 'SUCCESS'),
+            TOKEN_REFRESHED: ("✓ 토큰이 갱신되었습니다.", 'SUCCESS'),
+            TOKEN_EXPIRED: ("토큰이 만료되었습니다. 다시 발급받아 주세요.", 'WARNING'),
+            TOKEN_REVOKED: ("토큰이 폐기되었습니다.", 'WARNING'),
+        }
+        message, level = messages[event.topic]
+        self.log_message(f"[{event.source}] {message}", level)
+
+        # 다른 환경의 이벤트는 로그만 남김
+        if event.source != self.clients.active_environment:
+            return
+
+        self._update_status_label()
+        if event.topic in (TOKEN_ISSUED, TOKEN_REFRESHED):
+            self._start_account_poller()
+            self._start_portfolio()
+            if self.current_page == 'quotes':
+                self._start_quote_poller()
+        else:
+            self._stop_account_poller()
+            self._stop_portfolio()
+            self._stop_quote_poller()
+            if self.current_page == 'token_info':
+                self._switch_page('token_info')
 
     def _revoke_token(self):
         """토큰 폐기"""
@@ -705,18 +1730,9 @@ class KiwoomTokenGUI:
         )
 
         if result:
-            # 토큰 정보 초기화
-            self.client.access_token = None
-            self.client.token_type = None
-            self.client.expires_dt = None
-
+            # 토큰 정보 초기화 (상태 표시 / 폴링 중지는 폐기 이벤트에서 처리)
+            self.client.clear_token()
             self.logger.info("토큰이 폐기되었습니다.")
-            if hasattr(self, 'log_text'):
-                self.log_message("토큰이 폐기되었습니다.", 'WARNING')
-
-            # 상태 업데이트
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text="미연결", fg=self.COLOR_DANGER)
 
             messagebox.showinfo("토큰 폐기 완료", "토큰이 성공적으로 폐기되었습니다.")
 
@@ -729,14 +1745,16 @@ class KiwoomTokenGUI:
         if hasattr(self, 'log_text'):
             self.log_message("토큰 발급을 요청합니다...", 'INFO')
 
-        # 별도 스레드에서 실행
-        thread = threading.Thread(target=self._request_token_thread, daemon=True)
+        # 별도 스레드에서 실행 (발급 중 환경이 바뀌어도 요청한 환경의 클라이언트에 저장)
+        thread = threading.Thread(
+            target=self._request_token_thread, args=(self.client,), daemon=True
+        )
         thread.start()
 
-    def _request_token_thread(self):
+    def _request_token_thread(self, client):
         """토큰 발급 스레드"""
         try:
-            success, data = self.client.get_access_token()
+            success, data = client.get_access_token()
 
             # GUI 업데이트는 메인 스레드에서
             self.root.after(0, lambda: self._handle_token_response(success, data))
@@ -750,11 +1768,7 @@ class KiwoomTokenGUI:
         self.token_button.config(state=tk.NORMAL, text="🔑  토큰 발급하기")
 
         if success:
-            if hasattr(self, 'log_text'):
-                self.log_message("✓ 토큰 발급 성공!", 'SUCCESS')
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text="연결됨", fg=self.COLOR_SUCCESS)
-
+            # 로그 / 상태 표시 / 폴링 시작은 발급 이벤트에서 처리
             messagebox.showinfo("토큰 발급 성공", "토큰이 성공적으로 발급되었습니다!")
 
             # 페이지 새로고침
@@ -763,11 +1777,67 @@ class KiwoomTokenGUI:
             error_msg = data.get('error', data.get('message', '알 수 없는 오류'))
             if hasattr(self, 'log_text'):
                 self.log_message(f"✗ 토큰 발급 실패: {error_msg}", 'ERROR')
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text="연결 실패", fg=self.COLOR_DANGER)
+            self._update_status_label("연결 실패", self.COLOR_DANGER)
 
             messagebox.showerror("토큰 발급 실패", f"토큰 발급에 실패했습니다.\n\n{error_msg}")
 
+    def _start_account_poller(self):
+        """계좌 상태 자동 폴링 시작 (설정에서 활성화된 경우)"""
+        if not self.config.get_polling_enabled() or self.account_poller:
+            return
+
+        self.account_poller = AccountPoller(
+            self.client, **self.config.get_polling_intervals(), **self.config.get_polling_session()
+        )
+        self.account_poller.subscribe(self._on_account_changed)
+        self.account_poller.start()
+        self.log_message("계좌 상태 자동 폴링을 시작합니다.", 'INFO')
+
+    def _stop_account_poller(self):
+        """계좌 상태 자동 폴링 중지"""
+        if self.account_poller:
+            self.account_poller.stop()
+            self.account_poller = None
+
+    def _start_portfolio(self):
+        """포트폴리오 손익 엔진 시작 (계좌 폴링 중이면 폴링 결과로, 아니면 주기적 잔고 조회로 대사)"""
+        if self.portfolio:
+            return
+
+        self.portfolio = Portfolio(self.client)
+        # 관심종목 시세를 조회 중이면 현재가를 평가손익에 반영
+        if self.quote_poller:
+            self.portfolio.attach_quotes(self.quote_poller)
+        if self.account_poller:
+            self.portfolio.attach_poller(self.account_poller)
+        else:
+            self.portfolio.start(self.config.get_reconcile_interval())
+
+    def _stop_portfolio(self):
+        """포트폴리오 대사 중지"""
+        if self.portfolio:
+            self.portfolio.stop()
+            self.portfolio = None
+
+    def _on_condition_changed(self, event):
+        """조건검색 편입 / 이탈 로그"""
+        data = event.data
+        name = data['name'] or data['condition']
+        if data['resync']:
+            message = f"조건검색 [{name}] 재동기화 - {data['count']}종목"
+        else:
+            parts = []
+            if data['entered']:
+                parts.append(f"편입 {', '.join(data['entered'][:10])}" + (" 외" if len(data['entered']) > 10 else ""))
+            if data['exited']:
+                parts.append(f"이탈 {', '.join(data['exited'][:10])}" + (" 외" if len(data['exited']) > 10 else ""))
+            message = f"조건검색 [{name}] {' / '.join(parts)} (현재 {data['count']}종목)"
+        self.log_message(f"[{event.source}] {message}", 'INFO')
+
+    def _on_account_changed(self, account: str, feed: str, changes: dict):
+        """계좌 변경 알림 (폴링 스레드에서 호출되므로 메인 스레드로 전달)"""
+        self.root.after(0, lambda: self.log_message(f"계좌 변경 - {describe_changes(feed, changes)}", 'INFO'))
+
     def log_message(self, message: str, level: str = 'INFO'):
         """로그 메시지 추가"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -0,0 +1,348 @@
+"""
+기술적 지표
+여러 종목의 OHLCV를 NumPy 배열로 받아 SMA, EMA, RSI, VWAP, 볼린저 밴드를 계산합니다.
+
+각 지표는 종목 수만큼의 상태 배열을 유지하며 봉 하나당 O(1)로 갱신됩니다(update).
+과거 구간 일괄 계산(batch)도 같은 갱신 함수를 시간 순으로 적용하므로
+두 방식의 결과는 비트 단위로 동일하고, batch 이후 바로 update로 이어서 계산할 수 있습니다.
+
+입력 배열 모양:
+    update: (종목 수,)            - 한 봉
+    batch:  (봉 수, 종목 수)      - 과거 구간
+    거래가 없는 종목은 NaN으로 넣으면 해당 종목의 상태는 그대로 유지됩니다.
+
+numpy가 필요합니다 (pip install numpy).
+"""
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .records import Bar
+
+
+class Indicator:
+    """지표 기본 클래스"""
+
+    # update / batch에 전달할 입력 필드 (OHLCV 키)
+    inputs: Tuple[str, ...] = ("close",)
+
+    def __init__(self, n_symbols: int):
+        """
+        Args:
+            n_symbols: 종목 수
+        """
+        self.n_symbols = n_symbols
+        self._cols = np.arange(n_symbols)
+
+    def update(self, *values: np.ndarray) -> np.ndarray:
+        """
+        봉 하나 반영
+
+        Args:
+            *values: inputs 순서의 (종목 수,) 배열
+
+        Returns:
+            np.ndarray: (종목 수,) 지표 값 (계산에 필요한 봉 수가 부족하면 NaN)
+        """
+        raise NotImplementedError
+
+    def batch(self, *history: np.ndarray) -> np.ndarray:
+        """
+        과거 구간 일괄 계산 (update를 시간 순으로 적용, 상태는 마지막 봉 기준으로 유지)
+
+        Args:
+            *history: inputs 순서의 (봉 수, 종목 수) 배열
+
+        Returns:
+            np.ndarray: (봉 수, ...) 지표 값
+        """
+        length = history[0].shape[0]
+        out = None
+        for t in range(length):
+            value = self.update(*(h[t] for h in history))
+            if out is None:
+                out = np.empty((length,) + value.shape)
+            out[t] = value
+        if out is None:
+            return np.empty((0, self.n_symbols))
+        return out
+
+    def from_ohlcv(self, ohlcv: Dict[str, np.ndarray], batch: bool = False) -> np.ndarray:
+        """OHLCV Dict에서 inputs를 꺼내 update 또는 batch 호출"""
+        values = [ohlcv[name] for name in self.inputs]
+        return self.batch(*values) if batch else self.update(*values)
+
+
+class _RollingWindow:
+    """종목별 고정 길이 링 버퍼 (합계 / 제곱합 유지)"""
+
+    def __init__(self, period: int, n_symbols: int, squares: bool = False):
+        self.period = period
+        self.buffer = np.zeros((period, n_symbols))
+        self.pos = np.zeros(n_symbols, dtype=np.int64)
+        self.count = np.zeros(n_symbols, dtype=np.int64)
+        self.total = np.zeros(n_symbols)
+        self.squares = np.zeros(n_symbols) if squares else None
+
+    def push(self, x: np.ndarray, valid: np.ndarray, cols: np.ndarray):
+        value = x[valid]
+        pos = self.pos[valid]
+        old = self.buffer[pos, cols]
+
+        self.total[valid] += value - old
+        if self.squares is not None:
+            self.squares[valid] += value * value - old * old
+
+        self.buffer[pos, cols] = value
+        self.pos[valid] = (pos + 1) % self.period
+        self.count[valid] += 1
+
+    @property
+    def ready(self) -> np.ndarray:
+        return self.count >= self.period
+
+
+class SMA(Indicator):
+    """단순 이동평균"""
+
+    def __init__(self, n_symbols: int, period: int = 20):
+        super().__init__(n_symbols)
+        self.period = period
+        self._window = _RollingWindow(period, n_symbols)
+
+    def update(self, close: np.ndarray) -> np.ndarray:
+        valid = ~np.isnan(close)
+        self._window.push(close, valid, self._cols[valid])
+        return np.where(self._window.ready, self._window.total / self.period, np.nan)
+
+
+class EMA(Indicator):
+    """지수 이동평균 (처음 period개 봉의 단순 평균으로 시작)"""
+
+    def __init__(self, n_symbols: int, period: int = 20):
+        super().__init__(n_symbols)
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = np.full(n_symbols, np.nan)
+        self._seed = np.zeros(n_symbols)
+        self._count = np.zeros(n_symbols, dtype=np.int64)
+
+    def update(self, close: np.ndarray) -> np.ndarray:
+        valid = ~np.isnan(close)
+        seeding = valid & (self._count < self.period)
+        running = valid & (self._count >= self.period)
+
+        self.value[running] += self.alpha * (close[running] - self.value[running])
+
+        self._seed[seeding] += close[seeding]
+        self._count[valid] += 1
+        seeded = seeding & (self._count == self.period)
+        self.value[seeded] = self._seed[seeded] / self.period
+
+        return self.value.copy()
+
+
+class RSI(Indicator):
+    """상대강도지수 (Wilder 평활)"""
+
+    def __init__(self, n_symbols: int, period: int = 14):
+        super().__init__(n_symbols)
+        self.period = period
+        self.value = np.full(n_symbols, np.nan)
+        self._prev = np.full(n_symbols, np.nan)
+        self._gain = np.zeros(n_symbols)
+        self._loss = np.zeros(n_symbols)
+        self._count = np.zeros(n_symbols, dtype=np.int64)
+
+    def update(self, close: np.ndarray) -> np.ndarray:
+        valid = ~np.isnan(close)
+        changed = valid & ~np.isnan(self._prev)
+
+        delta = np.where(changed, close - self._prev, 0.0)
+        gain = np.maximum(delta, 0.0)
+        loss = np.maximum(-delta, 0.0)
+
+        period = self.period
+        seeding = changed & (self._count < period)
+        running = changed & (self._count >= period)
+
+        self._gain[running] = (self._gain[running] * (period - 1) + gain[running]) / period
+        self._loss[running] = (self._loss[running] * (period - 1) + loss[running]) / period
+
+        self._gain[seeding] += gain[seeding]
+        self._loss[seeding] += loss[seeding]
+        self._count[changed] += 1
+        seeded = seeding & (self._count == period)
+        self._gain[seeded] /= period
+        self._loss[seeded] /= period
+
+        updated = running | seeded
+        avg_gain = self._gain[updated]
+        avg_loss = self._loss[updated]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        # 하락이 없으면 100, 변동이 없으면 50
+        rsi = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), rsi)
+        self.value[updated] = rsi
+
+        self._prev[valid] = close[valid]
+        return self.value.copy()
+
+
+class VWAP(Indicator):
+    """거래량 가중 평균가 (세션 단위 누적, 대표가 = (고가 + 저가 + 종가) / 3)"""
+
+    inputs = ("high", "low", "close", "volume")
+
+    def __init__(self, n_symbols: int):
+        super().__init__(n_symbols)
+        self._pv = np.zeros(n_symbols)
+        self._volume = np.zeros(n_symbols)
+
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """세션 시작 (mask가 있으면 해당 종목만)"""
+        if mask is None:
+            self._pv[:] = 0.0
+            self._volume[:] = 0.0
+        else:
+            self._pv[mask] = 0.0
+            self._volume[mask] = 0.0
+
+    def update(self, high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        valid = ~(np.isnan(close) | np.isnan(volume))
+        typical = (high[valid] + low[valid] + close[valid]) / 3.0
+        self._pv[valid] += typical * volume[valid]
+        self._volume[valid] += volume[valid]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self._volume > 0, self._pv / self._volume, np.nan)
+
+    def batch(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        session_start: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        과거 구간 일괄 계산
+
+        Args:
+            session_start: (봉 수,) bool 배열, True인 봉에서 누적을 초기화 (예: 일자가 바뀌는 첫 분봉)
+        """
+        if session_start is None:
+            return super().batch(high, low, close, volume)
+
+        out = np.empty(close.shape)
+        for t in range(close.shape[0]):
+            if session_start[t]:
+                self.reset()
+            out[t] = self.update(high[t], low[t], close[t], volume[t])
+        return out
+
+
+class BollingerBands(Indicator):
+    """볼린저 밴드 (중심선 = SMA, 폭 = k × 모표준편차)"""
+
+    def __init__(self, n_symbols: int, period: int = 20, k: float = 2.0):
+        super().__init__(n_symbols)
+        self.period = period
+        self.k = k
+        self._window = _RollingWindow(period, n_symbols, squares=True)
+
+    def update(self, close: np.ndarray) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: (3, 종목 수) - 중심선, 상단, 하단
+        """
+        valid = ~np.isnan(close)
+        window = self._window
+        window.push(close, valid, self._cols[valid])
+
+        mean = window.total / self.period
+        # 누적 오차로 음수가 되는 경우 방지
+        variance = np.maximum(window.squares / self.period - mean * mean, 0.0)
+        width = self.k * np.sqrt(variance)
+
+        bands = np.stack((mean, mean + width, mean - width))
+        bands[:, ~window.ready] = np.nan
+        return bands
+
+
+class IndicatorSet:
+    """여러 지표를 OHLCV 봉 단위로 함께 갱신"""
+
+    def __init__(self, indicators: Dict[str, Indicator]):
+        """
+        Args:
+            indicators: {이름: 지표} (예: {"sma20": SMA(n, 20), "rsi14": RSI(n, 14)})
+        """
+        self.indicators = indicators
+
+    def update(self, bar: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        봉 하나 반영
+
+        Args:
+            bar: {"open", "high", "low", "close", "volume"} 각 (종목 수,) 배열
+
+        Returns:
+            Dict[str, np.ndarray]: 지표별 값
+        """
+        return {name: indicator.from_ohlcv(bar) for name, indicator in self.indicators.items()}
+
+    def batch(self, ohlcv: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """과거 구간 일괄 계산 (각 배열은 (봉 수, 종목 수))"""
+        return {name: indicator.from_ohlcv(ohlcv, batch=True) for name, indicator in self.indicators.items()}
+
+
+# 키움 차트 응답 필드 → OHLCV
+_CHART_FIELDS = {
+    "open": "open_pric",
+    "high": "high_pric",
+    "low": "low_pric",
+    "close": "cur_prc",
+    "volume": "trde_qty",
+}
+
+
+def chart_rows_to_ohlcv(rows: Iterable[Dict], time_key: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    차트 TR 응답 행을 시간 오름차순 OHLCV 배열로 변환
+
+    Args:
+        rows: 차트 응답의 목록 필드 (예: stk_dt_pole_chart_qry, 최신 봉이 먼저)
+        time_key: 정렬 기준 필드 (None이면 'cntr_tm' → 'dt' 순으로 존재하는 필드)
+
+    Returns:
+        Dict[str, np.ndarray]: {"time", "open", "high", "low", "close", "volume"} 각 (봉 수,) 배열
+    """
+    # 행을 Bar 구조화 배열로 한 번에 변환한 뒤 열별 연속 배열로 나눔 (Bar 객체는 만들지 않음)
+    bars = Bar.array_from_rows("", rows, time_key)
+    ohlcv = {"time": bars["time"]}
+    for name in _CHART_FIELDS:
+        ohlcv[name] = np.ascontiguousarray(bars[name])
+    return ohlcv
+
+
+def stack_symbols(series: Sequence[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    종목별 OHLCV(같은 봉 시각)를 (봉 수, 종목 수) 배열로 합침
+
+    Args:
+        series: 종목 순서대로 chart_rows_to_ohlcv 결과
+
+    Returns:
+        Dict[str, np.ndarray]: 필드별 (봉 수, 종목 수) 배열 (길이가 짧은 종목은 앞쪽을 NaN으로 채움)
+    """
+    length = max(len(s["close"]) for s in series)
+    stacked = {}
+    for name in _CHART_FIELDS:
+        out = np.full((length, len(series)), np.nan)
+        for col, s in enumerate(series):
+            values = s[name]
+            out[length - len(values):, col] = values
+        stacked[name] = out
+    return stacked
@@ -0,0 +1,114 @@
+"""
+JSON 코덱
+설치된 고속 JSON 라이브러리(orjson, ujson)를 우선 사용하고, 없으면 표준 json 모듈을 사용합니다.
+요청 본문은 bytes로 직렬화하고, 응답은 bytes에서 바로 파싱합니다.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional, Union
+
+
+class JsonCodec:
+    """표준 json 모듈 코덱"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """객체를 UTF-8 JSON bytes로 직렬화"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """JSON bytes(또는 str) 파싱"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson 코덱 (bytes 입출력)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """ujson 코덱"""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._dumps = ujson.dumps
+        self._loads = ujson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+# 우선순위 순서
+CODECS = {
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+    "json": JsonCodec,
+}
+
+_cache: Dict[str, JsonCodec] = {}
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    JSON 코덱 가져오기
+
+    Args:
+        name: 코덱 이름 ('orjson', 'ujson', 'json'), None 또는 'auto'이면 설치된 것 중 가장 빠른 코덱
+
+    Returns:
+        JsonCodec: 코덱 인스턴스 (지정한 라이브러리가 없으면 표준 json으로 대체)
+    """
+    key = name or "auto"
+    if key in _cache:
+        return _cache[key]
+
+    candidates = list(CODECS) if key == "auto" else [key, "json"]
+
+    codec = None
+    for candidate in candidates:
+        codec_class = CODECS.get(candidate)
+        if codec_class is None:
+            continue
+        try:
+            codec = codec_class()
+            break
+        except ImportError:
+            continue
+
+    if key not in ("auto", codec.name):
+        logging.getLogger(__name__).warning(
+            f"JSON 코덱 '{key}'을(를) 사용할 수 없어 '{codec.name}'을(를) 사용합니다."
+        )
+
+    _cache[key] = codec
+    return codec
+
+
+def available_codecs() -> Dict[str, JsonCodec]:
+    """설치되어 사용 가능한 모든 코덱"""
+    codecs = {}
+    for name, codec_class in CODECS.items():
+        try:
+            codecs[name] = codec_class()
+        except ImportError:
+            continue
+    return codecs
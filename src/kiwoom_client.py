@@ -3,12 +3,50 @@
 OAuth 인증 및 토큰 관리를 담당합니다.
 """
 
-import requests
-import json
-from datetime import datetime
+import math
+import threading
+import time
 from typing import Dict, Optional, Tuple
 import logging
 
+from .rate_limiter import RateLimiter
+from .records import Token
+from .return_codes import (
+    AUTH_EXPIRED, INVALID, OK, SERVER_ERROR, THROTTLED, classify, describe_failure, parse_body
+)
+from .response_cache import ResponseCache
+from .json_codec import JsonCodec, get_codec
+from .metrics import ClientMetrics
+from .connection_warmer import ConnectionWarmer
+from .adaptive_timeout import AdaptiveTimeouts, HedgePolicy
+from .event_bus import (
+    EventBus, BREAKER_OPENED, REQUEST_COMPLETED, TOKEN_EXPIRED, TOKEN_ISSUED, TOKEN_REFRESHED, TOKEN_REVOKED
+)
+from .transport import (
+    Transport, TransportConnectionError, TransportError, TransportTimeout, create_transport
+)
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class _InflightCall:
+    """진행 중인 조회 요청 (병합된 호출자들이 결과를 기다림)"""
+
+    __slots__ = ('done', 'result')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Tuple[bool, Dict] = (False, {"error": "요청이 완료되지 않았습니다."})
+
+
+class _SendSignal:
+    """헤징 대상 첫 요청의 상태 (호출 제한 대기를 마치고 실제로 전송했는지, 호출 제한 재시도 중인지)"""
+
+    __slots__ = ('sent', 'throttled')
+
+    def __init__(self):
+        self.sent = threading.Event()
+        self.throttled = False
+
 
 class KiwoomAPIClient:
     """키움증권 REST API 클라이언트"""
@@ -19,13 +57,45 @@ class KiwoomAPIClient:
 
     # API 엔드포인트
     TOKEN_ENDPOINT = "/oauth2/token"
-
-    def __init__(self, appkey: str, secretkey: str, environment: str = "mock"):
+    CHART_ENDPOINT = "/api/dostk/chart"
+
+    # 주문 엔드포인트 (요청 병합 / 캐시 제외)
+    WRITE_ENDPOINTS = ("/api/dostk/ordr", "/api/dostk/crdordr")
+
+    # 기본 초당 호출 제한
+    DEFAULT_RATE_LIMIT = 5.0
+
+    # 호출 제한 초과 응답 재시도 횟수 / 첫 대기 시간 (초, 시도마다 배로 증가)
+    THROTTLE_RETRIES = 3
+    THROTTLE_BACKOFF = 0.25
+
+    # 연속 서버 오류가 이 횟수에 이르면 BREAKER_COOLDOWN초 동안 호출하지 않고 바로 실패
+    BREAKER_THRESHOLD = 5
+    BREAKER_COOLDOWN = 10.0
+
+    def __init__(
+        self,
+        appkey: str,
+        secretkey: str,
+        environment: str = "mock",
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        codec: Optional[JsonCodec] = None,
+        pool_size: int = 10,
+        transport: Optional[Transport] = None,
+        event_bus: Optional[EventBus] = None
+    ):
         """
         Args:
             appkey: 발급받은 App Key
             secretkey: 발급받은 Secret Key
             environment: 'production' 또는 'mock' (기본값: 'mock')
+            rate_limiter: TR 호출에 공통 적용할 호출 제한기 (None이면 기본값 사용)
+            cache: 기준정보 응답 캐시 (None이면 캐시 사용 안 함)
+            codec: 요청/응답 JSON 코덱 (None이면 설치된 가장 빠른 코덱)
+            pool_size: 호스트당 커넥션 풀 크기 (transport를 지정하면 무시)
+            transport: HTTP 전송 계층 (None이면 requests 기반 HTTP/1.1)
+            event_bus: 토큰 / 요청 이벤트를 발행할 버스 (None이면 클라이언트 전용 버스 생성)
         """
         self.appkey = appkey
         self.secretkey = secretkey
@@ -37,10 +107,49 @@ class KiwoomAPIClient:
             else self.MOCK_DOMAIN
         )
 
-        # 토큰 정보
-        self.access_token: Optional[str] = None
-        self.token_type: Optional[str] = None
-        self.expires_dt: Optional[str] = None
+        # 토큰 정보 (만료 일시는 발급 시 한 번만 파싱)
+        self.token: Optional[Token] = None
+        self._expiry_timer: Optional[threading.Timer] = None
+        self._refresh_lock = threading.Lock()
+
+        # 연속 서버 오류 / 서킷 브레이커
+        self._server_errors = 0
+        self._breaker_until = 0.0
+        self._breaker_lock = threading.Lock()
+
+        # 토큰 발급 / 갱신 / 만료 / 폐기, 요청 완료 이벤트
+        self.events = event_bus or EventBus()
+
+        # HTTP 전송 계층 (커넥션 재사용, HTTP/2 사용 시 요청 다중화)
+        self.transport = transport or create_transport("http1", pool_size)
+        self.last_request_at = time.monotonic()
+        self.warmer: Optional[ConnectionWarmer] = None
+        # 조건검색 실시간 수신 (ConditionSearchFeed, close() 시 함께 종료)
+        self.condition_feed = None
+
+        # 호출 제한기 (모든 TR 호출이 하나의 예산을 공유)
+        self.rate_limiter = rate_limiter or RateLimiter(self.DEFAULT_RATE_LIMIT)
+
+        # 응답 캐시
+        self.cache = cache
+
+        # JSON 코덱
+        self.codec = codec or get_codec()
+
+        # 호출 지표 / 진행 중인 조회 요청
+        self.metrics = ClientMetrics()
+        self._inflight: Dict[str, _InflightCall] = {}
+        # False이면 진행 중인 동일 요청에 병합하지 않고 모두 전송 (부하 측정용)
+        self.coalescing = True
+        self._inflight_lock = threading.Lock()
+
+        # 관측된 지연 기반 타임아웃 / 조회 요청 헤징 (enable_hedging으로 활성화)
+        self.timeouts = AdaptiveTimeouts(self.metrics)
+        self.hedge_policy: Optional[HedgePolicy] = None
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_slots = 0
+        self._hedge_active = 0
+        self._hedge_lock = threading.Lock()
 
         # 로거 설정
         self.logger = logging.getLogger(__name__)
@@ -67,49 +176,50 @@ class KiwoomAPIClient:
         try:
             self.logger.info(f"토큰 발급 요청 시작 - 환경: {self.environment}")
             self.logger.debug(f"요청 URL: {url}")
+            self.last_request_at = time.monotonic()
 
-            response = requests.post(
+            response = self.transport.post(
                 url,
                 headers=headers,
-                json=payload,
-                timeout=10
+                body=self.codec.dumps(payload),
+                timeout=(self.timeouts.max_connect, self.timeouts.max_read)
             )
 
             self.logger.info(f"응답 상태 코드: {response.status_code}")
 
-            # 응답 처리
-            if response.status_code == 200:
-                data = response.json()
-
+            # 응답 처리 (HTTP 200이어도 return_code가 0이 아니면 실패)
+            data = parse_body(response, self.codec)
+            outcome, _, _ = classify(response.status_code, data)
+            if outcome == OK:
                 # 토큰 정보 저장
-                self.access_token = data.get("token")
-                self.token_type = data.get("token_type")
-                self.expires_dt = data.get("expires_dt")
+                topic = TOKEN_REFRESHED if self.access_token else TOKEN_ISSUED
+                self.token = Token.from_response(data)
 
                 self.logger.info("토큰 발급 성공")
                 self.logger.info(f"토큰 만료 일시: {self.expires_dt}")
 
+                self._schedule_expiry()
+                self.events.publish(
+                    topic, self.environment, token_type=self.token_type, expires_dt=self.expires_dt
+                )
+
                 return True, data
             else:
-                error_data = {
-                    "status_code": response.status_code,
-                    "message": response.text,
-                    "url": url
-                }
+                error_data = describe_failure(response, url, data)
                 self.logger.error(f"토큰 발급 실패: {error_data}")
                 return False, error_data
 
-        except requests.exceptions.Timeout:
+        except TransportTimeout:
             error_msg = "요청 시간 초과 (Timeout)"
             self.logger.error(error_msg)
             return False, {"error": error_msg}
 
-        except requests.exceptions.ConnectionError:
+        except TransportConnectionError:
             error_msg = "네트워크 연결 오류"
             self.logger.error(error_msg)
             return False, {"error": error_msg}
 
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             error_msg = f"요청 중 오류 발생: {str(e)}"
             self.logger.error(error_msg)
             return False, {"error": error_msg}
@@ -119,25 +229,425 @@ class KiwoomAPIClient:
             self.logger.exception(error_msg)
             return False, {"error": error_msg}
 
-    def is_token_valid(self) -> bool:
+    def call_api(
+        self,
+        api_id: str,
+        endpoint: str,
+        body: Dict,
+        cont_yn: str = "N",
+        next_key: str = ""
+    ) -> Tuple[bool, Dict]:
         """
-        현재 토큰이 유효한지 확인
+        TR API 호출 (발급된 토큰 필요)
+
+        조회 요청은 캐시를 먼저 확인하고, 동일한 요청(TR 코드, 본문, 연속조회 키)이
+        이미 진행 중이면 새로 보내지 않고 그 결과를 함께 받습니다.
+
+        Args:
+            api_id: TR 코드 (예: 'ka10081')
+            endpoint: API 엔드포인트 경로
+            body: 요청 본문
+            cont_yn: 연속조회 여부 ('Y' / 'N')
+            next_key: 연속조회 키
 
         Returns:
-            bool: 토큰 유효 여부
+            Tuple[bool, Dict]: (성공 여부, 응답 데이터 또는 에러 정보)
+                성공 시 {"body": 응답 본문, "cont_yn": 연속조회 여부, "next_key": 연속조회 키}
+                캐시되거나 병합된 응답은 공유 객체이므로 수정하지 마세요.
         """
-        if not self.access_token or not self.expires_dt:
-            return False
+        if not self.is_read_request(endpoint):
+            return self._send_api(api_id, endpoint, body, cont_yn, next_key)
+
+        request_key = ResponseCache.make_key(self.environment, api_id, body, cont_yn, next_key)
+
+        # 캐시 대상이면 네트워크 호출 없이 반환
+        cacheable = self.cache is not None and self.cache.is_cacheable(api_id)
+        if cacheable:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                self.logger.debug(f"[{api_id}] 캐시 적중")
+                return True, cached
+
+        # 진행 중인 동일 요청이 있으면 결과를 기다림
+        with self._inflight_lock:
+            call = self._inflight.get(request_key) if self.coalescing else None
+            is_leader = call is None
+            if is_leader:
+                call = _InflightCall()
+                if self.coalescing:
+                    self._inflight[request_key] = call
+
+        if not is_leader:
+            call.done.wait()
+            self.metrics.record_coalesced(api_id)
+            self.logger.debug(f"[{api_id}] 진행 중인 요청에 병합")
+            return call.result
 
         try:
-            # 만료 일시 파싱 (YYYYMMDDHHmmss 형식)
-            expire_time = datetime.strptime(self.expires_dt, "%Y%m%d%H%M%S")
-            current_time = datetime.now()
+            if self.hedge_policy is not None:
+                call.result = self._send_hedged(api_id, endpoint, body, cont_yn, next_key)
+            else:
+                call.result = self._send_api(api_id, endpoint, body, cont_yn, next_key)
+            success, result = call.result
+            if success and cacheable:
+                self.cache.put(api_id, request_key, result)
+            return call.result
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(request_key) is call:
+                    del self._inflight[request_key]
+            call.done.set()
+
+    def warm_up(
+        self,
+        connections: int = 4,
+        keepalive_interval: float = 60.0,
+        dns_ttl: float = 300.0
+    ) -> ConnectionWarmer:
+        """
+        백그라운드에서 DNS 캐시 및 커넥션 예열 시작 (즉시 반환)
+
+        Args:
+            connections: 미리 열어둘 커넥션 수
+            keepalive_interval: 유휴 keep-alive 주기 (초, 0이면 사용 안 함)
+            dns_ttl: DNS 캐시 유지 시간 (초)
+
+        Returns:
+            ConnectionWarmer: 예열기 (stop()으로 keep-alive 중지)
+        """
+        if self.warmer is not None:
+            self.warmer.stop()
+
+        self.warmer = ConnectionWarmer(self, connections, keepalive_interval, dns_ttl)
+        self.warmer.start()
+        return self.warmer
+
+    def close(self):
+        """백그라운드 작업 종료 (커넥션 keep-alive, 조건검색 실시간 수신)"""
+        if self.warmer is not None:
+            self.warmer.stop()
+            self.warmer = None
+        if self.condition_feed is not None:
+            self.condition_feed.close()
+            self.condition_feed = None
+
+    def is_read_request(self, endpoint: str) -> bool:
+        """조회 요청 여부 (주문 엔드포인트는 병합/캐시 대상이 아님)"""
+        return endpoint not in self.WRITE_ENDPOINTS
+
+    def _send_api(
+        self,
+        api_id: str,
+        endpoint: str,
+        body: Dict,
+        cont_yn: str,
+        next_key: str,
+        signal: Optional[_SendSignal] = None
+    ) -> Tuple[bool, Dict]:
+        """
+        TR API 네트워크 호출 (call_api 참조)
+
+        응답의 결과 유형(return_codes)에 따라 호출 제한 초과는 감속 후 재시도, 토큰 만료는 재발급 후 한 번 재시도,
+        잘못된 요청은 바로 실패, 연속 서버 오류는 서킷 브레이커로 잠시 호출을 멈춥니다.
+        실패 응답에는 "outcome"(결과 유형)이 들어 있습니다.
+        """
+        if time.monotonic() < self._breaker_until:
+            return False, {
+                "error": "서버 오류가 이어져 호출을 잠시 중단했습니다 (서킷 브레이커)",
+                "outcome": SERVER_ERROR
+            }
+
+        throttled = 0
+        refreshed = False
+        while True:
+            token = self.token
+            success, result = self._send_once(api_id, endpoint, body, cont_yn, next_key, signal)
+            outcome = OK if success else result.get("outcome", SERVER_ERROR)
+            self._record_outcome(outcome)
+
+            if outcome == THROTTLED and throttled < self.THROTTLE_RETRIES:
+                if signal is not None:
+                    # 호출 예산이 모자란 상황이므로 헤징 요청을 보내지 않음
+                    signal.throttled = True
+                # 호출 제한기 감속 (다른 작업자도 같은 제한기를 쓰므로 함께 느려짐)
+                self.rate_limiter.penalize()
+                delay = self.THROTTLE_BACKOFF * (2 ** throttled)
+                throttled += 1
+                self.logger.warning(
+                    f"[{api_id}] 호출 제한 초과 - {delay:.2f}초 후 재시도 ({throttled}/{self.THROTTLE_RETRIES}), "
+                    f"호출 제한 {self.rate_limiter.rate:.2f}/초"
+                )
+                time.sleep(delay)
+                continue
+
+            if outcome == AUTH_EXPIRED and not refreshed:
+                refreshed = True
+                self.logger.warning(f"[{api_id}] 토큰 만료 응답 - 토큰 재발급 후 재시도")
+                if self.refresh_token(token):
+                    continue
+
+            return success, result
+
+    def _send_once(
+        self,
+        api_id: str,
+        endpoint: str,
+        body: Dict,
+        cont_yn: str,
+        next_key: str,
+        signal: Optional[_SendSignal] = None
+    ) -> Tuple[bool, Dict]:
+        """TR API 요청 한 번 전송 (signal이 있으면 호출 제한 대기 후 실제 전송 시점에 알림)"""
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            headers = {
+                "Content-Type": "application/json;charset=UTF-8",
+                "api-id": api_id,
+                "cont-yn": cont_yn,
+                "next-key": next_key,
+            }
+            headers.update(self.get_authorization_header())
+        except ValueError as e:
+            self.logger.error(f"[{api_id}] {e}")
+            return False, {"error": str(e), "outcome": INVALID}
+
+        self.rate_limiter.acquire()
+        if signal is not None:
+            signal.sent.set()
+
+        started = time.perf_counter()
+        self.last_request_at = time.monotonic()
+        elapsed = None
+        success = False
+        try:
+            self.logger.debug(f"[{api_id}] 요청 URL: {url} (cont-yn={cont_yn})")
+
+            response = self.transport.post(
+                url,
+                headers=headers,
+                body=self.codec.dumps(body),
+                timeout=self.timeouts.get(api_id)
+            )
+            elapsed = time.perf_counter() - started
+
+            data = parse_body(response, self.codec)
+            outcome, _, _ = classify(response.status_code, data)
+            if outcome == OK:
+                success = True
+                return True, {
+                    "body": data,
+                    "cont_yn": response.headers.get("cont-yn", "N"),
+                    "next_key": response.headers.get("next-key", ""),
+                }
+
+            error_data = describe_failure(response, url, data)
+            self.logger.error(f"[{api_id}] 호출 실패: {error_data}")
+            return False, error_data
+
+        except TransportTimeout:
+            error_msg = "요청 시간 초과 (Timeout)"
+            self.logger.error(f"[{api_id}] {error_msg}")
+            return False, {"error": error_msg, "outcome": SERVER_ERROR}
+
+        except TransportConnectionError:
+            error_msg = "네트워크 연결 오류"
+            self.logger.error(f"[{api_id}] {error_msg}")
+            return False, {"error": error_msg, "outcome": SERVER_ERROR}
+
+        except TransportError as e:
+            error_msg = f"요청 중 오류 발생: {str(e)}"
+            self.logger.error(f"[{api_id}] {error_msg}")
+            return False, {"error": error_msg, "outcome": SERVER_ERROR}
 
-            return current_time < expire_time
         except Exception as e:
-            self.logger.error(f"토큰 유효성 검사 중 오류: {e}")
-            return False
+            error_msg = f"예상치 못한 오류: {str(e)}"
+            self.logger.exception(f"[{api_id}] {error_msg}")
+            return False, {"error": error_msg, "outcome": SERVER_ERROR}
+
+        finally:
+            self.metrics.record_request(api_id, elapsed, success)
+            if self.events.has_subscribers(REQUEST_COMPLETED):
+                self.events.publish(
+                    REQUEST_COMPLETED, self.environment, api_id=api_id, elapsed=elapsed, success=success
+                )
+
+    def _record_outcome(self, outcome: str):
+        """연속 서버 오류 집계 (임계값에 이르면 서킷 브레이커를 열고 BREAKER_OPENED 발행)"""
+        if outcome == SERVER_ERROR:
+            with self._breaker_lock:
+                self._server_errors += 1
+                if self._server_errors < self.BREAKER_THRESHOLD:
+                    return
+                failures = self._server_errors
+                self._server_errors = 0
+                self._breaker_until = time.monotonic() + self.BREAKER_COOLDOWN
+            self.logger.error(
+                f"[{self.environment}] 서버 오류 {failures}회 연속 - {self.BREAKER_COOLDOWN:.0f}초 동안 호출 중단"
+            )
+            self.events.publish(
+                BREAKER_OPENED, self.environment, failures=failures, cooldown=self.BREAKER_COOLDOWN
+            )
+        elif self._server_errors:
+            with self._breaker_lock:
+                self._server_errors = 0
+
+    def refresh_token(self, stale: Optional[Token] = None) -> bool:
+        """
+        토큰 재발급 (동시에 여러 요청이 만료 응답을 받아도 한 번만 발급)
+
+        Args:
+            stale: 만료 응답을 받은 요청이 사용한 토큰 (이미 다른 토큰으로 바뀌었으면 재발급하지 않음)
+
+        Returns:
+            bool: 사용할 수 있는 토큰이 있는지 여부
+        """
+        with self._refresh_lock:
+            current = self.token
+            if current is not None and current is not stale and current.is_valid():
+                return True
+            success, _ = self.get_access_token()
+            return success
+
+    def enable_hedging(self, percentile: float = 95, budget_ratio: float = 0.05) -> HedgePolicy:
+        """
+        조회 요청 헤징 활성화
+
+        첫 요청이 실제로 전송된 뒤(호출 제한 대기 이후) TR 코드의 지연 백분위수(percentile)를 넘기면
+        같은 요청을 한 번 더 보내 먼저 성공한 응답을 사용합니다. 헤징 요청은 일반 요청 수의 budget_ratio 이내로 제한됩니다.
+        동시에 헤징 대상이 되는 요청은 커넥션 풀 크기까지이며, 그 이상은 헤징 없이 호출 스레드에서 바로 보냅니다.
+
+        Args:
+            percentile: 헤징 기준 백분위수
+            budget_ratio: 일반 요청 대비 최대 헤징 비율
+
+        Returns:
+            HedgePolicy: 헤징 정책 (get_stats()로 통계 확인)
+        """
+        self.hedge_policy = HedgePolicy(self.metrics, percentile, budget_ratio)
+        if self._hedge_executor is None:
+            # 첫 요청과 헤징 요청이 각각 실행기 스레드를 쓰므로 풀 크기의 두 배
+            self._hedge_slots = max(1, getattr(self.transport, "pool_size", 10))
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=self._hedge_slots * 2, thread_name_prefix="hedge"
+            )
+        return self.hedge_policy
+
+    def _send_hedged(
+        self,
+        api_id: str,
+        endpoint: str,
+        body: Dict,
+        cont_yn: str,
+        next_key: str
+    ) -> Tuple[bool, Dict]:
+        """헤징 조회 (첫 요청이 전송 후 기준 지연을 넘기면 두 번째 요청 전송)"""
+        policy = self.hedge_policy
+        delay = policy.hedge_delay(api_id)
+        if delay is None:
+            return self._send_api(api_id, endpoint, body, cont_yn, next_key)
+
+        # 실행기가 포화되면 첫 요청이 실행기 대기열에서 기다리는 동안 헤징이 잘못 나가므로 헤징하지 않음
+        with self._hedge_lock:
+            saturated = self._hedge_active >= self._hedge_slots
+            if not saturated:
+                self._hedge_active += 1
+        if saturated:
+            return self._send_api(api_id, endpoint, body, cont_yn, next_key)
+
+        try:
+            policy.record_primary()
+            signal = _SendSignal()
+            primary = self._hedge_executor.submit(
+                self._send_api, api_id, endpoint, body, cont_yn, next_key, signal
+            )
+            primary.add_done_callback(lambda _: signal.sent.set())
+
+            # 기준 지연은 전송 후 응답 시간이므로 호출 제한 대기가 끝나 실제로 전송된 시점부터 잼
+            signal.sent.wait()
+            done, _ = wait([primary], timeout=delay)
+            if done or signal.throttled or not policy.try_spend():
+                return primary.result()
+
+            self.logger.debug(f"[{api_id}] 응답 지연 {delay * 1000:.0f}ms 초과 - 헤징 요청 전송")
+            hedge = self._hedge_executor.submit(self._send_api, api_id, endpoint, body, cont_yn, next_key)
+
+            # 먼저 성공한 응답 사용 (둘 다 실패하면 첫 요청의 결과)
+            pending = {primary, hedge}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    success, result = future.result()
+                    if success:
+                        if future is hedge:
+                            policy.record_win()
+                        return success, result
+            return primary.result()
+        finally:
+            with self._hedge_lock:
+                self._hedge_active -= 1
+
+    def get_metrics(self) -> Dict:
+        """
+        호출 지표 반환
+
+        Returns:
+            Dict: TR 코드별 호출/오류/병합 횟수와 응답 지연, 캐시 통계
+        """
+        metrics = self.metrics.snapshot()
+        if self.cache is not None:
+            metrics["cache"] = self.cache.get_stats()
+        if self.hedge_policy is not None:
+            metrics["hedging"] = self.hedge_policy.get_stats()
+        return metrics
+
+    def is_token_valid(self) -> bool:
+        """
+        현재 토큰이 유효한지 확인
+
+        Returns:
+            bool: 토큰 유효 여부
+        """
+        token = self.token
+        return token is not None and token.is_valid()
+
+    def clear_token(self):
+        """토큰 정보 초기화 (폐기 이벤트 발행)"""
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+            self._expiry_timer = None
+
+        had_token = self.access_token is not None
+        self.token = None
+
+        if had_token:
+            self.events.publish(TOKEN_REVOKED, self.environment)
+
+    def _schedule_expiry(self):
+        """토큰 만료 시각에 만료 이벤트를 발행하도록 타이머 예약"""
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+            self._expiry_timer = None
+
+        token = self.token
+        if token is None or not math.isfinite(token.deadline):
+            return
+
+        # 너무 먼 만료 시각은 대기 상한까지만 기다린 뒤 다시 예약
+        delay = min(token.remaining(), threading.TIMEOUT_MAX, 86400 * 7)
+        self._expiry_timer = threading.Timer(delay, self._on_token_expired)
+        self._expiry_timer.daemon = True
+        self._expiry_timer.start()
+
+    def _on_token_expired(self):
+        if not self.access_token:
+            return
+        if self.is_token_valid():
+            self._schedule_expiry()
+            return
+
+        self.logger.warning(f"[{self.environment}] 토큰이 만료되었습니다.")
+        self.events.publish(TOKEN_EXPIRED, self.environment, expires_dt=self.expires_dt)
 
     def get_authorization_header(self) -> Dict[str, str]:
         """
@@ -146,13 +656,43 @@ class KiwoomAPIClient:
         Returns:
             Dict[str, str]: Authorization 헤더
         """
-        if not self.access_token:
+        token = self.token
+        if token is None or not token.token:
             raise ValueError("토큰이 발급되지 않았습니다.")
 
         return {
-            "Authorization": f"{self.token_type} {self.access_token}"
+            "Authorization": token.authorization
         }
 
+    # 이전 속성 호환 (토큰 필드를 바꾸면 새 Token으로 교체)
+    @property
+    def access_token(self) -> Optional[str]:
+        return self.token.token if self.token is not None else None
+
+    @access_token.setter
+    def access_token(self, value: Optional[str]):
+        self._replace_token(token=value)
+
+    @property
+    def token_type(self) -> Optional[str]:
+        return self.token.token_type if self.token is not None else None
+
+    @token_type.setter
+    def token_type(self, value: Optional[str]):
+        self._replace_token(token_type=value)
+
+    @property
+    def expires_dt(self) -> Optional[str]:
+        return self.token.expires_dt if self.token is not None else None
+
+    @expires_dt.setter
+    def expires_dt(self, value: Optional[str]):
+        self._replace_token(expires_dt=value)
+
+    def _replace_token(self, **changes):
+        token = (self.token or Token(None, None, None)).replace(**changes)
+        self.token = token if (token.token or token.token_type or token.expires_dt) else None
+
     def get_token_info(self) -> Dict:
         """
         현재 토큰 정보 반환
@@ -160,9 +700,6 @@ class KiwoomAPIClient:
         Returns:
             Dict: 토큰 정보
         """
-        return {
-            "token": self.access_token,
-            "token_type": self.token_type,
-            "expires_dt": self.expires_dt,
-            "is_valid": self.is_token_valid()
-        }
+        if self.token is None:
+            return {"token": None, "token_type": None, "expires_dt": None, "is_valid": False}
+        return self.token.to_dict()
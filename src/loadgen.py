@@ -0,0 +1,423 @@
+"""
+부하 생성기
+KiwoomAPIClient 하나로 초당 몇 건까지 처리할 수 있는지, 어느 지점에서 지연이 나빠지는지 측정합니다.
+로컬 대역 서버(benchmarks/standin_server.py) 또는 기록된 카세트(src/recording.py)를 대상으로,
+가상 작업자 수 / 요청 구성 / 도착률(개방형 또는 폐쇄형)을 정해 호출하고 처리량, 지연 백분위수, 오류율을 JSON으로 남깁니다.
+
+- 폐쇄형(--rate 0): 작업자마다 응답을 받으면 (--think 후) 다음 요청을 보냄
+- 개방형(--rate R): 응답과 관계없이 초당 R건(포아송 도착)을 예정하고, 지연은 예정 시각부터 잼
+  (작업자가 밀리면 대기 시간도 지연에 포함되므로 포화 지점이 그대로 드러남)
+- --rate 50,100,200처럼 여러 값을 주면 단계별로 차례로 측정
+- 같은 요청이 동시에 나가면 클라이언트가 하나로 병합하므로 처리량에는 병합된 호출도 포함됨
+  (단계마다 병합 수를 함께 출력하며, --no-coalesce이면 병합하지 않고 모두 전송)
+
+실행:
+    python benchmarks/standin_server.py --port 8900 &
+    python -m src.loadgen --url http://127.0.0.1:8900 --workers 32 --rate 100,200,400 --output results.json
+    python -m src.loadgen --cassette cassettes/day.jsonl.gz --speed 1 --workers 64 --duration 60
+    python -m src.loadgen --url http://127.0.0.1:8900 --compare results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from queue import SimpleQueue
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .kiwoom_client import KiwoomAPIClient
+from .metrics import LatencyWindow
+from .rate_limiter import RateLimiter
+from .records import Token
+from .recording import ReplayTransport, call_args, is_token_request
+from .transport import create_transport
+
+RESULT_VERSION = 1
+
+# 요청 구성에 쓸 수 있는 TR (TR 코드 → (엔드포인트, 본문 생성 함수))
+REQUEST_TEMPLATES: Dict[str, Tuple[str, Callable[[str], Dict]]] = {
+    "ka10001": ("/api/dostk/stkinfo", lambda symbol: {"stk_cd": symbol}),
+    "ka10081": ("/api/dostk/chart", lambda symbol: {"stk_cd": symbol, "base_dt": "", "upd_stkpc_tp": "1"}),
+    "ka10080": ("/api/dostk/chart", lambda symbol: {"stk_cd": symbol, "tic_scope": "1", "upd_stkpc_tp": "1"}),
+    "kt00018": ("/api/dostk/acnt", lambda symbol: {"qry_tp": "1", "dmst_stex_tp": "KRX"}),
+}
+
+DEFAULT_SYMBOLS = "005930,000660,035420,035720,005380,051910,006400,068270,105560,055550"
+
+# 표본 수 제한 없음 (측정 구간 동안의 모든 호출)
+_UNBOUNDED = 10 ** 9
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    """'ka10081=3,ka10001=1' → [(TR 코드, 가중치)]"""
+    mix = []
+    for item in spec.split(","):
+        api_id, _, weight = item.strip().partition("=")
+        if api_id not in REQUEST_TEMPLATES:
+            raise ValueError(f"알 수 없는 TR 코드: {api_id} (사용 가능: {', '.join(REQUEST_TEMPLATES)})")
+        mix.append((api_id, float(weight or 1)))
+    return mix
+
+
+class RequestSource:
+    """요청 생성 (요청 구성 가중치 또는 카세트의 호출을 무작위로 선택)"""
+
+    def __init__(self, mix: List[Tuple[str, float]], symbols: List[str], records: Optional[List[Dict]], seed: int):
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls = [call_args(r) for r in records if not is_token_request(r)] if records else None
+        self._api_ids = [api_id for api_id, _ in mix]
+        self._weights = [weight for _, weight in mix]
+        self._symbols = symbols
+
+    def next(self) -> Tuple[str, str, Dict, str, str]:
+        """call_api 인자 (api_id, endpoint, body, cont_yn, next_key)"""
+        with self._lock:
+            if self._calls:
+                return self._rng.choice(self._calls)
+            api_id = self._rng.choices(self._api_ids, self._weights)[0]
+            symbol = self._rng.choice(self._symbols)
+        endpoint, make_body = REQUEST_TEMPLATES[api_id]
+        return api_id, endpoint, make_body(symbol), "N", ""
+
+
+class StageResult:
+    """한 단계의 측정 결과 (여러 스레드에서 기록)"""
+
+    def __init__(self):
+        self.latency = LatencyWindow(_UNBOUNDED)
+        self.by_api: Dict[str, LatencyWindow] = {}
+        self.errors: Dict[str, int] = {}
+        self.api_errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, api_id: str, latency: float, success: bool, result: Dict):
+        with self._lock:
+            window = self.by_api.get(api_id)
+            if window is None:
+                window = self.by_api[api_id] = LatencyWindow(_UNBOUNDED)
+            if not success:
+                if "return_code" in result:
+                    kind = f"{result['outcome']} (return_code {result['return_code']})"
+                elif "status_code" in result:
+                    kind = f"HTTP {result['status_code']}"
+                else:
+                    kind = result.get("error", "unknown")
+                self.errors[kind] = self.errors.get(kind, 0) + 1
+                self.api_errors[api_id] = self.api_errors.get(api_id, 0) + 1
+        window.add(latency)
+        self.latency.add(latency)
+
+    def to_dict(self, mode: str, rate: float, duration: float, coalesced: int = 0) -> Dict:
+        def latency_ms(window: LatencyWindow) -> Dict[str, float]:
+            return {name: round(seconds * 1000, 3) for name, seconds in window.percentiles((50, 90, 99)).items()}
+
+        requests = len(self.latency)
+        errors = sum(self.errors.values())
+        return {
+            "mode": mode,
+            "target_rate": rate,
+            "duration": round(duration, 3),
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 6) if requests else 0.0,
+            "throughput": round(requests / duration, 2) if duration else 0.0,
+            "coalesced": coalesced,
+            "latency_ms": latency_ms(self.latency),
+            "errors_by_type": self.errors,
+            "by_api": {
+                api_id: {
+                    "requests": len(window),
+                    "errors": self.api_errors.get(api_id, 0),
+                    "latency_ms": latency_ms(window),
+                }
+                for api_id, window in sorted(self.by_api.items())
+            },
+        }
+
+
+def _issue(client: KiwoomAPIClient, source: RequestSource, result: StageResult, started: float, measure_from: float):
+    """요청 하나 실행 (지연은 started부터, measure_from 이전에 예정된 요청은 워밍업으로 제외)"""
+    args = source.next()
+    success, data = client.call_api(*args)
+    latency = time.monotonic() - started
+    if started >= measure_from:
+        result.record(args[0], latency, success, data)
+
+
+def run_sync(client, source, workers: int, rate: float, duration: float, warmup: float, think: float) -> StageResult:
+    """스레드 작업자로 한 단계 실행"""
+    result = StageResult()
+    began = time.monotonic()
+    measure_from = began + warmup
+    deadline = measure_from + duration
+
+    if rate <= 0:
+        # 폐쇄형: 작업자마다 연속 호출
+        def closed_worker():
+            while True:
+                started = time.monotonic()
+                if started >= deadline:
+                    return
+                _issue(client, source, result, started, measure_from)
+                if think:
+                    time.sleep(think)
+
+        threads = [threading.Thread(target=closed_worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return result
+
+    # 개방형: 예정 시각을 큐에 넣고 작업자가 꺼내 실행
+    schedule: SimpleQueue = SimpleQueue()
+
+    def open_worker():
+        while True:
+            scheduled = schedule.get()
+            if scheduled is None:
+                return
+            _issue(client, source, result, scheduled, measure_from)
+
+    threads = [threading.Thread(target=open_worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    rng = random.Random(1)
+    scheduled = began
+    while scheduled < deadline:
+        delay = scheduled - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        schedule.put(scheduled)
+        scheduled += rng.expovariate(rate)
+
+    for _ in threads:
+        schedule.put(None)
+    for thread in threads:
+        thread.join()
+    return result
+
+
+async def _run_async(client, source, workers: int, rate: float, duration: float, warmup: float, think: float):
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loadgen")
+    result = StageResult()
+    began = time.monotonic()
+    measure_from = began + warmup
+    deadline = measure_from + duration
+
+    async def issue(started: float):
+        await loop.run_in_executor(executor, _issue, client, source, result, started, measure_from)
+
+    try:
+        if rate <= 0:
+            async def closed_worker():
+                while time.monotonic() < deadline:
+                    await issue(time.monotonic())
+                    if think:
+                        await asyncio.sleep(think)
+
+            await asyncio.gather(*(closed_worker() for _ in range(workers)))
+        else:
+            # 동시 실행은 작업자 수로 제한, 대기 시간은 지연에 포함
+            rng = random.Random(1)
+            tasks = []
+            scheduled = began
+            while scheduled < deadline:
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.ensure_future(issue(scheduled)))
+                scheduled += rng.expovariate(rate)
+            await asyncio.gather(*tasks)
+    finally:
+        executor.shutdown(wait=True)
+    return result
+
+
+def run_async(client, source, workers: int, rate: float, duration: float, warmup: float, think: float) -> StageResult:
+    """asyncio 이벤트 루프로 한 단계 실행 (클라이언트 호출은 작업자 수만큼의 스레드 풀에서)"""
+    return asyncio.run(_run_async(client, source, workers, rate, duration, warmup, think))
+
+
+def build_client(args, target_url: Optional[str]) -> KiwoomAPIClient:
+    """부하 대상 클라이언트 (대역 서버 또는 카세트 재생)"""
+    if args.cassette:
+        transport = ReplayTransport(args.cassette, speed=args.speed)
+    else:
+        prior_knowledge = args.http == "http2" and target_url.startswith("http://")
+        transport = create_transport(args.http, pool_size=args.workers, prior_knowledge=prior_knowledge)
+
+    client = KiwoomAPIClient(
+        "loadgen", "loadgen",
+        rate_limiter=RateLimiter(args.client_rate),
+        transport=transport
+    )
+    client.coalescing = not args.no_coalesce
+    if target_url:
+        client.base_url = target_url
+
+    success, data = client.get_access_token()
+    if not success:
+        if not args.cassette:
+            raise RuntimeError(f"토큰 발급 실패: {data}")
+        # 토큰 발급 이후부터 기록된 카세트
+        client.token = Token("loadgen", "Bearer", None)
+    return client
+
+
+def compare(current: Dict, baseline: Dict) -> List[str]:
+    """단계별 처리량 / 지연 / 오류율 비교 (같은 순서의 단계끼리)"""
+    def change(new: float, old: float) -> str:
+        if not old:
+            return "-"
+        return f"{(new - old) / old * 100:+.1f}%"
+
+    lines = [f"{'단계':<6}{'처리량(rps)':>22}{'p50(ms)':>22}{'p99(ms)':>22}{'오류율':>18}"]
+    for index, (new, old) in enumerate(zip(current["stages"], baseline["stages"])):
+        cells = []
+        for key in ("throughput", "p50", "p99"):
+            new_value = new[key] if key == "throughput" else new["latency_ms"].get(key, 0.0)
+            old_value = old[key] if key == "throughput" else old["latency_ms"].get(key, 0.0)
+            cells.append(f"{old_value:>8.1f} → {new_value:>8.1f} {change(new_value, old_value):>7}")
+        cells.append(f"{old['error_rate']:>7.2%} → {new['error_rate']:>7.2%}")
+        lines.append(f"{index + 1:<6}" + "".join(f"{cell:>22}" for cell in cells))
+    if len(current["stages"]) != len(baseline["stages"]):
+        lines.append(f"단계 수가 다릅니다 (이번 {len(current['stages'])}, 기준 {len(baseline['stages'])})")
+    return lines
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.loadgen", description="KiwoomAPIClient 부하 생성기")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="대역 서버 주소 (예: http://127.0.0.1:8900)")
+    target.add_argument("--standin", action="store_true",
+                        help="benchmarks/standin_server.py를 같은 프로세스에서 실행 (GIL을 공유하므로 참고용)")
+    target.add_argument("--cassette", help="재생할 카세트 파일 (src/recording.py)")
+
+    parser.add_argument("--workers", type=int, default=16, help="가상 작업자 수 (기본값: 16)")
+    parser.add_argument("--rate", default="0",
+                        help="개방형 도착률 (초당 요청 수, 쉼표로 여러 단계, 0이면 폐쇄형, 기본값: 0)")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간 (초, 기본값: 10)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="단계별 워밍업 시간 (초, 기본값: 2)")
+    parser.add_argument("--think", type=float, default=0.0, help="폐쇄형에서 요청 사이 대기 (초)")
+    parser.add_argument("--mode", choices=("sync", "async"), default="sync", help="작업자 방식 (기본값: sync)")
+    parser.add_argument("--mix", default="ka10081=3,ka10001=1",
+                        help="요청 구성 'TR=가중치,...' (카세트 대상이면 카세트의 호출 사용)")
+    parser.add_argument("--symbols", default=DEFAULT_SYMBOLS, help="요청에 쓸 종목코드 (쉼표로 구분)")
+    parser.add_argument("--http", choices=("http1", "http2", "auto"), default="http1", help="전송 프로토콜")
+    parser.add_argument("--client-rate", type=float, default=0.0,
+                        help="클라이언트 호출 제한 (초당, 0이면 제한 없음, 기본값: 0)")
+    parser.add_argument("--speed", type=float, default=1.0, help="카세트 응답 시간 배속 (0이면 기다리지 않음)")
+    parser.add_argument("--latency", type=float, default=20.0, help="--standin 응답 지연 (ms)")
+    parser.add_argument("--seed", type=int, default=7, help="요청 선택 난수 시드")
+    parser.add_argument("--no-coalesce", action="store_true",
+                        help="동일 요청 병합을 끄고 모든 호출을 전송 (처리량이 실제 전송 수만 셈)")
+    parser.add_argument("--verbose", action="store_true", help="요청 실패 로그 출력")
+    parser.add_argument("--output", help="결과 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    rates = [float(rate) for rate in args.rate.split(",")]
+
+    server = None
+    target_url = args.url
+    if args.standin:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+        from standin_server import StandinServer
+        server = StandinServer(latency=args.latency / 1000).start_background()
+        target_url = server.url
+
+    if not args.verbose:
+        # 실패는 결과에 오류 종류별로 집계되므로 요청마다 남기는 오류 로그는 끔
+        logging.getLogger(KiwoomAPIClient.__module__).setLevel(logging.CRITICAL)
+
+    try:
+        client = build_client(args, target_url)
+    except RuntimeError as e:
+        print(e)
+        if server is not None:
+            server.stop()
+        return 1
+    records = client.transport.records if args.cassette else None
+    source = RequestSource(
+        parse_mix(args.mix), [s.strip() for s in args.symbols.split(",") if s.strip()], records, args.seed
+    )
+    runner = run_async if args.mode == "async" else run_sync
+
+    stages = []
+    try:
+        for rate in rates:
+            label = f"개방형 {rate:g}rps" if rate > 0 else "폐쇄형"
+            print(f"[{label}] 작업자 {args.workers}, 워밍업 {args.warmup:g}초 + 측정 {args.duration:g}초 ...", flush=True)
+            coalesced = client.metrics.snapshot()["total"]["coalesced"]
+            result = runner(client, source, args.workers, rate, args.duration, args.warmup, args.think)
+            # 병합 수는 워밍업 구간을 포함한 단계 전체 기준
+            coalesced = client.metrics.snapshot()["total"]["coalesced"] - coalesced
+            stage = result.to_dict(args.mode, rate, args.duration, coalesced)
+            stages.append(stage)
+
+            latency = stage["latency_ms"]
+            print(f"  처리량 {stage['throughput']:,.1f}rps, 요청 {stage['requests']:,}건, "
+                  f"오류율 {stage['error_rate']:.2%}, 지연(ms) p50 {latency.get('p50', 0):.2f} / "
+                  f"p90 {latency.get('p90', 0):.2f} / p99 {latency.get('p99', 0):.2f} / max {latency.get('max', 0):.2f}")
+            if coalesced:
+                print(f"  병합 {coalesced:,}건 (워밍업 포함, 전송하지 않고 진행 중인 같은 요청의 결과를 받은 호출)")
+            for kind, count in stage["errors_by_type"].items():
+                print(f"  오류 {kind}: {count}건")
+    finally:
+        client.transport.close()
+        if server is not None:
+            server.stop()
+
+    report = {
+        "loadgen": RESULT_VERSION,
+        "started_at": datetime.now().isoformat(timespec='seconds'),
+        "config": {
+            "target": "cassette" if args.cassette else "url",
+            "url": target_url,
+            "cassette": args.cassette,
+            "workers": args.workers,
+            "rates": rates,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "think": args.think,
+            "mode": args.mode,
+            "mix": args.mix,
+            "http": args.http,
+            "client_rate": args.client_rate,
+            "speed": args.speed,
+            "coalescing": client.coalescing,
+        },
+        "stages": stages,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n기준 결과와 비교: {args.compare}")
+        for line in compare(report, baseline):
+            print(line)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""
+로그 파일 색인
+Logger가 쓰는 로그 파일과 회전된 백업을 mmap으로 읽어 줄 시작 위치 / 레벨 / 로거 이름 색인을 만들고,
+파일이 늘어나면 새로 추가된 부분만 이어서 색인합니다.
+레벨 / 로거 / 텍스트 필터 결과도 새 줄에 대해서만 이어서 계산하므로, 수십 MB 로그도 화면에는 한 페이지만 올라갑니다.
+
+Windows에서는 열린 파일을 회전(이름 변경)할 수 없으므로, 파일은 읽을 때만 열고 바로 닫습니다.
+압축된 조각(.gz / .zst)은 내용이 바뀌지 않으므로 한 번만 풀어서 색인하고, 최근에 읽은 두 개만 메모리에 둡니다.
+"""
+
+import logging
+import mmap
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .log_rotation import read_segment, rotated_segments
+
+# 레벨 코드 (levelno // 10, 0은 알 수 없음)
+LEVEL_CODES = {b"DEBUG": 1, b"INFO": 2, b"WARNING": 3, b"ERROR": 4, b"CRITICAL": 5}
+LEVEL_NAMES = {code: name.decode() for name, code in LEVEL_CODES.items()}
+
+# Logger 포맷 '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'의 고정 위치
+_LEVEL_START = 22
+_NAME_START = 33
+_SEPARATOR = b" | "
+
+
+def level_code(name: str) -> int:
+    """레벨 이름 → 레벨 코드 (알 수 없으면 0)"""
+    return LEVEL_CODES.get(name.upper().encode(), 0)
+
+
+@lru_cache(maxsize=2)
+def _decompressed(path: str, identity: Tuple[int, int]) -> bytes:
+    """압축된 조각 내용 (식별자가 같으면 다시 풀지 않음)"""
+    return read_segment(Path(path))
+
+
+class LogFile:
+    """
+    로그 파일 하나의 줄 색인
+
+    줄 번호 i의 시작 위치는 offsets[i], 끝은 offsets[i + 1]입니다.
+    여러 줄 레코드(예외 traceback)의 이어지는 줄은 앞 레코드의 레벨 / 로거를 물려받습니다.
+    """
+
+    def __init__(self, path: Path, names: Dict[str, int]):
+        """
+        Args:
+            path: 로그 파일 경로
+            names: 로거 이름 → 번호 (여러 파일이 공유)
+        """
+        self.path = path
+        self.names = names
+        self.offsets = array('Q', [0])
+        self.levels = bytearray()
+        self.name_ids = array('H')
+        self.identity: Optional[Tuple[int, int]] = None
+        self.generation = 0
+        self.compressed = path.suffix in (".gz", ".zst")
+
+    @property
+    def line_count(self) -> int:
+        return len(self.levels)
+
+    @property
+    def indexed_bytes(self) -> int:
+        return self.offsets[-1]
+
+    def reset(self):
+        self.offsets = array('Q', [0])
+        self.levels = bytearray()
+        self.name_ids = array('H')
+        self.generation += 1
+
+    def _name_id(self, name: bytes) -> int:
+        key = name.decode('utf-8', 'replace')
+        name_id = self.names.get(key)
+        if name_id is None:
+            name_id = self.names[key] = len(self.names) + 1
+        return name_id
+
+    def refresh(self) -> int:
+        """
+        새로 추가된 줄 색인 (마지막 줄바꿈까지만, 쓰는 중인 줄은 다음에)
+
+        Returns:
+            int: 새로 색인한 줄 수 (파일이 잘리거나 바뀌었으면 처음부터 다시 색인)
+        """
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return 0
+
+        identity = (stat.st_dev, stat.st_ino)
+        if self.compressed:
+            # 압축된 조각은 바뀌지 않으므로 한 번만 색인
+            if identity == self.identity:
+                return 0
+            self.identity = identity
+            self.reset()
+        else:
+            if identity != self.identity or stat.st_size < self.indexed_bytes:
+                self.identity = identity
+                self.reset()
+            if stat.st_size == self.indexed_bytes:
+                return 0
+
+        with self._buffer() as buffer:
+            return self._index(buffer, len(buffer))
+
+    @contextmanager
+    def _buffer(self):
+        """파일 내용 (일반 파일은 mmap, 압축된 조각은 푼 내용)"""
+        if self.compressed:
+            yield _decompressed(str(self.path), self.identity)
+            return
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+    def _index(self, buffer, size: int) -> int:
+        offsets, levels, name_ids = self.offsets, self.levels, self.name_ids
+        level = levels[-1] if levels else 0
+        name_id = name_ids[-1] if name_ids else 0
+        start = offsets[-1]
+        added = 0
+
+        while start < size:
+            end = buffer.find(b"\n", start, size)
+            if end < 0:
+                break
+            # 'YYYY-MM-DD HH:MM:SS | ' 로 시작하면 새 레코드, 아니면 이어지는 줄
+            if end - start > _NAME_START and buffer[start + 19:start + _LEVEL_START] == _SEPARATOR:
+                level = LEVEL_CODES.get(bytes(buffer[start + _LEVEL_START:start + _NAME_START - 3]).rstrip(), 0)
+                name_end = buffer.find(_SEPARATOR, start + _NAME_START, end)
+                name_id = self._name_id(buffer[start + _NAME_START:name_end]) if name_end > 0 else 0
+            start = end + 1
+            offsets.append(start)
+            levels.append(level)
+            name_ids.append(name_id)
+            added += 1
+        return added
+
+    def read_lines(self, first: int, last: int) -> List[str]:
+        """줄 first ~ last-1 읽기"""
+        if first >= last:
+            return []
+        with self._buffer() as buffer:
+            data = buffer[self.offsets[first]:self.offsets[last]]
+        return [line.decode('utf-8', 'replace').rstrip('\r') for line in data.split(b"\n")[:last - first]]
+
+    def search(self, needle: bytes, first_line: int) -> List[int]:
+        """
+        first_line 이후 needle이 포함된 줄 번호 (mmap에서 바로 검색)
+
+        Returns:
+            List[int]: 오름차순 줄 번호
+        """
+        if first_line >= self.line_count or not needle:
+            return []
+        end = self.offsets[-1]
+        found = []
+        with self._buffer() as buffer:
+            position = buffer.find(needle, self.offsets[first_line], end)
+            while position >= 0:
+                line = bisect_right(self.offsets, position) - 1
+                found.append(line)
+                # 같은 줄의 다른 일치는 건너뜀
+                position = buffer.find(needle, self.offsets[line + 1], end)
+        return found
+
+
+class LogFilter:
+    """레벨 / 로거 / 텍스트 필터"""
+
+    __slots__ = ('min_level', 'logger', 'text')
+
+    def __init__(self, min_level: int = 0, logger: str = "", text: str = ""):
+        """
+        Args:
+            min_level: 최소 레벨 코드 (0이면 전체)
+            logger: 로거 이름 (비우면 전체, 하위 로거 포함)
+            text: 포함할 문자열 (대소문자 구분)
+        """
+        self.min_level = min_level
+        self.logger = logger
+        self.text = text
+
+    def __eq__(self, other):
+        return (isinstance(other, LogFilter)
+                and (self.min_level, self.logger, self.text) == (other.min_level, other.logger, other.text))
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.min_level or self.logger or self.text)
+
+
+class LogTail:
+    """
+    로그 파일과 회전된 백업을 하나로 이어 보는 색인 (오래된 백업 → 현재 파일 순)
+
+    색인은 파일 식별자(장치, inode)로 보관하므로 회전으로 이름만 바뀐 백업은 다시 색인하지 않습니다.
+    """
+
+    def __init__(self, log_file: str, include_backups: bool = True):
+        """
+        Args:
+            log_file: 현재 로그 파일 경로 (Logger의 log_file)
+            include_backups: 회전된 조각(압축본 포함)도 포함할지 여부
+        """
+        self.path = Path(log_file)
+        self.include_backups = include_backups
+        self.logger = logging.getLogger(__name__)
+
+        self.names: Dict[str, int] = {}
+        self.files: List[LogFile] = []
+        self._by_identity: Dict[Tuple[int, int], LogFile] = {}
+
+        # 파일별 필터 결과: id(LogFile) → (색인 세대, 일치 줄 번호, 확인한 줄 수)
+        self._filter = LogFilter()
+        self._matches: Dict[int, Tuple[int, array, int]] = {}
+
+    def _discover(self) -> List[Path]:
+        """오래된 순서의 로그 파일 경로"""
+        paths = rotated_segments(str(self.path)) if self.include_backups else []
+        if self.path.exists():
+            paths.append(self.path)
+        return paths
+
+    def refresh(self) -> bool:
+        """
+        파일 목록 / 색인 갱신
+
+        Returns:
+            bool: 변경 여부 (새 줄, 회전, 백업 삭제)
+        """
+        files = []
+        changed = False
+        for path in self._discover():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            identity = (stat.st_dev, stat.st_ino)
+            log_file = self._by_identity.get(identity)
+            if log_file is None:
+                log_file = LogFile(path, self.names)
+                changed = True
+            log_file.path = path
+            try:
+                changed |= log_file.refresh() > 0
+            except (OSError, ValueError, EOFError) as e:
+                # 비어 있는 파일 mmap 등
+                self.logger.debug(f"로그 파일 색인 건너뜀 ({path}): {e}")
+            files.append(log_file)
+
+        if [id(f) for f in files] != [id(f) for f in self.files]:
+            changed = True
+            live = {id(f) for f in files}
+            for key in [k for k in self._matches if k not in live]:
+                del self._matches[key]
+        self.files = files
+        self._by_identity = {f.identity: f for f in files if f.identity}
+        return changed
+
+    @property
+    def line_count(self) -> int:
+        return sum(f.line_count for f in self.files)
+
+    def logger_names(self) -> List[str]:
+        return sorted(self.names)
+
+    def set_filter(self, log_filter: LogFilter):
+        """필터 변경 (기존 필터 결과 폐기)"""
+        if log_filter != self._filter:
+            self._filter = log_filter
+            self._matches.clear()
+
+    def _update_matches(self, log_file: LogFile) -> array:
+        """파일의 필터 결과를 새 줄까지 이어서 계산"""
+        key = id(log_file)
+        generation, matches, first = self._matches.get(key, (None, None, 0))
+        if generation != log_file.generation:
+            matches, first = array('L'), 0
+        last = log_file.line_count
+        if first == last:
+            self._matches[key] = (log_file.generation, matches, last)
+            return matches
+
+        log_filter = self._filter
+        if log_filter.is_empty:
+            matches.extend(range(first, last))
+        else:
+            if log_filter.text:
+                candidates = log_file.search(log_filter.text.encode('utf-8'), first)
+                candidates = [i for i in candidates if i < last]
+            else:
+                candidates = range(first, last)
+
+            levels, name_ids = log_file.levels, log_file.name_ids
+            min_level = log_filter.min_level
+            name_filter = None
+            if log_filter.logger:
+                prefix = log_filter.logger + "."
+                name_filter = {
+                    name_id for name, name_id in self.names.items()
+                    if name == log_filter.logger or name.startswith(prefix)
+                }
+            matches.extend(
+                i for i in candidates
+                if levels[i] >= min_level and (name_filter is None or name_ids[i] in name_filter)
+            )
+
+        self._matches[key] = (log_file.generation, matches, last)
+        return matches
+
+    def match_count(self) -> int:
+        """현재 필터에 맞는 줄 수"""
+        return sum(len(self._update_matches(f)) for f in self.files)
+
+    def page(self, page: int, page_size: int = 500) -> List[Tuple[int, str]]:
+        """
+        필터 결과 한 페이지 읽기
+
+        Args:
+            page: 페이지 번호 (0부터, 음수이면 끝에서부터: -1은 마지막 페이지)
+            page_size: 페이지당 줄 수
+
+        Returns:
+            List[Tuple[int, str]]: (레벨 코드, 줄 내용)
+        """
+        per_file = [(f, self._update_matches(f)) for f in self.files]
+        total = sum(len(m) for _, m in per_file)
+        pages = max(1, (total + page_size - 1) // page_size)
+        if page < 0:
+            page += pages
+        start = max(0, min(page, pages - 1)) * page_size
+        end = min(start + page_size, total)
+
+        lines = []
+        for log_file, matches in per_file:
+            if start >= len(matches):
+                start -= len(matches)
+                end -= len(matches)
+                continue
+            selected = matches[start:min(end, len(matches))]
+            # 연속된 줄은 한 번에 읽음
+            run_start = 0
+            for i in range(1, len(selected) + 1):
+                if i == len(selected) or selected[i] != selected[i - 1] + 1:
+                    texts = log_file.read_lines(selected[run_start], selected[i - 1] + 1)
+                    lines.extend(
+                        (log_file.levels[line], text)
+                        for line, text in zip(selected[run_start:i], texts)
+                    )
+                    run_start = i
+            end -= len(matches)
+            start = 0
+            if end <= 0:
+                break
+        return lines
@@ -0,0 +1,251 @@
+"""
+로그 파일 회전 / 압축
+크기 또는 시각 기준으로 로그 파일을 회전하고, 회전된 조각은 백그라운드 스레드에서 gzip / zstd로 압축합니다.
+로그를 쓰는 스레드는 파일 이름 하나만 바꾸고 바로 돌아가며, 압축과 보관 정리(개수 / 합계 크기)는 기다리지 않습니다.
+
+회전된 조각 이름: <로그 파일>.<YYYYMMDD-HHMMSS>[.gz|.zst]
+(이전 RotatingFileHandler의 <로그 파일>.1, .2, ... 백업도 보관 정리와 뷰어에서 함께 다룹니다)
+"""
+
+import gzip
+import logging
+import os
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from logging.handlers import BaseRotatingHandler
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSED_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+_SEGMENT_PATTERN = re.compile(r"^(?:(\d+)|(\d{8}-\d{6})(?:-(\d+))?)(\.gz|\.zst)?$")
+
+
+def rotated_segments(log_file: str) -> List[Path]:
+    """
+    회전된 조각 목록 (오래된 순)
+
+    압축 중이라 원본과 압축본이 함께 있으면 원본만 포함합니다.
+
+    Args:
+        log_file: 현재 로그 파일 경로
+
+    Returns:
+        List[Path]: 조각 경로
+    """
+    base = Path(log_file)
+    prefix = base.name + "."
+    found = {}
+    for path in base.parent.glob(prefix + "*"):
+        match = _SEGMENT_PATTERN.match(path.name[len(prefix):])
+        if not match:
+            continue
+        number, stamp, sequence, suffix = match.groups()
+        # 이전 번호 백업은 시각 조각보다 오래된 것으로, 번호가 클수록 오래된 것으로 정렬
+        key = (0, -int(number), 0) if number else (1, stamp, int(sequence or 0))
+        if key not in found or not suffix:
+            found[key] = path
+    return [found[key] for key in sorted(found)]
+
+
+def read_segment(path: Path) -> bytes:
+    """회전된 조각 전체 읽기 (압축본은 풀어서)"""
+    if path.suffix == ".gz":
+        with gzip.open(path, 'rb') as f:
+            return f.read()
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise OSError(f"zstandard 패키지가 없어 읽을 수 없습니다: {path.name}")
+        with open(path, 'rb') as f:
+            return zstandard.ZstdDecompressor().stream_reader(f).read()
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class SegmentCompressor:
+    """회전된 조각을 백그라운드 스레드에서 압축하고 보관 정리"""
+
+    def __init__(
+        self,
+        log_file: str,
+        compression: str = "gzip",
+        backup_count: int = 5,
+        max_total_bytes: int = 0
+    ):
+        """
+        Args:
+            log_file: 현재 로그 파일 경로
+            compression: 'gzip', 'zstd', 'none' (zstd는 zstandard 필요, 없으면 gzip)
+            backup_count: 보관할 조각 수 (0이면 제한 없음)
+            max_total_bytes: 보관할 조각의 합계 크기 (0이면 제한 없음)
+        """
+        if compression == "zstd" and zstandard is None:
+            logging.getLogger(__name__).warning("zstandard 패키지가 없어 gzip으로 압축합니다.")
+            compression = "gzip"
+        self.log_file = log_file
+        self.compression = compression
+        self.backup_count = backup_count
+        self.max_total_bytes = max_total_bytes
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="log-compressor", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Optional[str] = None):
+        """조각 압축 요청 (None이면 보관 정리만)"""
+        self._queue.put(path)
+
+    def submit_existing(self):
+        """이전 실행에서 압축하지 못한 조각 압축 요청"""
+        for path in rotated_segments(self.log_file):
+            if path.suffix not in (".gz", ".zst"):
+                self.submit(str(path))
+        self.submit(None)
+
+    def _run(self):
+        # 이 스레드에서 로그를 남기면 로그 파일 회전과 교착될 수 있으므로 오류는 stderr로만 출력
+        while True:
+            path = self._queue.get()
+            try:
+                if path and self.compression in COMPRESSED_SUFFIXES:
+                    self._compress(path)
+                self._enforce_retention()
+            except Exception as e:
+                # 압축 라이브러리 오류(zstandard.ZstdError 등)에도 스레드가 끝나지 않도록 모든 예외를 잡음
+                try:
+                    sys.stderr.write(f"로그 조각 압축 / 정리 실패 ({path}): {e}\n")
+                    sys.stderr.flush()
+                except Exception:
+                    pass
+
+    def _compress(self, path: str):
+        if not os.path.exists(path):
+            return
+        target = path + COMPRESSED_SUFFIXES[self.compression]
+        temp = target + ".tmp"
+        try:
+            with open(path, 'rb') as src:
+                if self.compression == "zstd":
+                    with open(temp, 'wb') as raw, zstandard.ZstdCompressor(level=3).stream_writer(raw) as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+                else:
+                    with gzip.open(temp, 'wb', compresslevel=6) as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+        except BaseException:
+            # 압축하다 만 임시 파일은 지우고 원본 조각은 그대로 둠
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            raise
+        os.replace(temp, target)
+        os.remove(path)
+
+    def _enforce_retention(self):
+        """개수 / 합계 크기를 넘는 오래된 조각 삭제"""
+        segments = rotated_segments(self.log_file)
+        keep_bytes = 0
+        for index, path in enumerate(reversed(segments)):
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            keep_bytes += size
+            over_count = self.backup_count and index >= self.backup_count
+            # 가장 최근 조각 하나는 크기와 관계없이 보관
+            over_bytes = self.max_total_bytes and index > 0 and keep_bytes > self.max_total_bytes
+            if over_count or over_bytes:
+                path.unlink()
+
+
+class CompressingRotatingFileHandler(BaseRotatingHandler):
+    """
+    크기 / 시각 기준 회전 파일 핸들러
+
+    회전 시 현재 파일을 시각이 붙은 이름으로 한 번만 바꾸고(백업 번호를 밀어내는 연쇄 이름 변경 없음),
+    압축과 보관 정리는 SegmentCompressor 스레드에 맡깁니다.
+    """
+
+    WHEN = ("midnight", "hourly", "none")
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 0,
+        when: str = "midnight",
+        backup_count: int = 5,
+        max_total_bytes: int = 0,
+        compression: str = "gzip",
+        encoding: str = 'utf-8'
+    ):
+        """
+        Args:
+            filename: 로그 파일 경로
+            max_bytes: 파일 최대 크기 (0이면 크기 기준 회전 안 함)
+            when: 시각 기준 회전 ('midnight', 'hourly', 'none')
+            backup_count: 보관할 조각 수 (0이면 제한 없음)
+            max_total_bytes: 보관할 조각 합계 크기 (0이면 제한 없음)
+            compression: 'gzip', 'zstd', 'none'
+            encoding: 파일 인코딩
+        """
+        if when not in self.WHEN:
+            raise ValueError(f"지원하지 않는 회전 주기: {when} (midnight, hourly, none)")
+        super().__init__(filename, 'a', encoding=encoding)
+        self.max_bytes = max_bytes
+        self.when = when
+        self.compressor = SegmentCompressor(filename, compression, backup_count, max_total_bytes)
+        self.compressor.submit_existing()
+
+        # 기존 파일의 마지막 기록 시각 기준으로 다음 회전 시각 계산 (전날 기록된 파일이면 첫 기록에서 바로 회전)
+        try:
+            started = os.path.getmtime(filename) if os.path.getsize(filename) else time.time()
+        except OSError:
+            started = time.time()
+        self.rollover_at = self._next_rollover(started)
+
+    def _next_rollover(self, now: float) -> Optional[float]:
+        current = datetime.fromtimestamp(now)
+        if self.when == "midnight":
+            return (current.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)).timestamp()
+        if self.when == "hourly":
+            return (current.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).timestamp()
+        return None
+
+    def shouldRollover(self, record) -> bool:
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            # 레코드를 두 번 포맷하지 않도록 현재 크기만 확인 (한 레코드만큼 넘칠 수 있음)
+            if self.stream.tell() >= self.max_bytes:
+                return True
+        return False
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            segment = f"{self.baseFilename}.{stamp}"
+            sequence = 1
+            while any(os.path.exists(segment + suffix) for suffix in ("", ".gz", ".zst")):
+                segment = f"{self.baseFilename}.{stamp}-{sequence}"
+                sequence += 1
+            os.rename(self.baseFilename, segment)
+            self.compressor.submit(segment)
+
+        self.stream = self._open()
+        self.rollover_at = self._next_rollover(time.time())
@@ -6,9 +6,10 @@
 import logging
 import os
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+from .log_rotation import CompressingRotatingFileHandler
+
 
 class Logger:
     """로깅 시스템 관리 클래스"""
@@ -18,7 +19,10 @@ class Logger:
         log_file: str = "logs/kiwoom_api.log",
         log_level: str = "INFO",
         max_bytes: int = 10 * 1024 * 1024,  # 10MB
-        backup_count: int = 5
+        backup_count: int = 5,
+        when: str = "midnight",
+        max_total_bytes: int = 0,
+        compression: str = "gzip"
     ):
         """
         Args:
@@ -26,11 +30,17 @@ class Logger:
             log_level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             max_bytes: 로그 파일 최대 크기 (바이트)
             backup_count: 백업 파일 개수
+            when: 시각 기준 회전 ('midnight', 'hourly', 'none')
+            max_total_bytes: 백업 파일 합계 최대 크기 (바이트, 0이면 제한 없음)
+            compression: 백업 압축 방식 ('gzip', 'zstd', 'none')
         """
         self.log_file = log_file
         self.log_level = getattr(logging, log_level.upper(), logging.INFO)
         self.max_bytes = max_bytes
         self.backup_count = backup_count
+        self.when = when
+        self.max_total_bytes = max_total_bytes
+        self.compression = compression
 
         self._setup_logger()
 
@@ -47,11 +57,14 @@ class Logger:
         # 기존 핸들러 제거
         logger.handlers.clear()
 
-        # 파일 핸들러 (Rotating)
-        file_handler = RotatingFileHandler(
+        # 파일 핸들러 (크기 / 시각 기준 회전, 백업은 백그라운드 압축)
+        file_handler = CompressingRotatingFileHandler(
             self.log_file,
-            maxBytes=self.max_bytes,
-            backupCount=self.backup_count,
+            max_bytes=self.max_bytes,
+            when=self.when,
+            backup_count=self.backup_count,
+            max_total_bytes=self.max_total_bytes,
+            compression=self.compression,
             encoding='utf-8'
         )
         file_handler.setLevel(self.log_level)
@@ -77,6 +90,7 @@ class Logger:
         logger.info("로깅 시스템 초기화 완료")
         logger.info(f"로그 파일: {self.log_file}")
         logger.info(f"로그 레벨: {logging.getLevelName(self.log_level)}")
+        logger.info(f"로그 회전: {self.when}, {self.max_bytes // (1024 * 1024)}MB, 압축 {file_handler.compressor.compression}")
         logger.info("=" * 80)
 
     @staticmethod
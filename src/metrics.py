@@ -0,0 +1,148 @@
+"""
+클라이언트 지표
+TR 코드별 호출 수, 오류 수, 응답 지연, 요청 병합(coalescing) 횟수를 집계합니다.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+
+class LatencyWindow:
+    """최근 N개 응답 지연 표본"""
+
+    def __init__(self, size: int = 1000):
+        self._samples: deque = deque(maxlen=size)
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentiles(self, points=(50, 90, 95, 99)) -> Dict[str, float]:
+        """
+        백분위수 계산
+
+        Args:
+            points: 계산할 백분위 목록
+
+        Returns:
+            Dict[str, float]: {'p50': 초, ...} (표본이 없으면 빈 Dict)
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {}
+        last = len(samples) - 1
+        result = {f"p{p}": samples[min(last, int(len(samples) * p / 100))] for p in points}
+        result["max"] = samples[-1]
+        return result
+
+    def percentile(self, point: float) -> Optional[float]:
+        """단일 백분위수 (표본이 없으면 None)"""
+        samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * point / 100))]
+
+
+class EndpointStats:
+    """TR 코드 하나의 지표"""
+
+    def __init__(self, window: int):
+        self.requests = 0
+        self.errors = 0
+        self.coalesced = 0
+        self.latency = LatencyWindow(window)
+
+
+class ClientMetrics:
+    """클라이언트 지표 집계 (스레드 안전)"""
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window: TR 코드별로 유지할 최근 지연 표본 수
+        """
+        self.window = window
+        self._stats: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, api_id: str) -> EndpointStats:
+        stats = self._stats.get(api_id)
+        if stats is None:
+            stats = self._stats[api_id] = EndpointStats(self.window)
+        return stats
+
+    def record_request(self, api_id: str, elapsed: Optional[float], success: bool):
+        """
+        실제 네트워크 호출 결과 기록
+
+        Args:
+            api_id: TR 코드
+            elapsed: 응답까지 걸린 시간 (초, 응답을 받지 못했으면 None → 지연 표본에서 제외)
+            success: 성공 여부
+        """
+        with self._lock:
+            stats = self._get(api_id)
+            stats.requests += 1
+            if not success:
+                stats.errors += 1
+            if elapsed is not None:
+                stats.latency.add(elapsed)
+
+    def record_coalesced(self, api_id: str):
+        """진행 중인 동일 요청에 병합된 호출 기록"""
+        with self._lock:
+            self._get(api_id).coalesced += 1
+
+    def latency_percentile(self, api_id: str, point: float) -> Optional[float]:
+        """TR 코드의 응답 지연 백분위수 (초, 표본이 없으면 None)"""
+        with self._lock:
+            stats = self._stats.get(api_id)
+            return stats.latency.percentile(point) if stats else None
+
+    def sample_count(self, api_id: str) -> int:
+        """TR 코드의 지연 표본 수"""
+        with self._lock:
+            stats = self._stats.get(api_id)
+            return len(stats.latency) if stats else 0
+
+    def api_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._stats)
+
+    def snapshot(self) -> Dict:
+        """
+        전체 지표 스냅샷
+
+        Returns:
+            Dict: {"total": {...}, "endpoints": {api_id: {...}}}
+        """
+        with self._lock:
+            endpoints = {}
+            total_requests = total_errors = total_coalesced = 0
+
+            for api_id, stats in self._stats.items():
+                calls = stats.requests + stats.coalesced
+                endpoints[api_id] = {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "coalesced": stats.coalesced,
+                    "coalescing_ratio": stats.coalesced / calls if calls else 0.0,
+                    "latency": stats.latency.percentiles(),
+                }
+                total_requests += stats.requests
+                total_errors += stats.errors
+                total_coalesced += stats.coalesced
+
+        total_calls = total_requests + total_coalesced
+        return {
+            "total": {
+                "requests": total_requests,
+                "errors": total_errors,
+                "coalesced": total_coalesced,
+                "coalescing_ratio": total_coalesced / total_calls if total_calls else 0.0,
+            },
+            "endpoints": endpoints,
+        }
@@ -0,0 +1,411 @@
+"""
+주문 게이트웨이
+신호 발생부터 전송까지의 지연을 줄이기 위한 저지연 주문 전송 경로입니다.
+헤더와 요청 본문 템플릿을 미리 만들어 두고, 계좌별 단일 전송 스레드로 주문 순서를 보장합니다.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from .order_journal import (
+    OrderJournal, RECORD_SUBMITTED, RECORD_SENT, RECORD_ACKED, RECORD_FAILED
+)
+from .return_codes import AUTH_EXPIRED, OK, THROTTLED, classify, describe_failure, parse_body
+from .transport import TransportError, create_transport
+
+
+class OrderResult:
+    """주문 처리 결과"""
+
+    __slots__ = (
+        'order_id', 'account', 'api_id', 'success', 'data',
+        'signal_to_send_us', 'round_trip_us', 'body'
+    )
+
+    def __init__(self, order_id, account, api_id, success, data, signal_to_send_us, round_trip_us, body=None):
+        self.order_id = order_id
+        self.account = account
+        self.api_id = api_id
+        self.success = success
+        self.data = data
+        self.signal_to_send_us = signal_to_send_us
+        self.round_trip_us = round_trip_us
+        self.body = body
+
+    def __repr__(self):
+        return (
+            f"OrderResult(order_id={self.order_id}, api_id={self.api_id}, success={self.success}, "
+            f"signal_to_send_us={self.signal_to_send_us:.1f}, round_trip_us={self.round_trip_us:.1f})"
+        )
+
+
+class OrderGateway:
+    """계좌 단위 저지연 주문 게이트웨이"""
+
+    # 주문 엔드포인트 / TR 코드
+    ORDER_ENDPOINT = "/api/dostk/ordr"
+    BUY_API_ID = "kt10000"
+    SELL_API_ID = "kt10001"
+    MODIFY_API_ID = "kt10002"
+    CANCEL_API_ID = "kt10003"
+
+    # 매수/매도 요청 본문 템플릿 (필드 순서 고정, 값만 치환)
+    _ORDER_TEMPLATE = (
+        b'{"dmst_stex_tp":"%s","stk_cd":"%s","ord_qty":"%d",'
+        b'"ord_uv":"%s","trde_tp":"%s","cond_uv":""}'
+    )
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        kiwoom_client,
+        account: str = "default",
+        on_result: Optional[Callable[[OrderResult], None]] = None,
+        latency_window: int = 1000,
+        journal: Optional[OrderJournal] = None,
+        keepalive_interval: float = 30.0
+    ):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient 인스턴스 (계좌의 토큰 보유)
+            account: 계좌 식별자 (로그 및 결과 구분용)
+            on_result: 주문 결과 콜백 (전송 스레드에서 호출됨, 다른 구독자는 subscribe로 추가)
+            latency_window: 지연 통계에 사용할 최근 주문 수
+            journal: 주문 저널 (지정 시 전송 전에 기록이 디스크에 반영될 때까지 대기)
+            keepalive_interval: 주문이 없을 때 주문 커넥션을 유지하는 keep-alive 주기 (초, 0이면 사용 안 함)
+
+        Raises:
+            ValueError: 클라이언트가 카세트 재생 전송 계층을 사용하는 경우
+        """
+        # 재생 클라이언트로 게이트웨이를 만들면 주문이 실서버로 나가므로 거부
+        if kiwoom_client.transport.protocol == "replay":
+            raise ValueError("카세트 재생 중에는 주문 게이트웨이를 사용할 수 없습니다.")
+
+        self.client = kiwoom_client
+        self.account = account
+        self.on_result = on_result
+        self._subscribers: List[Callable[[OrderResult], None]] = []
+        self._subscribers_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        # 주문 전용 전송 계층 (일반 조회와 커넥션 풀을 공유하지 않음, 프로토콜은 클라이언트와 동일)
+        self.transport = create_transport(kiwoom_client.transport.protocol, pool_size=1)
+        self.keepalive_interval = keepalive_interval
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self.journal = journal
+
+        # 재시작 시에도 주문 번호가 겹치지 않도록 저널의 마지막 번호 다음부터 사용
+        first_order_id = journal.last_order_id + 1 if journal else 1
+        self._order_ids = itertools.count(first_order_id)
+
+        # TR 코드별 헤더 캐시 (토큰이 바뀌면 다시 생성)
+        self._headers: Dict[str, Dict[str, str]] = {}
+        self._headers_token: Optional[str] = None
+
+        self._signal_to_send: deque = deque(maxlen=latency_window)
+        self._round_trip: deque = deque(maxlen=latency_window)
+        self._stats_lock = threading.Lock()
+
+    def start(self, warm_up: bool = True):
+        """
+        전송 스레드 시작
+
+        Args:
+            warm_up: 시작 시 주문 서버로 커넥션을 미리 열어둘지 여부
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        if warm_up:
+            try:
+                self.transport.head(self.client.base_url, timeout=5)
+            except TransportError as e:
+                self.logger.warning(f"[{self.account}] 주문 커넥션 예열 실패: {e}")
+
+        self._thread = threading.Thread(
+            target=self._writer, name=f"order-writer-{self.account}", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"[{self.account}] 주문 게이트웨이 시작")
+
+    def stop(self, timeout: float = 5.0):
+        """대기 중인 주문을 모두 전송한 뒤 전송 스레드 종료"""
+        if self._thread and self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+        self.logger.info(f"[{self.account}] 주문 게이트웨이 종료")
+
+    def subscribe(self, callback: Callable[[OrderResult], None]):
+        """
+        주문 결과 구독 (전송 스레드에서 호출됨)
+
+        Args:
+            callback: callback(OrderResult)
+        """
+        with self._subscribers_lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[OrderResult], None]):
+        """구독 해제"""
+        with self._subscribers_lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def _get_headers(self, api_id: str) -> Dict[str, str]:
+        """TR 코드별 헤더 (토큰이 그대로면 캐시된 객체 재사용)"""
+        token = self.client.access_token
+        if token != self._headers_token:
+            self._headers.clear()
+            self._headers_token = token
+
+        headers = self._headers.get(api_id)
+        if headers is None:
+            headers = {
+                "Content-Type": "application/json;charset=UTF-8",
+                "api-id": api_id,
+                "cont-yn": "N",
+                "next-key": "",
+            }
+            headers.update(self.client.get_authorization_header())
+            self._headers[api_id] = headers
+        return headers
+
+    def submit(self, api_id: str, body, signal_ns: Optional[int] = None) -> int:
+        """
+        주문 접수 (즉시 반환, 전송은 전송 스레드에서 순서대로 수행)
+
+        Args:
+            api_id: 주문 TR 코드
+            body: 요청 본문 (Dict 또는 미리 직렬화된 bytes)
+            signal_ns: 신호 발생 시각 (time.perf_counter_ns 기준, None이면 현재)
+
+        Returns:
+            int: 게이트웨이 주문 번호
+        """
+        if signal_ns is None:
+            signal_ns = time.perf_counter_ns()
+        if not isinstance(body, (bytes, bytearray)):
+            body = self.client.codec.dumps(body)
+
+        order_id = next(self._order_ids)
+        if self.journal:
+            self.journal.append(RECORD_SUBMITTED, order_id, {
+                "account": self.account,
+                "api_id": api_id,
+                "body": body.decode('utf-8'),
+            })
+        self._queue.put((order_id, api_id, body, signal_ns))
+        return order_id
+
+    def buy(
+        self,
+        stk_cd: str,
+        qty: int,
+        price: str = "",
+        trde_tp: str = "3",
+        exchange: str = "KRX",
+        signal_ns: Optional[int] = None
+    ) -> int:
+        """
+        매수 주문 (kt10000)
+
+        Args:
+            stk_cd: 종목코드
+            qty: 주문 수량
+            price: 주문 단가 (시장가는 빈 문자열)
+            trde_tp: 매매구분 (0: 보통, 3: 시장가 등)
+            exchange: 국내거래소구분 (KRX, NXT, SOR)
+            signal_ns: 신호 발생 시각
+
+        Returns:
+            int: 게이트웨이 주문 번호
+        """
+        if signal_ns is None:
+            signal_ns = time.perf_counter_ns()
+        body = self._render(exchange, stk_cd, qty, price, trde_tp)
+        return self.submit(self.BUY_API_ID, body, signal_ns)
+
+    def sell(
+        self,
+        stk_cd: str,
+        qty: int,
+        price: str = "",
+        trde_tp: str = "3",
+        exchange: str = "KRX",
+        signal_ns: Optional[int] = None
+    ) -> int:
+        """매도 주문 (kt10001) - 인자는 buy와 동일"""
+        if signal_ns is None:
+            signal_ns = time.perf_counter_ns()
+        body = self._render(exchange, stk_cd, qty, price, trde_tp)
+        return self.submit(self.SELL_API_ID, body, signal_ns)
+
+    def _render(self, exchange: str, stk_cd: str, qty: int, price: str, trde_tp: str) -> bytes:
+        """주문 본문 템플릿 치환 (값 검증 후 바이트 포매팅)"""
+        if not stk_cd.isalnum() or not exchange.isalnum() or not trde_tp.isalnum():
+            raise ValueError(f"잘못된 주문 값입니다: {exchange}/{stk_cd}/{trde_tp}")
+        price = str(price)
+        if price and not price.replace('.', '', 1).isdigit():
+            raise ValueError(f"잘못된 주문 단가입니다: {price}")
+
+        return self._ORDER_TEMPLATE % (
+            exchange.encode(), stk_cd.encode(), int(qty), price.encode(), trde_tp.encode()
+        )
+
+    def _writer(self):
+        """전송 스레드 (계좌당 하나, 접수 순서대로 전송)"""
+        url = f"{self.client.base_url}{self.ORDER_ENDPOINT}"
+        timeout = self.keepalive_interval if self.keepalive_interval > 0 else None
+
+        while True:
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # 유휴 구간에 서버가 커넥션을 닫아 다음 주문이 핸드셰이크를 새로 하지 않도록 유지
+                # (전송 스레드에서 보내므로 주문과 커넥션을 다투지 않음)
+                self._keepalive()
+                continue
+            if item is self._STOP:
+                return
+
+            order_id, api_id, body, signal_ns = item
+            token = self.client.token
+            try:
+                success, data, send_ns, ack_ns = self._send(url, order_id, api_id, body)
+            except Exception as e:
+                # 예기치 못한 오류(저널 기록 실패, 응답 형식 등)에도 전송 스레드는 유지해 이후 주문이 큐에 묶이지 않도록 함
+                self.logger.exception(f"[{self.account}] 주문 #{order_id} ({api_id}) 처리 중 예외 발생")
+                success, data, send_ns, ack_ns = False, {"error": f"주문 처리 오류: {e}"}, None, None
+
+            self._complete(order_id, api_id, body, success, data, signal_ns, send_ns, ack_ns)
+
+            # 주문은 중복 체결 위험이 있어 재전송하지 않고, 이후 주문을 위해 감속 / 토큰 재발급만 수행
+            if not success:
+                try:
+                    outcome = data.get("outcome")
+                    if outcome == THROTTLED:
+                        self.client.rate_limiter.penalize()
+                    elif outcome == AUTH_EXPIRED:
+                        self.client.refresh_token(token)
+                except Exception:
+                    self.logger.exception(f"[{self.account}] 주문 실패 후 감속 / 토큰 재발급 오류")
+
+    def _keepalive(self):
+        """주문 커넥션으로 가벼운 HEAD 요청 (응답 코드는 무시, 연결 유지가 목적)"""
+        try:
+            self.transport.head(self.client.base_url, timeout=5)
+        except TransportError as e:
+            self.logger.debug(f"[{self.account}] 주문 커넥션 keep-alive 실패: {e}")
+
+    def _send(self, url: str, order_id: int, api_id: str, body: bytes):
+        """
+        주문 하나 전송
+
+        Returns:
+            Tuple: (성공 여부, 응답 본문 또는 오류 정보, 전송 시각 ns, 응답 시각 ns)
+        """
+        self.client.rate_limiter.acquire()
+
+        try:
+            headers = self._get_headers(api_id)
+        except ValueError as e:
+            return False, {"error": str(e)}, None, None
+
+        # 전송 전 기록이 fsync될 때까지 대기 (group commit 주기만큼 지연될 수 있음)
+        if self.journal:
+            self.journal.append(RECORD_SENT, order_id, wait=True)
+
+        send_ns = time.perf_counter_ns()
+        try:
+            response = self.transport.post(url, headers=headers, body=body, timeout=5)
+            ack_ns = time.perf_counter_ns()
+
+            data = parse_body(response, self.client.codec)
+            success = classify(response.status_code, data)[0] == OK
+            if not success:
+                data = describe_failure(response, url, data)
+        except (TransportError, ValueError) as e:
+            ack_ns = time.perf_counter_ns()
+            success, data = False, {"error": f"주문 전송 오류: {e}"}
+        return success, data, send_ns, ack_ns
+
+    def _complete(self, order_id, api_id, body, success, data, signal_ns, send_ns, ack_ns):
+        """주문 결과 기록 및 콜백 호출"""
+        if self.journal:
+            try:
+                if success:
+                    ord_no = data.get("ord_no", "") if isinstance(data, dict) else ""
+                    self.journal.append(RECORD_ACKED, order_id, {"ord_no": ord_no})
+                else:
+                    self.journal.append(RECORD_FAILED, order_id, {"error": str(data)})
+            except Exception:
+                # 저널에 남지 않은 주문은 재시작 시 미완료로 복원되므로 결과 콜백은 그대로 호출
+                self.logger.exception(f"[{self.account}] 주문 #{order_id} 결과 저널 기록 실패")
+
+        signal_to_send_us = (send_ns - signal_ns) / 1000 if send_ns else 0.0
+        round_trip_us = (ack_ns - send_ns) / 1000 if send_ns else 0.0
+
+        if send_ns:
+            with self._stats_lock:
+                self._signal_to_send.append(signal_to_send_us)
+                self._round_trip.append(round_trip_us)
+
+        if success:
+            self.logger.info(
+                f"[{self.account}] 주문 #{order_id} ({api_id}) 전송 완료 - "
+                f"신호→전송 {signal_to_send_us:.0f}µs, 왕복 {round_trip_us / 1000:.1f}ms"
+            )
+        else:
+            self.logger.error(f"[{self.account}] 주문 #{order_id} ({api_id}) 실패: {data}")
+
+        with self._subscribers_lock:
+            callbacks = list(self._subscribers)
+        if self.on_result:
+            callbacks.insert(0, self.on_result)
+        if not callbacks:
+            return
+
+        result = OrderResult(
+            order_id, self.account, api_id, success, data, signal_to_send_us, round_trip_us, body
+        )
+        for callback in callbacks:
+            try:
+                callback(result)
+            except Exception:
+                self.logger.exception("주문 결과 콜백 오류")
+
+    def get_latency_stats(self) -> Dict:
+        """
+        최근 주문의 지연 통계
+
+        Returns:
+            Dict: 신호→전송 / 왕복 지연의 p50, p99, 최대값 (마이크로초)
+        """
+        with self._stats_lock:
+            signal_to_send = sorted(self._signal_to_send)
+            round_trip = sorted(self._round_trip)
+
+        return {
+            "count": len(signal_to_send),
+            "signal_to_send_us": _summarize(signal_to_send),
+            "round_trip_us": _summarize(round_trip),
+        }
+
+
+def _summarize(values: List[float]) -> Dict:
+    """정렬된 값 목록의 요약 통계"""
+    if not values:
+        return {"p50": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "p50": values[len(values) // 2],
+        "p99": values[min(len(values) - 1, int(len(values) * 0.99))],
+        "max": values[-1],
+    }
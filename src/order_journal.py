@@ -0,0 +1,333 @@
+"""
+주문 저널 (Write-Ahead Log)
+주문 이벤트를 길이 접두 바이너리 레코드로 기록하고, 여러 레코드의 fsync를 묶어서(group commit) 수행합니다.
+시작 시 저널을 재생하여 미완료 주문 상태를 복원합니다.
+
+파일이 compact_bytes를 넘으면 완료된 주문을 버리고 체크포인트(마지막 주문 번호) + 미완료 주문 상태만으로
+새 파일을 만들어 교체하므로, 재생 시간과 파일 크기는 누적 주문 수가 아니라 미완료 주문 수에 비례합니다.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+
+# 레코드 헤더: 본문 길이(4) + CRC32(4) + 레코드 종류(1) + 기록 시각 ns(8)
+_HEADER = struct.Struct('<IIBQ')
+
+# 레코드 종류
+RECORD_SUBMITTED = 1   # 주문 접수
+RECORD_SENT = 2        # 전송 직전
+RECORD_ACKED = 3       # 서버 응답 수신
+RECORD_FAILED = 4      # 실패
+RECORD_CHECKPOINT = 5  # 압축 시점의 마지막 주문 번호
+
+RECORD_NAMES = {
+    RECORD_SUBMITTED: "submitted",
+    RECORD_SENT: "sent",
+    RECORD_ACKED: "acked",
+    RECORD_FAILED: "failed",
+}
+_RECORD_TYPES = {name: record_type for record_type, name in RECORD_NAMES.items()}
+
+# 완료 상태 (재생 시 미완료 주문에서 제외)
+_TERMINAL = (RECORD_ACKED, RECORD_FAILED)
+
+
+class JournalError(Exception):
+    """저널 기록 실패 (이후의 기록과 대기도 모두 같은 오류로 실패)"""
+
+
+def _encode(record_type: int, payload: Dict) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return _HEADER.pack(len(body), zlib.crc32(body), record_type, time.time_ns()) + body
+
+
+class OrderJournal:
+    """group commit 방식의 주문 저널"""
+
+    def __init__(
+        self,
+        path: str = "data/journal/orders.wal",
+        commit_interval_ms: float = 2.0,
+        compact_bytes: int = 4 * 1024 * 1024
+    ):
+        """
+        Args:
+            path: 저널 파일 경로
+            commit_interval_ms: fsync 묶음 주기 (밀리초, 0이면 쓰기 즉시 fsync)
+            compact_bytes: 이 크기를 넘으면 완료된 주문을 버리고 파일 압축 (0이면 압축 안 함)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_interval = commit_interval_ms / 1000
+        self.compact_bytes = compact_bytes
+        self.logger = logging.getLogger(__name__)
+
+        self.commits = 0
+        self.records = 0
+        self.compactions = 0
+
+        # 재생하여 상태 복원 (잘린 꼬리 레코드는 제거)
+        self.orders, self.last_order_id, valid_size = self._replay()
+
+        self._file = None
+        if self.compact_bytes and valid_size >= self.compact_bytes:
+            self._rewrite(self.orders, self.last_order_id)
+        else:
+            self._file = open(self.path, 'ab', buffering=0)
+            if self._file.tell() != valid_size:
+                self._file.truncate(valid_size)
+                self._file.seek(valid_size)
+        # 다음 압축 시점 (압축 후에도 미완료 주문이 많으면 매번 압축하지 않도록 현재 크기 기준)
+        self._compact_at = self._file.tell() + self.compact_bytes
+
+        self._buffer = bytearray()
+        self._appended_seq = 0
+        self._durable_seq = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        # 기록 / fsync 실패 (한 번 실패하면 이후 append와 wait_durable이 모두 JournalError)
+        self._error: Optional[BaseException] = None
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="order-journal", daemon=True)
+        self._flusher.start()
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def append(self, record_type: int, order_id: int, data: Optional[Dict] = None, wait: bool = False) -> int:
+        """
+        레코드 추가
+
+        Args:
+            record_type: 레코드 종류 (RECORD_*)
+            order_id: 주문 번호
+            data: 부가 정보
+            wait: 디스크에 기록(fsync)될 때까지 대기할지 여부
+
+        Returns:
+            int: 레코드 순번
+        """
+        payload = dict(data) if data else {}
+        payload["order_id"] = order_id
+        record = _encode(record_type, payload)
+
+        with self._cond:
+            self._raise_error()
+            if self._closed:
+                raise ValueError("닫힌 저널에 기록할 수 없습니다.")
+            self._buffer += record
+            self._appended_seq += 1
+            seq = self._appended_seq
+            self._apply(record_type, payload)
+            self._cond.notify_all()
+
+        if wait:
+            self.wait_durable(seq)
+        return seq
+
+    def wait_durable(self, seq: int, timeout: Optional[float] = None) -> bool:
+        """
+        지정한 순번까지 fsync될 때까지 대기
+
+        Returns:
+            bool: 기록 완료 여부 (timeout 초과 시 False)
+
+        Raises:
+            JournalError: 기록 / fsync 실패로 해당 순번이 디스크에 반영될 수 없는 경우
+        """
+        with self._cond:
+            done = self._cond.wait_for(lambda: self._durable_seq >= seq or self._error, timeout)
+            if self._durable_seq < seq:
+                self._raise_error()
+            return bool(done)
+
+    def _raise_error(self):
+        """기록 실패 상태면 JournalError (self._cond를 잡은 상태에서 호출)"""
+        if self._error is not None:
+            raise JournalError(f"주문 저널 기록 실패: {self._error}") from self._error
+
+    def _flush_loop(self):
+        """fsync 스레드 (주기마다 쌓인 레코드를 한 번에 기록, 파일이 커지면 압축)"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._buffer or self._closed)
+                if not self._buffer and self._closed:
+                    return
+
+            # 다른 레코드가 모일 시간을 준 뒤 한꺼번에 기록
+            if self.commit_interval > 0:
+                time.sleep(self.commit_interval)
+
+            try:
+                compact = bool(self.compact_bytes) and self._file.tell() >= self._compact_at
+            except OSError:
+                compact = False
+            with self._cond:
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                seq = self._appended_seq
+                count = seq - self._durable_seq
+                if compact:
+                    # 메모리 상태에는 버퍼의 레코드까지 반영되어 있으므로 버퍼 대신 스냅샷을 기록
+                    orders = {order_id: dict(order) for order_id, order in self.orders.items()}
+                    last_order_id = self.last_order_id
+
+            try:
+                if compact:
+                    try:
+                        self._rewrite(orders, last_order_id)
+                    except OSError:
+                        # 압축에 실패하면 기존 파일에 이어서 기록 (다음 압축은 compact_bytes만큼 더 쌓인 뒤)
+                        self.logger.exception("주문 저널 압축 실패 - 기존 파일에 이어서 기록합니다.")
+                        compact = False
+                    self._compact_at = self._file.tell() + self.compact_bytes
+                if not compact:
+                    self._file.write(data)
+                    os.fsync(self._file.fileno())
+            except Exception as e:
+                # 기록되지 않은 레코드를 기다리는 쪽(전송 스레드)이 멈추지 않도록 실패를 알리고 종료
+                self.logger.exception(f"주문 저널 기록 실패 ({self.path})")
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self._durable_seq = seq
+                self.commits += 1
+                self.records += count
+                self._cond.notify_all()
+
+    def _rewrite(self, orders: Dict[int, Dict], last_order_id: int):
+        """
+        체크포인트 + 미완료 주문 상태만으로 새 저널을 만들어 교체 (완료된 주문 제거)
+
+        임시 파일을 fsync한 뒤 교체하므로 도중에 중단되어도 기존 저널이 남습니다.
+        """
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_encode(RECORD_CHECKPOINT, {"order_id": last_order_id}))
+            for order_id, order in sorted(orders.items()):
+                payload = {key: value for key, value in order.items() if key != "state"}
+                f.write(_encode(_RECORD_TYPES.get(order.get("state"), RECORD_SUBMITTED), payload))
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Windows에서는 열려 있는 파일을 교체할 수 없으므로 먼저 닫고, 교체에 실패해도 기존 파일을 다시 엶
+        if self._file is not None:
+            self._file.close()
+        try:
+            os.replace(tmp_path, self.path)
+            self._fsync_dir()
+        finally:
+            self._file = open(self.path, 'ab', buffering=0)
+
+        self.compactions += 1
+        self.logger.info(f"주문 저널 압축 완료 - 미완료 주문 {len(orders)}건, {self._file.tell():,}바이트")
+
+    def _fsync_dir(self):
+        """파일 교체가 디렉토리 항목에도 반영되도록 fsync (지원하지 않는 OS에서는 생략)"""
+        try:
+            fd = os.open(self.path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def close(self):
+        """남은 레코드를 기록하고 저널 닫기"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._flusher.join()
+        self._file.close()
+
+    # ------------------------------------------------------------------
+    # 재생
+    # ------------------------------------------------------------------
+
+    def _apply(self, record_type: int, payload: Dict):
+        """레코드를 주문 상태에 반영"""
+        order_id = payload["order_id"]
+        if record_type == RECORD_CHECKPOINT:
+            self.last_order_id = max(self.last_order_id, order_id)
+            return
+        order = self.orders.setdefault(order_id, {})
+        order.update(payload)
+        order["state"] = RECORD_NAMES.get(record_type, str(record_type))
+        if record_type in _TERMINAL:
+            # 완료된 주문은 메모리에서 제거
+            self.orders.pop(order_id, None)
+        if order_id > self.last_order_id:
+            self.last_order_id = order_id
+
+    @staticmethod
+    def read_records(path) -> Iterator[Tuple[int, int, Dict, int]]:
+        """
+        저널 레코드 순회 (레코드 단위로 읽으며, 손상되거나 잘린 레코드에서 중단)
+
+        Yields:
+            Tuple[int, int, Dict, int]: (레코드 종류, 기록 시각 ns, 본문, 레코드 끝 위치)
+        """
+        header_size = _HEADER.size
+        offset = 0
+        with open(path, 'rb') as f:
+            while True:
+                header = f.read(header_size)
+                if len(header) < header_size:
+                    return
+                length, crc, record_type, ts = _HEADER.unpack(header)
+                body = f.read(length)
+                if len(body) < length or zlib.crc32(body) != crc:
+                    return
+                offset += header_size + length
+                yield record_type, ts, json.loads(body), offset
+
+    def _replay(self) -> Tuple[Dict[int, Dict], int, int]:
+        """
+        저널 재생
+
+        Returns:
+            Tuple: (미완료 주문 상태, 마지막 주문 번호, 유효한 파일 크기)
+        """
+        self.orders: Dict[int, Dict] = {}
+        self.last_order_id = 0
+        valid_size = 0
+
+        if not self.path.exists():
+            return self.orders, self.last_order_id, valid_size
+
+        count = 0
+        for record_type, _, payload, end in self.read_records(self.path):
+            self._apply(record_type, payload)
+            valid_size = end
+            count += 1
+
+        if valid_size != self.path.stat().st_size:
+            self.logger.warning(f"저널 끝의 손상된 레코드를 제거합니다 ({self.path})")
+
+        if count:
+            self.logger.info(
+                f"주문 저널 재생 완료 - {count}건, 미완료 주문 {len(self.orders)}건"
+            )
+        return self.orders, self.last_order_id, valid_size
+
+    def pending_orders(self) -> Dict[int, Dict]:
+        """미완료(접수/전송 후 응답 없음) 주문 목록"""
+        with self._cond:
+            return {order_id: dict(order) for order_id, order in self.orders.items()}
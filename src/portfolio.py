@@ -0,0 +1,427 @@
+"""
+포트폴리오 손익 엔진
+체결과 시세를 하나씩 반영하여 실현 / 평가 손익, 노출, 계좌별 합계를 이벤트당 O(1)로 유지합니다.
+포지션은 종목별 슬롯 번호로 접근하는 array 기반 저장소에 보관하고,
+체결은 주문 게이트웨이 주문의 체결 조회 결과(attach_gateway), 시세는 관심종목 시세 조회 결과(attach_quotes)로 반영하며,
+주기적으로 계좌평가잔고내역(kt00018)과 대사(reconcile)하여 누락된 체결을 보정합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class AccountTotals:
+    """계좌별 합계 (포지션 변경 시 차이만 더해 유지)"""
+
+    __slots__ = ('market_value', 'cost_basis', 'gross_exposure', 'realized_pnl', 'positions')
+
+    def __init__(self):
+        self.market_value = 0.0
+        self.cost_basis = 0.0
+        self.gross_exposure = 0.0
+        self.realized_pnl = 0.0
+        self.positions = 0
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return self.market_value - self.cost_basis
+
+    def to_dict(self) -> Dict:
+        return {
+            "market_value": self.market_value,
+            "cost_basis": self.cost_basis,
+            "unrealized_pnl": self.unrealized_pnl,
+            "realized_pnl": self.realized_pnl,
+            "total_pnl": self.unrealized_pnl + self.realized_pnl,
+            "gross_exposure": self.gross_exposure,
+            "positions": self.positions,
+        }
+
+
+def _parse_number(value) -> float:
+    """키움 응답 숫자 문자열 ('000000000003', '+70000', '') → float"""
+    if value in (None, ""):
+        return 0.0
+    return float(value)
+
+
+class Portfolio:
+    """체결 / 시세 기반 증분 포트폴리오"""
+
+    BALANCE_API_ID = "kt00018"
+    ACCOUNT_ENDPOINT = "/api/dostk/acnt"
+
+    def __init__(self, kiwoom_client=None, account: str = "default", max_pages: int = 20):
+        """
+        Args:
+            kiwoom_client: 대사에 사용할 KiwoomAPIClient (None이면 대사 안 함)
+            account: reconcile()이 대사할 계좌 식별자
+            max_pages: 잔고 조회 최대 연속조회 페이지 수
+        """
+        self.client = kiwoom_client
+        self.account = account
+        self.max_pages = max_pages
+        self.logger = logging.getLogger(__name__)
+
+        # 슬롯별 저장소 (슬롯 번호 = 배열 인덱스)
+        self._quantity = array('d')
+        self._avg_price = array('d')
+        self._last_price = array('d')
+        self._realized = array('d')
+        self._slot_keys: List[Tuple[str, str]] = []
+
+        # (계좌, 종목) → 슬롯, 종목 → 슬롯 목록 (시세 반영용)
+        self._slots: Dict[Tuple[str, str], int] = {}
+        self._symbol_slots: Dict[str, List[int]] = {}
+        self._totals: Dict[str, AccountTotals] = {}
+
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot_version = -1
+        self._snapshot: Optional[Dict] = None
+        self.last_reconciled: Optional[float] = None
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # (구독 대상, 콜백) - stop() 시 구독 해제
+        self._subscriptions: List[Tuple[object, Callable]] = []
+
+    def _slot(self, account: str, symbol: str) -> int:
+        key = (account, symbol)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = len(self._slot_keys)
+            self._slot_keys.append(key)
+            self._quantity.append(0.0)
+            self._avg_price.append(0.0)
+            self._last_price.append(0.0)
+            self._realized.append(0.0)
+            self._symbol_slots.setdefault(symbol, []).append(slot)
+            if account not in self._totals:
+                self._totals[account] = AccountTotals()
+        return slot
+
+    def _contribution(self, slot: int) -> Tuple[float, float, float]:
+        """슬롯의 (평가금액, 매입금액, 총노출)"""
+        quantity = self._quantity[slot]
+        price = self._last_price[slot]
+        return quantity * price, quantity * self._avg_price[slot], abs(quantity) * price
+
+    def _set_position(self, slot: int, quantity: float, avg_price: float, last_price: float):
+        """슬롯 값 변경 후 계좌 합계에 차이만 반영"""
+        totals = self._totals[self._slot_keys[slot][0]]
+        value, cost, gross = self._contribution(slot)
+        was_open = self._quantity[slot] != 0
+
+        self._quantity[slot] = quantity
+        self._avg_price[slot] = avg_price if quantity else 0.0
+        self._last_price[slot] = last_price
+
+        new_value, new_cost, new_gross = self._contribution(slot)
+        totals.market_value += new_value - value
+        totals.cost_basis += new_cost - cost
+        totals.gross_exposure += new_gross - gross
+        totals.positions += (quantity != 0) - was_open
+        self._version += 1
+
+    def apply_fill(self, account: str, symbol: str, quantity: float, price: float, fee: float = 0.0):
+        """
+        체결 반영 (평균단가 방식)
+
+        Args:
+            account: 계좌 식별자
+            symbol: 종목코드
+            quantity: 체결 수량 (매수 +, 매도 -)
+            price: 체결 단가
+            fee: 수수료 + 세금 (실현손익에서 차감)
+        """
+        if quantity == 0:
+            return
+
+        with self._lock:
+            slot = self._slot(account, symbol)
+            held = self._quantity[slot]
+            avg = self._avg_price[slot]
+            realized = -fee
+
+            if held == 0 or (held > 0) == (quantity > 0):
+                # 신규 / 추가 매수(매도)
+                new_quantity = held + quantity
+                avg = (held * avg + quantity * price) / new_quantity
+            else:
+                # 청산 (반대 방향으로 넘어가면 남은 수량은 체결가로 신규 진입)
+                closed = min(abs(quantity), abs(held))
+                realized += (price - avg) * closed * (1 if held > 0 else -1)
+                new_quantity = held + quantity
+                if new_quantity != 0 and (new_quantity > 0) != (held > 0):
+                    avg = price
+
+            self._realized[slot] += realized
+            self._totals[account].realized_pnl += realized
+            self._set_position(slot, new_quantity, avg, price)
+
+    def apply_tick(self, symbol: str, price: float):
+        """
+        시세 반영 (해당 종목을 보유한 슬롯만 갱신)
+
+        Args:
+            symbol: 종목코드
+            price: 현재가
+        """
+        with self._lock:
+            for slot in self._symbol_slots.get(symbol, ()):
+                if self._last_price[slot] == price:
+                    continue
+                self._set_position(slot, self._quantity[slot], self._avg_price[slot], price)
+
+    def apply_balance(self, account: str, items: Iterable[Dict], complete: bool = True) -> List[Dict]:
+        """
+        잔고 조회 결과로 대사 (수량 / 평균단가가 다르면 잔고 기준으로 교정)
+
+        Args:
+            account: 계좌 식별자
+            items: kt00018 acnt_evlt_remn_indv_tot 항목
+            complete: 모든 페이지를 받은 결과인지 (False면 결과에 없는 종목을 청산으로 보지 않음)
+
+        Returns:
+            List[Dict]: 교정 내역 [{"symbol", "quantity": (이전, 잔고), "avg_price": (이전, 잔고)}]
+        """
+        corrections = []
+        with self._lock:
+            seen = set()
+            for item in items:
+                symbol = str(item.get("stk_cd", "")).lstrip("A")
+                if not symbol:
+                    continue
+                seen.add(symbol)
+                quantity = _parse_number(item.get("rmnd_qty"))
+                avg_price = _parse_number(item.get("pur_pric"))
+                price = abs(_parse_number(item.get("cur_prc")))
+
+                slot = self._slot(account, symbol)
+                if self._quantity[slot] != quantity or abs(self._avg_price[slot] - avg_price) >= 0.5:
+                    corrections.append({
+                        "symbol": symbol,
+                        "quantity": (self._quantity[slot], quantity),
+                        "avg_price": (self._avg_price[slot], avg_price),
+                    })
+                self._set_position(slot, quantity, avg_price, price or self._last_price[slot])
+
+            # 잔고에 없는 보유 종목은 청산된 것으로 교정 (일부 페이지만 받았으면 알 수 없으므로 건너뜀)
+            if complete:
+                for (slot_account, symbol), slot in self._slots.items():
+                    if slot_account == account and symbol not in seen and self._quantity[slot] != 0:
+                        corrections.append({
+                            "symbol": symbol,
+                            "quantity": (self._quantity[slot], 0.0),
+                            "avg_price": (self._avg_price[slot], 0.0),
+                        })
+                        self._set_position(slot, 0.0, 0.0, self._last_price[slot])
+
+            self.last_reconciled = time.time()
+            self._version += 1
+
+        for correction in corrections:
+            self.logger.warning(f"[{account}] 잔고 대사 교정: {correction}")
+        return corrections
+
+    def reconcile(self) -> Optional[List[Dict]]:
+        """
+        계좌평가잔고내역(kt00018)을 조회하여 대사
+
+        Returns:
+            Optional[List[Dict]]: 교정 내역 (조회 실패 시 None)
+        """
+        items = []
+        complete = False
+        cont_yn, next_key = "N", ""
+        for _ in range(self.max_pages):
+            success, result = self.client.call_api(
+                self.BALANCE_API_ID, self.ACCOUNT_ENDPOINT,
+                {"qry_tp": "1", "dmst_stex_tp": "KRX"}, cont_yn, next_key
+            )
+            if not success:
+                self.logger.warning(f"[{self.account}] 잔고 대사 조회 실패: {result}")
+                return None
+
+            items.extend(result["body"].get("acnt_evlt_remn_indv_tot") or [])
+            if result["cont_yn"] != "Y":
+                complete = True
+                break
+            cont_yn, next_key = "Y", result["next_key"]
+
+        if not complete:
+            self.logger.warning(f"[{self.account}] 잔고 대사 조회가 {self.max_pages}페이지를 넘어 일부만 반영합니다.")
+        return self.apply_balance(self.account, items, complete)
+
+    def attach_poller(self, poller):
+        """
+        계좌 폴러의 보유종목 조회 결과로 대사 (별도 잔고 조회 없이 폴링 결과 재사용)
+
+        Args:
+            poller: AccountPoller 인스턴스
+        """
+        def on_change(account, feed, changes):
+            if feed == "positions":
+                # 폴러가 연속조회 페이지를 합친 스냅샷 사용 (페이지 상한에 걸렸으면 청산 교정 생략)
+                snapshot = poller.get_snapshot("positions") or {}
+                self.apply_balance(account, snapshot.values(), poller.is_complete("positions"))
+
+        poller.subscribe(on_change)
+        self._subscriptions.append((poller, on_change))
+
+    def attach_quotes(self, quote_poller):
+        """
+        관심종목 시세 조회 결과의 현재가를 apply_tick으로 반영
+
+        Args:
+            quote_poller: QuotePoller 인스턴스
+        """
+        def on_rows(items):
+            for item in items:
+                price = abs(_parse_number(item.get("cur_prc")))
+                if price:
+                    self.apply_tick(str(item.get("stk_cd", "")).lstrip("A"), price)
+
+        quote_poller.subscribe(on_rows)
+        self._subscriptions.append((quote_poller, on_rows))
+
+    def attach_gateway(self, gateway, poller):
+        """
+        주문 게이트웨이 주문의 체결을 apply_fill로 반영
+
+        접수 응답을 받은 매수 / 매도 주문의 주문번호를 기억해 두고, 계좌 폴러의 체결 조회(ka10076)에서
+        주문별 누적 체결 수량이 늘어난 만큼 반영합니다. 다른 경로(HTS 등)의 주문은 잔고 대사로 맞춥니다.
+
+        Args:
+            gateway: OrderGateway 인스턴스
+            poller: 같은 계좌의 AccountPoller 인스턴스 (체결 조회가 추가됨)
+        """
+        sides = {gateway.BUY_API_ID: 1, gateway.SELL_API_ID: -1}
+        # 주문번호 → [종목코드, 방향, 반영한 체결 수량, 반영한 수수료 + 세금]
+        orders: Dict[str, list] = {}
+        lock = threading.Lock()
+
+        def on_result(result):
+            side = sides.get(result.api_id)
+            if side is None or not result.success or not isinstance(result.data, dict):
+                return
+            ord_no = result.data.get("ord_no")
+            try:
+                symbol = json.loads(result.body)["stk_cd"]
+            except (TypeError, ValueError, KeyError):
+                return
+            if ord_no:
+                with lock:
+                    orders[ord_no] = [symbol, side, 0.0, 0.0]
+                # 체결 조회를 최소 주기로 앞당김
+                poller.notify_activity()
+
+        def on_change(account, feed, changes):
+            if feed != "fills":
+                return
+            snapshot = poller.get_snapshot("fills") or {}
+            fills = []
+            with lock:
+                for ord_no, order in list(orders.items()):
+                    item = snapshot.get(ord_no)
+                    if item is None:
+                        continue
+                    filled = _parse_number(item.get("cntr_qty"))
+                    fee = _parse_number(item.get("tdy_trde_cmsn")) + _parse_number(item.get("tdy_trde_tax"))
+                    if filled > order[2]:
+                        price = abs(_parse_number(item.get("cntr_pric")))
+                        fills.append((order[0], order[1] * (filled - order[2]), price, fee - order[3]))
+                        order[2], order[3] = filled, fee
+                    # 미체결 수량이 없으면 (전량 체결 / 취소) 더 추적하지 않음
+                    if _parse_number(item.get("oso_qty")) == 0:
+                        del orders[ord_no]
+
+            for symbol, quantity, price, fee in fills:
+                self.apply_fill(account, symbol, quantity, price, fee)
+
+        poller.track_fills()
+        gateway.subscribe(on_result)
+        poller.subscribe(on_change)
+        self._subscriptions += [(gateway, on_result), (poller, on_change)]
+
+    def start(self, interval: float = 60.0):
+        """주기적 대사 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def run():
+            while True:
+                try:
+                    self.reconcile()
+                except Exception:
+                    self.logger.exception("잔고 대사 오류")
+                if self._stop.wait(interval):
+                    return
+
+        self._thread = threading.Thread(target=run, name=f"portfolio-{self.account}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """대사 스레드 종료 및 폴러 / 게이트웨이 구독 해제"""
+        self._stop.set()
+        for source, callback in self._subscriptions:
+            source.unsubscribe(callback)
+        self._subscriptions.clear()
+
+    def position(self, account: str, symbol: str) -> Optional[Dict]:
+        """포지션 하나 조회"""
+        with self._lock:
+            slot = self._slots.get((account, symbol))
+            return self._position_dict(slot) if slot is not None else None
+
+    def _position_dict(self, slot: int) -> Dict:
+        account, symbol = self._slot_keys[slot]
+        value, cost, _ = self._contribution(slot)
+        return {
+            "account": account,
+            "symbol": symbol,
+            "quantity": self._quantity[slot],
+            "avg_price": self._avg_price[slot],
+            "last_price": self._last_price[slot],
+            "market_value": value,
+            "unrealized_pnl": value - cost,
+            "realized_pnl": self._realized[slot],
+        }
+
+    def totals(self, account: str) -> Dict:
+        """계좌 합계"""
+        with self._lock:
+            totals = self._totals.get(account)
+            return totals.to_dict() if totals else AccountTotals().to_dict()
+
+    def snapshot(self) -> Dict:
+        """
+        화면 표시용 스냅샷 (변경이 있을 때만 다시 생성, 반환값은 공유 객체이므로 수정하지 마세요)
+
+        Returns:
+            Dict: {"version", "updated_at", "last_reconciled",
+                   "accounts": {계좌: 합계}, "positions": [포지션 (보유 중인 것만, 평가금액 순)]}
+        """
+        with self._lock:
+            if self._snapshot_version != self._version:
+                positions = [
+                    self._position_dict(slot)
+                    for slot in range(len(self._slot_keys))
+                    if self._quantity[slot] != 0
+                ]
+                positions.sort(key=lambda p: abs(p["market_value"]), reverse=True)
+                self._snapshot = {
+                    "version": self._version,
+                    "updated_at": time.time(),
+                    "last_reconciled": self.last_reconciled,
+                    "accounts": {account: totals.to_dict() for account, totals in self._totals.items()},
+                    "positions": positions,
+                }
+                self._snapshot_version = self._version
+            return self._snapshot
@@ -0,0 +1,346 @@
+"""
+내장 프로파일러
+GUI나 헤드리스 작업이 느려졌을 때 다시 빌드하지 않고 CPU / 메모리 사용 지점을 기록합니다.
+
+- cprofile: cProfile로 시작한 스레드의 모든 함수 호출 기록 (GUI에서는 Tk 메인 스레드)
+  → <시각>.pstats (snakeviz, pstats로 열기), <시각>.txt (누적 / 자체 시간 상위 함수)
+- sampling: 백그라운드 스레드가 주기적으로 모든 스레드의 호출 스택을 표본 추출 (부가 비용이 작고 작업자 스레드도 포함)
+  → <시각>.collapsed (flamegraph.pl, speedscope의 collapsed stack 형식), <시각>.txt (상위 함수)
+- memory: tracemalloc으로 시작 시점 대비 늘어난 할당 위치 기록
+  → <시각>-memory.txt
+
+기록하지 않을 때는 훅이나 스레드를 설치하지 않으므로 부가 비용이 없습니다.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+CPU_MODES = ("none", "cprofile", "sampling")
+
+# 메모리 보고서에서 제외할 할당 위치 (프로파일러와 tracemalloc 자체, import 시스템)
+_MEMORY_FILTERS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class SamplingProfiler:
+    """모든 스레드의 호출 스택 표본 추출기 (sys._current_frames 기반)"""
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval: 표본 추출 주기 (초)
+        """
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            # collapsed 형식은 ';'로 프레임을 구분하므로 이름에서 제외
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                stack.reverse()
+                self.stacks[";".join(stack)] += 1
+            self.samples += 1
+
+    def write_collapsed(self, path: Path):
+        """collapsed stack 형식 저장 (한 줄에 '스레드;바깥 함수;...;안쪽 함수 표본 수')"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def top_functions(self, limit: int = 30) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """(자체 표본 상위, 포함 표본 상위) 함수 목록"""
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")[1:]
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for name in set(frames):
+                total[name] += count
+        return own.most_common(limit), total.most_common(limit)
+
+
+class ProfileSession:
+    """
+    프로파일링 구간 하나 (CPU 방식 하나 + 선택적으로 메모리)
+
+    구간을 정하면 끝날 때 보고서를 쓰고 on_finished(보고서 경로 목록)를 호출합니다.
+    cProfile은 시작한 스레드에만 훅을 걸고 그 스레드에서만 해제할 수 있으므로,
+    구간 종료를 예약하는 scheduler는 시작한 스레드에서 콜백을 실행해야 합니다 (GUI에서는 root.after).
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        cpu: str = "sampling",
+        memory: bool = False,
+        sample_interval: float = 0.005,
+        memory_frames: int = 10,
+        top: int = 30
+    ):
+        """
+        Args:
+            output_dir: 보고서 디렉토리 (보통 로그 디렉토리)
+            cpu: 'none', 'cprofile', 'sampling'
+            memory: tracemalloc 할당 위치 기록 여부
+            sample_interval: sampling 표본 추출 주기 (초)
+            memory_frames: 할당 위치마다 저장할 호출 스택 깊이
+            top: 보고서에 쓸 상위 항목 수
+        """
+        if cpu not in CPU_MODES:
+            raise ValueError(f"지원하지 않는 프로파일러: {cpu} (none, cprofile, sampling)")
+        self.output_dir = Path(output_dir)
+        self.cpu = cpu
+        self.memory = memory
+        self.sample_interval = sample_interval
+        self.memory_frames = memory_frames
+        self.top = top
+        self.logger = logging.getLogger(__name__)
+
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self.last_reports: List[str] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[SamplingProfiler] = None
+        self._memory_baseline: Optional[tracemalloc.Snapshot] = None
+        self._stop_tracemalloc = False
+        self._timer: Optional[threading.Timer] = None
+        self._on_finished: Optional[Callable[[List[str]], None]] = None
+        # start()마다 증가 (stop() 후 다시 시작했을 때 이전 구간의 종료 예약이 새 구간을 끝내지 않도록)
+        self._session = 0
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.started_at is not None
+
+    def remaining(self) -> Optional[float]:
+        """구간 남은 시간 (초, 구간을 정하지 않았거나 기록 중이 아니면 None)"""
+        if not self.active or not self.duration:
+            return None
+        return max(0.0, self.started_at + self.duration - time.monotonic())
+
+    def start(
+        self,
+        duration: float = 0.0,
+        scheduler: Optional[Callable[[float, Callable[[], None]], object]] = None,
+        on_finished: Optional[Callable[[List[str]], None]] = None
+    ):
+        """
+        기록 시작
+
+        Args:
+            duration: 기록 구간 (초, 0이면 stop()까지)
+            scheduler: scheduler(지연 초, 콜백)로 구간 종료 예약 (None이면 threading.Timer)
+            on_finished: 구간이 끝나 보고서를 쓴 뒤 호출 (보고서 경로 목록)
+        """
+        with self._lock:
+            if self.active:
+                raise RuntimeError("이미 프로파일링 중입니다.")
+            if self.cpu == "none" and not self.memory:
+                raise ValueError("기록할 항목이 없습니다 (CPU 방식 또는 메모리 선택).")
+            if self.cpu == "cprofile" and duration and scheduler is None:
+                raise ValueError("cProfile 구간을 정하려면 시작한 스레드에서 실행되는 scheduler가 필요합니다.")
+
+            if self.memory:
+                # 환경 변수(PYTHONTRACEMALLOC) 등으로 이미 추적 중이면 끝날 때 끄지 않음
+                self._stop_tracemalloc = not tracemalloc.is_tracing()
+                if self._stop_tracemalloc:
+                    tracemalloc.start(self.memory_frames)
+                self._memory_baseline = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+
+            if self.cpu == "cprofile":
+                self._profile = cProfile.Profile()
+                self._profile.enable()
+            elif self.cpu == "sampling":
+                self._sampler = SamplingProfiler(self.sample_interval)
+                self._sampler.start()
+
+            self.started_at = time.monotonic()
+            self.duration = duration
+            self._on_finished = on_finished
+            self._session += 1
+            session = self._session
+
+        self.logger.info(f"프로파일링 시작: CPU {self.cpu}, 메모리 {'사용' if self.memory else '안 함'}"
+                         + (f", {duration:g}초" if duration else ""))
+        if duration:
+            if scheduler is not None:
+                scheduler(duration, lambda: self._finish(session))
+            else:
+                self._timer = threading.Timer(duration, self._finish, args=(session,))
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _finish(self, session: int):
+        """예약된 구간 종료 (그 구간이 이미 끝났으면 무시)"""
+        on_finished = self._on_finished
+        reports = self._stop(session)
+        if reports and on_finished is not None:
+            on_finished(reports)
+
+    def stop(self) -> List[str]:
+        """
+        기록 중지 및 보고서 저장
+
+        Returns:
+            List[str]: 보고서 파일 경로 (기록 중이 아니었으면 빈 리스트)
+        """
+        return self._stop()
+
+    def _stop(self, session: Optional[int] = None) -> List[str]:
+        """기록 중지 (session을 주면 그 구간이 기록 중일 때만)"""
+        with self._lock:
+            if not self.active or (session is not None and session != self._session):
+                return []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            elapsed = time.monotonic() - self.started_at
+            self.started_at = None
+
+            if self._profile is not None:
+                self._profile.disable()
+            if self._sampler is not None:
+                self._sampler.stop()
+            memory_snapshot = None
+            traced = (0, 0)
+            if self._memory_baseline is not None:
+                memory_snapshot = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+                traced = tracemalloc.get_traced_memory()
+                if self._stop_tracemalloc:
+                    tracemalloc.stop()
+
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stem = self.output_dir / f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            reports = []
+            try:
+                if self._profile is not None:
+                    reports += self._write_cprofile(stem, elapsed)
+                if self._sampler is not None:
+                    reports += self._write_sampling(stem, elapsed)
+                if memory_snapshot is not None:
+                    reports.append(self._write_memory(stem, elapsed, memory_snapshot, traced))
+            except OSError as e:
+                self.logger.error(f"프로파일링 보고서 저장 실패: {e}")
+            finally:
+                self._profile = None
+                self._sampler = None
+                self._memory_baseline = None
+
+            self.last_reports = reports
+        self.logger.info(f"프로파일링 종료 ({elapsed:.1f}초): {', '.join(reports)}")
+        return reports
+
+    def _write_cprofile(self, stem: Path, elapsed: float) -> List[str]:
+        stats_path = stem.with_suffix(".pstats")
+        text_path = stem.with_suffix(".txt")
+        self._profile.dump_stats(str(stats_path))
+
+        buffer = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=buffer)
+        buffer.write(f"cProfile {elapsed:.1f}초 (스레드: {threading.current_thread().name})\n\n")
+        buffer.write("== 누적 시간 상위 ==\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        buffer.write("\n== 자체 시간 상위 ==\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(self.top)
+        text_path.write_text(buffer.getvalue(), encoding='utf-8')
+        return [str(stats_path), str(text_path)]
+
+    def _write_sampling(self, stem: Path, elapsed: float) -> List[str]:
+        collapsed_path = stem.with_suffix(".collapsed")
+        text_path = stem.with_suffix(".txt")
+        sampler = self._sampler
+        sampler.write_collapsed(collapsed_path)
+
+        own, total = sampler.top_functions(self.top)
+        threads = Counter()
+        for stack, count in sampler.stacks.items():
+            threads[stack.split(";", 1)[0]] += count
+        lines = [
+            f"sampling {elapsed:.1f}초, 표본 {sampler.samples}회 ({sampler.interval * 1000:g}ms 주기)",
+            "(표본 수 / 전체 표본 회차 = 해당 함수가 스택에 있던 시간 비율, 대기 중인 스레드 포함)",
+            "",
+            "== 스레드별 표본 ==",
+        ]
+        lines += [f"{count:>8}  {name}" for name, count in threads.most_common()]
+        lines += ["", "== 자체 표본 상위 (가장 안쪽 프레임) =="]
+        lines += [f"{count:>8}  {name}" for name, count in own]
+        lines += ["", "== 포함 표본 상위 =="]
+        lines += [f"{count:>8}  {name}" for name, count in total]
+        text_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        return [str(collapsed_path), str(text_path)]
+
+    def _write_memory(self, stem: Path, elapsed: float, snapshot: tracemalloc.Snapshot, traced: Tuple[int, int]) -> str:
+        path = stem.parent / f"{stem.name}-memory.txt"
+        current, peak = traced
+        lines = [f"tracemalloc {elapsed:.1f}초, 추적 중 메모리 {current / 1e6:.1f}MB (최대 {peak / 1e6:.1f}MB)", ""]
+
+        lines.append("== 시작 대비 증가한 할당 위치 ==")
+        for stat in snapshot.compare_to(self._memory_baseline, 'lineno')[:self.top]:
+            if stat.size_diff <= 0:
+                break
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size_diff / 1024:>10.1f}KB {stat.count_diff:>+8}개  {frame.filename}:{frame.lineno}")
+
+        lines += ["", "== 현재 할당 상위 =="]
+        for stat in snapshot.statistics('lineno')[:self.top]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size / 1024:>10.1f}KB {stat.count:>9}개  {frame.filename}:{frame.lineno}")
+
+        lines += ["", "== 증가 상위 호출 스택 =="]
+        for stat in snapshot.compare_to(self._memory_baseline, 'traceback')[:5]:
+            if stat.size_diff <= 0:
+                break
+            lines.append(f"{stat.size_diff / 1024:.1f}KB 증가, {stat.count_diff:+}개")
+            lines += [f"    {line}" for line in stat.traceback.format()]
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        return str(path)
@@ -0,0 +1,198 @@
+"""
+관심종목 시세판
+수신 스레드의 시세 갱신을 종목 / 필드 단위로 합쳐 두었다가, 화면(Tk 메인 루프)이 프레임마다
+바뀐 셀만 가져가도록 하는 중간 저장소입니다. 틱이 아무리 많아도 화면 갱신량은 프레임당 종목 수 이하입니다.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 화면 열 (관심종목정보 ka10095 응답 필드)
+QUOTE_COLUMNS = ("stk_nm", "cur_prc", "pred_pre", "flu_rt", "trde_qty", "sel_bid", "buy_bid")
+QUOTE_HEADINGS = ("종목명", "현재가", "전일대비", "등락률", "거래량", "매도호가", "매수호가")
+
+
+class QuoteBoard:
+    """
+    스레드 간 시세 병합 저장소
+
+    update / update_many는 어느 스레드에서나 호출할 수 있고,
+    take_changes / row / symbols는 화면 스레드에서만 호출합니다.
+    """
+
+    def __init__(self, symbols: Iterable[str] = (), columns: Tuple[str, ...] = QUOTE_COLUMNS):
+        """
+        Args:
+            symbols: 표시할 종목코드 (표시 순서)
+            columns: 표시할 필드
+        """
+        self.columns = columns
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, str]] = {}
+        self._values: Dict[str, Dict[str, str]] = {}
+        self._symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.updates_received = 0
+        self.set_symbols(symbols)
+
+    def set_symbols(self, symbols: Iterable[str]):
+        """표시 종목 변경 (화면 스레드)"""
+        self._symbols = list(dict.fromkeys(symbols))
+        self._index = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._values = {symbol: self._values.get(symbol, {}) for symbol in self._symbols}
+
+    @property
+    def symbols(self) -> List[str]:
+        return self._symbols
+
+    def index(self, symbol: str) -> Optional[int]:
+        """종목의 표시 순서 (표시 대상이 아니면 None)"""
+        return self._index.get(symbol)
+
+    def update(self, symbol: str, fields: Dict[str, str]):
+        """
+        시세 갱신 (수신 스레드, 같은 종목의 이전 미반영 값은 덮어씀)
+
+        Args:
+            symbol: 종목코드
+            fields: 필드 → 값
+        """
+        with self._lock:
+            pending = self._pending.get(symbol)
+            if pending is None:
+                self._pending[symbol] = dict(fields)
+            else:
+                pending.update(fields)
+            self.updates_received += 1
+
+    def update_many(self, rows: Iterable[Tuple[str, Dict[str, str]]]):
+        """여러 종목 시세 갱신 (잠금 한 번)"""
+        with self._lock:
+            for symbol, fields in rows:
+                pending = self._pending.get(symbol)
+                if pending is None:
+                    self._pending[symbol] = dict(fields)
+                else:
+                    pending.update(fields)
+                self.updates_received += 1
+
+    def take_changes(self) -> Dict[str, Dict[str, str]]:
+        """
+        마지막 호출 이후 실제로 값이 바뀐 셀 (화면 스레드)
+
+        Returns:
+            Dict[str, Dict[str, str]]: 종목 → {필드: 새 값} (표시 대상 종목 / 열만)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        changes = {}
+        for symbol, fields in pending.items():
+            current = self._values.get(symbol)
+            if current is None:
+                continue
+            changed = {
+                column: fields[column] for column in self.columns
+                if column in fields and current.get(column) != fields[column]
+            }
+            if changed:
+                current.update(changed)
+                changes[symbol] = changed
+        return changes
+
+    def row(self, symbol: str) -> Tuple[str, ...]:
+        """종목의 표시 값 (열 순서)"""
+        values = self._values.get(symbol, {})
+        return tuple(values.get(column, "") for column in self.columns)
+
+
+class QuotePoller:
+    """관심종목정보(ka10095)를 주기적으로 조회하여 QuoteBoard에 반영"""
+
+    API_ID = "ka10095"
+    ENDPOINT = "/api/dostk/stkinfo"
+    LIST_KEY = "atn_stk_infr"
+
+    def __init__(self, kiwoom_client, board: QuoteBoard, interval: float = 1.0, chunk_size: int = 100):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient 인스턴스
+            board: 시세를 반영할 QuoteBoard
+            interval: 전체 종목 한 바퀴 조회 주기 (초)
+            chunk_size: 요청당 종목 수
+        """
+        self.client = kiwoom_client
+        self.board = board
+        self.interval = interval
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
+
+        self._symbols: List[str] = list(board.symbols)
+        self._subscribers: List[Callable[[List[Dict]], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def set_symbols(self, symbols: Iterable[str]):
+        self._symbols = list(symbols)
+
+    def subscribe(self, callback: Callable[[List[Dict]], None]):
+        """
+        조회 결과 구독 (조회 스레드에서 요청마다 호출됨)
+
+        Args:
+            callback: callback(ka10095 응답 항목 목록)
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[List[Dict]], None]):
+        """구독 해제"""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="quote-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def poll_once(self):
+        """전체 종목 한 바퀴 조회"""
+        symbols = self._symbols
+        for start in range(0, len(symbols), self.chunk_size):
+            if self._stop.is_set():
+                return
+            chunk = symbols[start:start + self.chunk_size]
+            success, result = self.client.call_api(self.API_ID, self.ENDPOINT, {"stk_cd": "|".join(chunk)})
+            if not success:
+                self.logger.warning(f"관심종목 시세 조회 실패: {result}")
+                continue
+            items = result["body"].get(self.LIST_KEY) or []
+            self.board.update_many((item.get("stk_cd", ""), item) for item in items)
+            self._publish(items)
+
+    def _publish(self, items: List[Dict]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(items)
+            except Exception:
+                self.logger.exception("시세 구독자 오류")
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:
+                # 예기치 못한 응답 형식 등으로 조회 스레드가 끝나지 않도록 다음 주기에 다시 시도
+                self.logger.exception("관심종목 시세 조회 중 예외 발생")
+            self._stop.wait(self.interval)
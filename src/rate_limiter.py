@@ -0,0 +1,105 @@
+"""
+호출 제한기
+토큰 버킷 방식으로 API 호출 속도를 제한합니다.
+서버가 호출 제한 초과를 알리면(penalize) 속도를 배수로 줄이고, 이후 설정 속도까지 선형으로 회복합니다 (AIMD).
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """스레드 안전한 토큰 버킷 호출 제한기"""
+
+    def __init__(self, rate: float = 5.0, burst: int = 0, recovery: float = 30.0):
+        """
+        Args:
+            rate: 초당 허용 호출 수 (0 이하이면 제한 없음)
+            burst: 순간 최대 호출 수 (0이면 rate와 동일)
+            recovery: 감속 후 설정 속도까지 회복하는 데 걸리는 시간 (초)
+        """
+        self.rate = rate
+        self.target_rate = rate
+        self.burst = burst if burst > 0 else max(1, int(rate))
+        self.recovery = recovery
+        self.penalties = 0
+
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전 (락 보유 상태에서 호출)"""
+        elapsed = now - self._last
+        self._last = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        if self.rate < self.target_rate:
+            self.rate = min(self.target_rate, self.rate + self.target_rate * elapsed / self.recovery)
+
+    def penalize(self, factor: float = 0.5, min_rate: float = 0.2):
+        """
+        서버 호출 제한 초과 응답 반영 (속도를 factor배로 줄이고 남은 토큰을 비움)
+
+        제한 없는 호출 제한기(rate <= 0)는 기준 속도가 없으므로 그대로 둡니다.
+
+        Args:
+            factor: 감속 배수
+            min_rate: 최저 속도 (초당)
+        """
+        if self.target_rate <= 0:
+            return
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(min(min_rate, self.target_rate), self.rate * factor)
+            self._tokens = min(self._tokens, 0.0)
+            self.penalties += 1
+
+    def try_acquire(self) -> bool:
+        """
+        토큰을 즉시 획득 시도
+
+        Returns:
+            bool: 획득 성공 여부
+        """
+        if self.rate <= 0:
+            return True
+
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self, timeout: float = None) -> bool:
+        """
+        토큰을 획득할 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            bool: 획득 성공 여부
+        """
+        if self.rate <= 0:
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - now
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+
+            time.sleep(wait)
@@ -0,0 +1,378 @@
+"""
+HTTP 기록 / 재생
+클라이언트의 전송 계층을 감싸 요청, 응답, 응답 시간을 카세트 파일에 기록하고,
+기록한 응답을 같은 순서와 지연으로(또는 배속으로) 다시 돌려주는 재생 전송 계층입니다.
+
+카세트는 한 줄에 하나의 JSON 레코드이며, 경로가 .gz로 끝나면 gzip으로 압축합니다.
+첫 줄은 헤더({"cassette": 1, "recorded_at": ...}), 이후 줄은 요청 하나씩입니다.
+앱키, 시크릿키, 토큰, 계좌번호, Authorization 헤더는 기록 전에 가립니다.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .json_codec import JsonCodec, get_codec
+from .metrics import LatencyWindow
+from .transport import (
+    Transport, TransportConnectionError, TransportError, TransportResponse, TransportTimeout, Timeout
+)
+
+CASSETTE_VERSION = 1
+
+# 기록 전에 가릴 JSON 키 / 헤더
+MASK_KEYS = frozenset({"appkey", "secretkey", "token", "acnt_no"})
+MASKED = "***"
+
+# 기록할 요청 / 응답 헤더 (소문자)
+REQUEST_HEADERS = ("api-id", "cont-yn", "next-key")
+RESPONSE_HEADERS = ("api-id", "cont-yn", "next-key", "content-type")
+
+# 기록된 오류 이름 → 재생 시 발생시킬 예외
+_ERRORS = {
+    "TransportTimeout": TransportTimeout,
+    "TransportConnectionError": TransportConnectionError,
+    "TransportError": TransportError,
+}
+
+
+def mask(value, keys: frozenset = MASK_KEYS):
+    """JSON 값에서 민감한 키의 값을 가림 (원본은 바꾸지 않음)"""
+    if isinstance(value, dict):
+        return {k: (MASKED if k in keys and v not in (None, "") else mask(v, keys)) for k, v in value.items()}
+    if isinstance(value, list):
+        return [mask(v, keys) for v in value]
+    return value
+
+
+def _pick_headers(headers, names: Tuple[str, ...]) -> Dict[str, str]:
+    lowered = {k.lower(): v for k, v in headers.items()}
+    return {name: lowered[name] for name in names if name in lowered}
+
+
+def request_key(path: str, headers: Dict[str, str], body) -> str:
+    """재생 시 요청을 기록과 맞추는 키 (경로, TR 코드, 연속조회 키, 가린 본문)"""
+    return json.dumps(
+        [path, headers.get("api-id", ""), headers.get("cont-yn", ""), headers.get("next-key", ""), body],
+        sort_keys=True, ensure_ascii=False
+    )
+
+
+class CassetteWriter:
+    """카세트 파일 기록기 (여러 클라이언트 / 스레드가 공유)"""
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        """
+        Args:
+            path: 카세트 파일 경로 (.gz이면 gzip 압축)
+            flush_interval: 디스크에 내려쓰는 주기 (초)
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self._file = gzip.open(path, 'wt', encoding='utf-8') if path.endswith(".gz") \
+            else open(path, 'w', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._last_flush = self._started
+        self._sequence = 0
+        self._closed = False
+
+        self._write({"cassette": CASSETTE_VERSION, "recorded_at": datetime.now().isoformat(timespec='seconds')})
+        atexit.register(self.close)
+
+    def _write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+    def elapsed(self) -> float:
+        """기록 시작 이후 경과 시간 (초)"""
+        return time.monotonic() - self._started
+
+    def write(self, record: Dict):
+        """레코드 한 줄 기록 (순번 부여)"""
+        with self._lock:
+            if self._closed:
+                return
+            record["seq"] = self._sequence
+            self._sequence += 1
+            self._write(record)
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = now
+
+    def close(self):
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._file.close()
+
+
+def read_cassette(path: str) -> Tuple[Dict, List[Dict]]:
+    """
+    카세트 읽기
+
+    Returns:
+        Tuple[Dict, List[Dict]]: (헤더, 요청 시작 시각 순 레코드)
+
+    Raises:
+        ValueError: 카세트 형식이 아니거나 버전이 다른 경우
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        lines = [line for line in f if line.strip()]
+    if not lines:
+        raise ValueError(f"빈 카세트 파일입니다: {path}")
+
+    header = json.loads(lines[0])
+    if header.get("cassette") != CASSETTE_VERSION:
+        raise ValueError(f"지원하지 않는 카세트 형식입니다: {path}")
+
+    records = []
+    for line in lines[1:]:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            # 비정상 종료로 잘린 마지막 줄
+            break
+    records.sort(key=lambda r: r["t"])
+    return header, records
+
+
+class RecordingTransport(Transport):
+    """다른 전송 계층을 감싸 요청 / 응답 / 응답 시간을 카세트에 기록"""
+
+    def __init__(
+        self,
+        inner: Transport,
+        writer: CassetteWriter,
+        codec: Optional[JsonCodec] = None,
+        mask_keys: frozenset = MASK_KEYS
+    ):
+        """
+        Args:
+            inner: 실제 요청을 보낼 전송 계층
+            writer: 카세트 기록기
+            codec: 요청 / 응답 본문 JSON 코덱
+            mask_keys: 가릴 JSON 키
+        """
+        self.inner = inner
+        self.writer = writer
+        self.codec = codec or get_codec()
+        self.mask_keys = mask_keys
+        self.protocol = inner.protocol
+
+    def _decode(self, content: bytes):
+        """본문 → 가린 JSON (JSON이 아니면 문자열)"""
+        try:
+            return {"json": mask(self.codec.loads(content), self.mask_keys)}
+        except Exception:
+            return {"text": content.decode('utf-8', errors='replace')}
+
+    def post(self, url: str, headers: Dict[str, str], body: bytes, timeout: Timeout) -> TransportResponse:
+        started = self.writer.elapsed()
+        record = {
+            "t": round(started, 6),
+            "method": "POST",
+            "url": url,
+            "req_headers": _pick_headers(headers, REQUEST_HEADERS),
+            "req": self._decode(body),
+        }
+        try:
+            response = self.inner.post(url, headers, body, timeout)
+        except TransportError as e:
+            record["elapsed"] = round(self.writer.elapsed() - started, 6)
+            record["error"] = type(e).__name__ if type(e).__name__ in _ERRORS else "TransportError"
+            record["message"] = str(e)
+            self.writer.write(record)
+            raise
+
+        record["elapsed"] = round(self.writer.elapsed() - started, 6)
+        record["status"] = response.status_code
+        record["headers"] = _pick_headers(response.headers, RESPONSE_HEADERS)
+        record["http_version"] = response.http_version
+        record["res"] = self._decode(response.content)
+        self.writer.write(record)
+        return response
+
+    def head(self, url: str, timeout: Timeout = 5) -> TransportResponse:
+        return self.inner.head(url, timeout)
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """
+    카세트의 응답을 돌려주는 전송 계층
+
+    요청은 (경로, TR 코드, 연속조회 키, 본문)으로 기록과 맞추며, 같은 요청이 여러 번 기록되었으면 기록 순서대로 돌려줍니다.
+    기록된 응답 시간만큼(speed배 빠르게) 기다린 뒤 응답하므로 클라이언트 쪽 처리 시간만 따로 잴 수 있습니다.
+    """
+
+    protocol = "replay"
+
+    def __init__(
+        self,
+        path: str,
+        speed: float = 1.0,
+        strict: bool = False,
+        codec: Optional[JsonCodec] = None,
+        mask_keys: frozenset = MASK_KEYS
+    ):
+        """
+        Args:
+            path: 카세트 파일 경로
+            speed: 재생 배속 (1이면 기록된 응답 시간 그대로, 0이면 기다리지 않음)
+            strict: True이면 기록된 횟수를 넘는 요청을 오류로 처리 (False이면 마지막 응답 반복)
+            codec: 응답 본문 JSON 코덱
+            mask_keys: 요청을 기록과 맞출 때 가릴 JSON 키 (기록 시와 같아야 함)
+        """
+        self.header, self.records = read_cassette(path)
+        self.speed = speed
+        self.strict = strict
+        self.codec = codec or get_codec()
+        self.mask_keys = mask_keys
+        self.logger = logging.getLogger(__name__)
+
+        self._queues: Dict[str, deque] = {}
+        self._last: Dict[str, Dict] = {}
+        for record in self.records:
+            key = self.key_of(record)
+            self._queues.setdefault(key, deque()).append(record)
+        self._lock = threading.Lock()
+        self.served = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_of(record: Dict) -> str:
+        req = record["req"]
+        return request_key(urlsplit(record["url"]).path, record["req_headers"], req.get("json", req.get("text")))
+
+    def _match(self, url: str, headers: Dict[str, str], body: bytes) -> Dict:
+        try:
+            decoded = mask(self.codec.loads(body), self.mask_keys)
+        except Exception:
+            decoded = body.decode('utf-8', errors='replace')
+        key = request_key(urlsplit(url).path, _pick_headers(headers, REQUEST_HEADERS), decoded)
+
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                record = self._last[key] = queue.popleft()
+            elif key in self._last and not self.strict:
+                record = self._last[key]
+            else:
+                self.misses += 1
+                raise TransportError(f"카세트에 없는 요청입니다: {urlsplit(url).path} {headers.get('api-id', '')}")
+            self.served += 1
+        return record
+
+    def post(self, url: str, headers: Dict[str, str], body: bytes, timeout: Timeout) -> TransportResponse:
+        record = self._match(url, headers, body)
+        if self.speed > 0:
+            time.sleep(record["elapsed"] / self.speed)
+
+        if "error" in record:
+            raise _ERRORS.get(record["error"], TransportError)(record.get("message", "기록된 전송 오류"))
+
+        res = record["res"]
+        content = self.codec.dumps(res["json"]) if "json" in res else res["text"].encode('utf-8')
+        return TransportResponse(record["status"], record["headers"], content, record.get("http_version", "HTTP/1.1"))
+
+    def head(self, url: str, timeout: Timeout = 5) -> TransportResponse:
+        return TransportResponse(200, {}, b"", "HTTP/1.1")
+
+
+def replay_calls(
+    client,
+    records: Iterable[Dict],
+    speed: float = 1.0,
+    workers: int = 16
+) -> Dict:
+    """
+    기록된 호출 패턴을 클라이언트로 다시 실행 (기록된 시작 시각을 speed배 빠르게)
+
+    토큰 발급 요청은 처음에 한 번만 실행하고, 나머지 TR 호출은 call_api로 보냅니다.
+    클라이언트가 ReplayTransport를 사용하면 응답도 기록에서 나오므로, 클라이언트 자체 처리 시간을 잴 수 있습니다.
+
+    Args:
+        client: KiwoomAPIClient 인스턴스
+        records: 카세트 레코드 (read_cassette 결과)
+        speed: 재생 배속 (0이면 기다리지 않고 연속 실행)
+        workers: 동시에 실행할 최대 호출 수
+
+    Returns:
+        Dict: 호출 수, 오류 수, 소요 시간, 호출 지연 / 클라이언트 부가 지연 / 시작 지연 백분위수 (ms)
+    """
+    calls = [r for r in records if not is_token_request(r)]
+    if not client.access_token:
+        success, data = client.get_access_token()
+        if not success:
+            raise RuntimeError(f"재생 토큰 발급 실패: {data}")
+
+    latencies = LatencyWindow(max(1, len(calls)))
+    overheads = LatencyWindow(max(1, len(calls)))
+    lags = LatencyWindow(max(1, len(calls)))
+    errors = 0
+    lock = threading.Lock()
+
+    def run(record: Dict, scheduled: float):
+        nonlocal errors
+        started = time.monotonic()
+        success, _ = client.call_api(*call_args(record))
+        latency = time.monotonic() - started
+        replayed = record["elapsed"] / speed if speed > 0 else 0.0
+        with lock:
+            latencies.add(latency)
+            overheads.add(max(0.0, latency - replayed))
+            lags.add(max(0.0, started - scheduled))
+            if not success:
+                errors += 1
+
+    origin = calls[0]["t"] if calls else 0.0
+    began = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="replay") as executor:
+        for record in calls:
+            scheduled = began + ((record["t"] - origin) / speed if speed > 0 else 0.0)
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(run, record, scheduled)
+    duration = time.monotonic() - began
+
+    def summary(window: LatencyWindow) -> Dict[str, float]:
+        return {name: seconds * 1000 for name, seconds in window.percentiles((50, 90, 99)).items()}
+
+    recorded_span = (calls[-1]["t"] - origin) if calls else 0.0
+    return {
+        "calls": len(calls),
+        "errors": errors,
+        "speed": speed,
+        "recorded_seconds": recorded_span,
+        "replay_seconds": duration,
+        "latency_ms": summary(latencies),
+        "overhead_ms": summary(overheads),
+        "start_lag_ms": summary(lags),
+    }
+
+
+def is_token_request(record: Dict) -> bool:
+    """토큰 발급 요청 레코드 여부"""
+    return urlsplit(record["url"]).path.endswith("/oauth2/token")
+
+
+def call_args(record: Dict) -> Tuple[str, str, Dict, str, str]:
+    """카세트 레코드 → call_api 인자 (api_id, endpoint, body, cont_yn, next_key)"""
+    headers = record["req_headers"]
+    return (
+        headers.get("api-id", ""), urlsplit(record["url"]).path, record["req"].get("json", {}),
+        headers.get("cont-yn", "N"), headers.get("next-key", "")
+    )
@@ -0,0 +1,365 @@
+"""
+레코드 타입
+토큰, 시세, 체결, 봉을 Dict 대신 __slots__ 기반 불변 레코드로 다룹니다.
+레코드마다 __dict__가 없어 메모리가 작고, 필드 접근이 Dict 조회보다 빠릅니다.
+
+대량 처리 경로에서는 레코드 목록과 NumPy 구조화 배열을 오가는 변환(to_array / from_array)과,
+응답 행을 레코드 객체 없이 바로 구조화 배열로 만드는 array_from_rows를 사용합니다.
+구조화 배열은 필드 이름으로 열을 꺼낼 수 있으므로(bars["close"]) indicators의 OHLCV 입력으로 그대로 쓸 수 있습니다.
+
+NumPy 변환에는 numpy가 필요합니다 (pip install numpy).
+"""
+
+import math
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _same(a, b) -> bool:
+    """동등 비교 (NaN끼리는 같은 값으로 봄)"""
+    return a == b or (isinstance(a, float) and isinstance(b, float) and a != a and b != b)
+
+
+# 해시에서 NaN 대신 쓰는 값 (NaN의 해시는 객체마다 다를 수 있음)
+_NAN_KEY = object()
+
+
+def _to_float(value, signed: bool = True) -> float:
+    """키움 응답 숫자 문자열 ('+70000', '-1.25', '') → float (signed=False이면 등락 부호 제거)"""
+    if value in (None, ""):
+        return math.nan
+    number = float(value)
+    return number if signed else abs(number)
+
+
+class _Record:
+    """
+    불변 레코드 기본 클래스
+
+    하위 클래스는 __slots__에 필드를 선언하고 __init__에서 _set으로 값을 채웁니다.
+    _DTYPE에 (필드 이름, NumPy 형식) 목록을 두면 구조화 배열 변환을 사용할 수 있습니다.
+    동등 비교와 해시는 생성자 필드(_FIELDS, 기본값은 __slots__ 전체)만 사용하며 NaN끼리는 같은 값으로 봅니다.
+    """
+
+    __slots__ = ()
+    _DTYPE: Tuple[Tuple[str, str], ...] = ()
+    # 동등 비교 / 해시 대상 필드 (파생 필드가 있으면 하위 클래스에서 생성자 필드만 지정)
+    _FIELDS: Tuple[str, ...] = ()
+
+    def _set(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__}은(는) 변경할 수 없습니다 (replace() 사용).")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__}은(는) 변경할 수 없습니다.")
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def _key(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._FIELDS or self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(_same(a, b) for a, b in zip(self._key(), other._key()))
+
+    def __hash__(self):
+        return hash(tuple(_NAN_KEY if value != value else value for value in self._key()))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+    def replace(self, **changes):
+        """일부 필드만 바꾼 새 레코드"""
+        values = dict(zip(self.__slots__, self._values()))
+        values.update(changes)
+        return type(self)(**values)
+
+    def to_dict(self) -> Dict:
+        return dict(zip(self.__slots__, self._values()))
+
+    @classmethod
+    def dtype(cls):
+        """NumPy 구조화 배열 형식"""
+        if np is None:
+            raise ImportError("NumPy 변환에는 numpy가 필요합니다 (pip install numpy).")
+        if not cls._DTYPE:
+            raise TypeError(f"{cls.__name__}은(는) 구조화 배열 변환을 지원하지 않습니다.")
+        return np.dtype(list(cls._DTYPE))
+
+    @classmethod
+    def to_array(cls, records: Iterable["_Record"]):
+        """레코드 목록 → 구조화 배열 (필드 순서는 _DTYPE)"""
+        names = [name for name, _ in cls._DTYPE]
+        dtype = cls.dtype()
+        return np.array([tuple(getattr(r, name) for name in names) for r in records], dtype=dtype)
+
+    @classmethod
+    def from_array(cls, array) -> List["_Record"]:
+        """구조화 배열 → 레코드 목록 (NumPy 스칼라는 Python 값으로)"""
+        names = array.dtype.names
+        return [cls(**dict(zip(names, row))) for row in array.tolist()]
+
+
+class Token(_Record):
+    """
+    접근 토큰 (불변)
+
+    만료 일시(expires_dt, YYYYMMDDHHmmss)는 생성 시 한 번만 파싱해 time.monotonic() 기준 마감 시각으로 바꿔 두므로
+    유효성 확인은 숫자 비교 한 번입니다. 벽시계가 바뀌어도 마감 시각은 흔들리지 않습니다.
+    """
+
+    __slots__ = ('token', 'token_type', 'expires_dt', 'deadline', 'authorization')
+    # 마감 시각과 인증 헤더는 파생 값이므로 비교하지 않음 (같은 만료 일시면 같은 토큰)
+    _FIELDS = ('token', 'token_type', 'expires_dt')
+
+    def __init__(
+        self,
+        token: Optional[str],
+        token_type: Optional[str],
+        expires_dt: Optional[str],
+        deadline: Optional[float] = None
+    ):
+        """
+        Args:
+            token: 접근 토큰
+            token_type: 토큰 타입 (예: 'Bearer')
+            expires_dt: 만료 일시 (YYYYMMDDHHmmss, 없거나 잘못된 형식이면 유효하지 않은 토큰)
+            deadline: time.monotonic() 기준 만료 시각 (None이면 expires_dt에서 계산)
+        """
+        if deadline is None:
+            deadline = self.parse_deadline(expires_dt)
+        self._set(
+            token=token, token_type=token_type, expires_dt=expires_dt, deadline=deadline,
+            authorization=f"{token_type} {token}"
+        )
+
+    @staticmethod
+    def parse_deadline(expires_dt: Optional[str]) -> float:
+        """만료 일시 → time.monotonic() 기준 만료 시각 (파싱할 수 없으면 -inf)"""
+        try:
+            expire_time = datetime.strptime(expires_dt, "%Y%m%d%H%M%S")
+        except (TypeError, ValueError):
+            return -math.inf
+        return time.monotonic() + (expire_time - datetime.now()).total_seconds()
+
+    @classmethod
+    def from_response(cls, data: Dict) -> "Token":
+        """토큰 발급(au10001) 응답 → Token"""
+        return cls(data.get("token"), data.get("token_type"), data.get("expires_dt"))
+
+    def __reduce__(self):
+        # monotonic 마감 시각은 프로세스마다 다르므로 만료 일시에서 다시 계산
+        return Token, (self.token, self.token_type, self.expires_dt)
+
+    def __repr__(self):
+        # 토큰 값은 로그에 남지 않도록 가림
+        return f"Token(token_type={self.token_type!r}, expires_dt={self.expires_dt!r})"
+
+    def replace(self, **changes) -> "Token":
+        """일부 필드만 바꾼 새 토큰 (expires_dt를 바꾸면 마감 시각도 다시 계산)"""
+        values = {name: getattr(self, name) for name in ('token', 'token_type', 'expires_dt')}
+        values.update(changes)
+        if 'expires_dt' not in changes:
+            values['deadline'] = self.deadline
+        return Token(**values)
+
+    def is_valid(self) -> bool:
+        return bool(self.token) and time.monotonic() < self.deadline
+
+    def remaining(self) -> float:
+        """만료까지 남은 시간 (초, 만료되었으면 0)"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def to_dict(self) -> Dict:
+        """get_token_info 형식"""
+        return {
+            "token": self.token,
+            "token_type": self.token_type,
+            "expires_dt": self.expires_dt,
+            "is_valid": self.is_valid(),
+        }
+
+
+class Quote(_Record):
+    """종목 시세 (관심종목정보 ka10095 등의 행)"""
+
+    __slots__ = ('symbol', 'name', 'price', 'change', 'change_rate', 'volume', 'ask', 'bid')
+    _DTYPE = (
+        ('symbol', 'U10'), ('name', 'U20'), ('price', 'f8'), ('change', 'f8'),
+        ('change_rate', 'f8'), ('volume', 'f8'), ('ask', 'f8'), ('bid', 'f8'),
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        name: str,
+        price: float,
+        change: float = 0.0,
+        change_rate: float = 0.0,
+        volume: float = 0.0,
+        ask: float = math.nan,
+        bid: float = math.nan
+    ):
+        """
+        Args:
+            symbol: 종목코드
+            name: 종목명
+            price: 현재가 (등락 부호 없음)
+            change: 전일 대비 (하락이면 음수)
+            change_rate: 등락률 (%)
+            volume: 거래량
+            ask: 매도호가
+            bid: 매수호가
+        """
+        self._set(
+            symbol=symbol, name=name, price=price, change=change,
+            change_rate=change_rate, volume=volume, ask=ask, bid=bid
+        )
+
+    @staticmethod
+    def _row_values(row: Dict) -> tuple:
+        return (
+            row.get('stk_cd', ""), row.get('stk_nm', ""),
+            _to_float(row.get('cur_prc'), signed=False), _to_float(row.get('pred_pre')),
+            _to_float(row.get('flu_rt')), _to_float(row.get('trde_qty'), signed=False),
+            _to_float(row.get('sel_bid'), signed=False), _to_float(row.get('buy_bid'), signed=False),
+        )
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "Quote":
+        """키움 응답 행 → Quote"""
+        return cls(*cls._row_values(row))
+
+    @classmethod
+    def array_from_rows(cls, rows: Iterable[Dict]):
+        """키움 응답 행 목록 → 구조화 배열 (레코드 객체를 만들지 않음)"""
+        dtype = cls.dtype()
+        return np.array([cls._row_values(row) for row in rows], dtype=dtype)
+
+
+class Fill(_Record):
+    """체결 (Portfolio.apply_fill 입력)"""
+
+    __slots__ = ('account', 'symbol', 'quantity', 'price', 'fee', 'order_no', 'timestamp')
+    _DTYPE = (
+        ('account', 'U20'), ('symbol', 'U10'), ('quantity', 'f8'), ('price', 'f8'),
+        ('fee', 'f8'), ('order_no', 'U20'), ('timestamp', 'f8'),
+    )
+
+    def __init__(
+        self,
+        account: str,
+        symbol: str,
+        quantity: float,
+        price: float,
+        fee: float = 0.0,
+        order_no: str = "",
+        timestamp: Optional[float] = None
+    ):
+        """
+        Args:
+            account: 계좌 식별자
+            symbol: 종목코드
+            quantity: 체결 수량 (매수 +, 매도 -)
+            price: 체결 단가
+            fee: 수수료 + 세금
+            order_no: 주문번호
+            timestamp: 체결 시각 (epoch 초, None이면 현재 시각)
+        """
+        self._set(
+            account=account, symbol=symbol, quantity=quantity, price=price, fee=fee,
+            order_no=order_no, timestamp=time.time() if timestamp is None else timestamp
+        )
+
+    def apply_to(self, portfolio):
+        """포트폴리오에 반영"""
+        portfolio.apply_fill(self.account, self.symbol, self.quantity, self.price, self.fee)
+
+
+class Bar(_Record):
+    """봉 (차트 TR 응답 행)"""
+
+    __slots__ = ('symbol', 'time', 'open', 'high', 'low', 'close', 'volume')
+    _DTYPE = (
+        ('symbol', 'U10'), ('time', 'U14'), ('open', 'f8'), ('high', 'f8'),
+        ('low', 'f8'), ('close', 'f8'), ('volume', 'f8'),
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        time: str,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ):
+        """
+        Args:
+            symbol: 종목코드
+            time: 봉 시각 (일봉 YYYYMMDD, 분봉 YYYYMMDDHHmmss)
+            open: 시가
+            high: 고가
+            low: 저가
+            close: 종가 (현재가)
+            volume: 거래량
+        """
+        self._set(symbol=symbol, time=time, open=open, high=high, low=low, close=close, volume=volume)
+
+    @staticmethod
+    def _row_values(symbol: str, row: Dict, time_key: str) -> tuple:
+        # 가격의 부호는 전일 대비 표시이므로 제거 (indicators.chart_rows_to_ohlcv와 동일)
+        return (
+            symbol, row.get(time_key, ""),
+            _to_float(row.get('open_pric'), signed=False), _to_float(row.get('high_pric'), signed=False),
+            _to_float(row.get('low_pric'), signed=False), _to_float(row.get('cur_prc'), signed=False),
+            _to_float(row.get('trde_qty'), signed=False),
+        )
+
+    @staticmethod
+    def _time_key(rows: List[Dict], time_key: Optional[str]) -> str:
+        if time_key is not None:
+            return time_key
+        return "cntr_tm" if rows and "cntr_tm" in rows[0] else "dt"
+
+    @classmethod
+    def from_chart_rows(cls, symbol: str, rows: Iterable[Dict], time_key: Optional[str] = None) -> List["Bar"]:
+        """
+        차트 응답 행 → 시간 오름차순 Bar 목록
+
+        Args:
+            symbol: 종목코드
+            rows: 차트 응답의 목록 필드 (최신 봉이 먼저)
+            time_key: 봉 시각 필드 (None이면 'cntr_tm' → 'dt' 순으로 존재하는 필드)
+        """
+        rows = list(rows)
+        time_key = cls._time_key(rows, time_key)
+        return sorted(
+            (cls(*cls._row_values(symbol, row, time_key)) for row in rows),
+            key=lambda bar: bar.time
+        )
+
+    @classmethod
+    def array_from_rows(cls, symbol: str, rows: Iterable[Dict], time_key: Optional[str] = None):
+        """차트 응답 행 → 시간 오름차순 구조화 배열 (레코드 객체를 만들지 않음)"""
+        dtype = cls.dtype()
+        rows = list(rows)
+        time_key = cls._time_key(rows, time_key)
+        array = np.array([cls._row_values(symbol, row, time_key) for row in rows], dtype=dtype)
+        return array[np.argsort(array['time'], kind='stable')]
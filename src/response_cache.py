@@ -0,0 +1,209 @@
+"""
+응답 캐시
+하루에 한 번 정도만 바뀌는 기준정보(종목 리스트, 업종코드 등) 응답을 캐시합니다.
+메모리(LRU) 계층과 선택적인 디스크(SQLite) 계층으로 구성됩니다.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """TTL + LRU 응답 캐시"""
+
+    # TR 코드별 기본 TTL (초)
+    DEFAULT_TTLS = {
+        "ka10099": 24 * 60 * 60,  # 종목정보 리스트
+        "ka10100": 24 * 60 * 60,  # 종목정보 조회
+        "ka10101": 24 * 60 * 60,  # 업종코드 리스트
+    }
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, int]] = None,
+        max_bytes: int = 32 * 1024 * 1024,
+        disk_path: Optional[str] = None
+    ):
+        """
+        Args:
+            ttls: TR 코드별 TTL (초) - 기본값에 덮어씀, 0 이하이면 캐시하지 않음
+            max_bytes: 메모리 계층 최대 크기 (바이트, 직렬화 크기 기준)
+            disk_path: 디스크 계층 SQLite 파일 경로 (None이면 메모리만 사용)
+        """
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_bytes = max_bytes
+
+        # key -> (만료 시각, 크기, 값)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.logger = logging.getLogger(__name__)
+
+        self._db: Optional[sqlite3.Connection] = None
+        if disk_path:
+            self._open_disk(disk_path)
+
+    def _open_disk(self, disk_path: str):
+        """디스크 계층 초기화"""
+        Path(disk_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(disk_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self._db.execute("DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),))
+        self._db.commit()
+
+    def is_cacheable(self, api_id: str) -> bool:
+        """캐시 대상 TR 코드인지 확인"""
+        return self.ttls.get(api_id, 0) > 0
+
+    @staticmethod
+    def make_key(namespace: str, api_id: str, body: Dict, cont_yn: str = "N", next_key: str = "") -> str:
+        """
+        캐시 키 생성 (요청 본문은 키 정렬 후 직렬화하여 순서와 무관하게 동일한 키 생성)
+
+        Args:
+            namespace: 캐시 구분자 (환경 등)
+            api_id: TR 코드
+            body: 요청 본문
+            cont_yn: 연속조회 여부
+            next_key: 연속조회 키
+
+        Returns:
+            str: 캐시 키
+        """
+        canonical = json.dumps(body, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return f"{namespace}|{api_id}|{cont_yn}|{next_key}|{canonical}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시 조회
+
+        반환값은 캐시와 공유되므로 호출자가 수정하면 안 됩니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[Dict]: 캐시된 응답 (없거나 만료되면 None)
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, size, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._remove(key)
+
+            if self._db is None:
+                self.misses += 1
+                return None
+
+            row = self._db.execute(
+                "SELECT expires_at, value FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[0] <= now:
+                self.misses += 1
+                return None
+
+            # 디스크 적중 시 메모리 계층으로 승격
+            value = json.loads(row[1])
+            self._insert(key, row[0], len(row[1]), value)
+            self.disk_hits += 1
+            return value
+
+    def put(self, api_id: str, key: str, value: Dict):
+        """
+        캐시 저장
+
+        Args:
+            api_id: TR 코드 (TTL 결정)
+            key: 캐시 키
+            value: 응답 데이터
+        """
+        ttl = self.ttls.get(api_id, 0)
+        if ttl <= 0:
+            return
+
+        serialized = json.dumps(value, ensure_ascii=False)
+        expires_at = time.time() + ttl
+
+        with self._lock:
+            self._insert(key, expires_at, len(serialized), value)
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, expires_at, value) VALUES (?, ?, ?)",
+                    (key, expires_at, serialized)
+                )
+                self._db.commit()
+
+    def _insert(self, key: str, expires_at: float, size: int, value: Dict):
+        """메모리 계층에 저장 후 용량 초과분 제거 (락 보유 상태에서 호출)"""
+        if key in self._entries:
+            self._remove(key)
+
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (expires_at, size, value)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        """메모리 계층에서 제거 (락 보유 상태에서 호출)"""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        """캐시 전체 삭제 (디스크 포함)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM response_cache")
+                self._db.commit()
+
+    def get_stats(self) -> Dict:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict: 적중/미스 횟수, 적중률, 메모리 사용량 등
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
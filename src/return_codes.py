@@ -0,0 +1,108 @@
+"""
+키움 응답 분류
+키움 REST API는 호출 제한 초과, 토큰 만료 등 많은 실패를 HTTP 200과 함께 본문의 return_code / return_msg로 알립니다.
+HTTP 상태와 return_code를 함께 보고 응답을 결과 유형으로 분류하며, 클라이언트는 유형에 따라 대응합니다.
+표에 있는 return_code는 HTTP 상태보다 우선하고, 표에 없는 코드는 HTTP 상태(429, 401, 5xx)로 분류합니다.
+
+- OK: 정상
+- THROTTLED: 호출 제한 초과 → 호출 제한기 감속 후 재시도
+- AUTH_EXPIRED: 토큰 만료 / 무효 → 토큰 한 번만 재발급(single-flight) 후 재시도
+- INVALID: 잘못된 요청 (TR 코드, 입력 값, 키 등) → 재시도 없이 바로 실패
+- SERVER_ERROR: 서버 / 네트워크 오류 → 실패 (연속되면 서킷 브레이커)
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+OK = "ok"
+THROTTLED = "throttled"
+AUTH_EXPIRED = "auth_expired"
+INVALID = "invalid"
+SERVER_ERROR = "server_error"
+
+# 키움 return_code → 결과 유형 (표에 없는 0이 아닌 코드는 HTTP 200 / 4xx이면 INVALID, 그 밖에는 HTTP 상태로 분류)
+RETURN_CODES: Dict[int, str] = {
+    0: OK,
+    # 호출 제한
+    1687: THROTTLED,   # 재귀 호출이 발생하여 API 호출을 제한
+    1700: THROTTLED,   # 허용된 요청 개수 초과
+    # 토큰
+    1513: AUTH_EXPIRED,  # authorization 헤더 없음
+    1514: AUTH_EXPIRED,  # authorization 헤더 형식 오류
+    1516: AUTH_EXPIRED,  # authorization 헤더에 토큰 없음
+    8003: AUTH_EXPIRED,  # Access Token 조회 실패
+    8005: AUTH_EXPIRED,  # Token이 유효하지 않음
+    8103: AUTH_EXPIRED,  # 토큰 인증 또는 단말기 인증 실패
+    # 서버
+    1999: SERVER_ERROR,  # 예기치 못한 에러
+    8006: SERVER_ERROR,  # Access Token 생성 실패
+    8009: SERVER_ERROR,  # Access Token 발급 실패
+}
+
+
+def classify(status_code: int, body: Optional[Dict] = None) -> Tuple[str, Optional[int], str]:
+    """
+    응답 분류
+
+    Args:
+        status_code: HTTP 상태 코드
+        body: 파싱된 응답 본문 (JSON이 아니면 None)
+
+    Returns:
+        Tuple[str, Optional[int], str]: (결과 유형, return_code, return_msg)
+    """
+    return_code = None
+    return_msg = ""
+    if isinstance(body, dict) and "return_code" in body:
+        try:
+            return_code = int(body["return_code"])
+        except (TypeError, ValueError):
+            return_code = None
+        return_msg = str(body.get("return_msg", ""))
+
+    # 알려진 코드만 본문 기준으로 분류 (모르는 코드 때문에 429 / 401 / 5xx의 대응이 바뀌지 않도록)
+    if return_code in RETURN_CODES and return_code != 0:
+        return RETURN_CODES[return_code], return_code, return_msg
+
+    if status_code == 200:
+        unknown = return_code is not None and return_code != 0
+        return (INVALID if unknown else OK), return_code, return_msg
+    if status_code == 429:
+        return THROTTLED, return_code, return_msg
+    if status_code == 401:
+        return AUTH_EXPIRED, return_code, return_msg
+    if status_code >= 500:
+        return SERVER_ERROR, return_code, return_msg
+    return INVALID, return_code, return_msg
+
+
+def parse_body(response, codec) -> Optional[Any]:
+    """
+    응답 본문 JSON 파싱
+
+    Args:
+        response: 전송 계층 응답
+        codec: JsonCodec
+
+    Returns:
+        파싱된 본문 (실패 응답의 본문이 JSON이 아니면 None, HTTP 200인데 JSON이 아니면 ValueError)
+    """
+    if response.status_code == 200:
+        return codec.loads(response.content)
+    try:
+        return codec.loads(response.content)
+    except ValueError:
+        return None
+
+
+def describe_failure(response, url: str, body: Optional[Any]) -> Dict:
+    """실패 응답 정보 (결과 유형, 키움 return_code / return_msg 포함)"""
+    outcome, return_code, return_msg = classify(response.status_code, body)
+    data = {
+        "status_code": response.status_code,
+        "message": return_msg or response.text,
+        "url": url,
+        "outcome": outcome,
+    }
+    if return_code is not None:
+        data["return_code"] = return_code
+    return data
@@ -0,0 +1,352 @@
+"""
+종목 마스터
+종목 리스트를 한 번 불러와 종목코드 / 종목명 / 초성 접두어 검색 인덱스를 구성합니다.
+접두어 결과가 모자라면 종목명 중간 일치('전자')까지 찾습니다.
+"""
+
+import bisect
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+# 한글 초성 (유니코드 음절 순서)
+CHOSEONG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSEONG_JONGSEONG = 21 * 28
+
+
+def to_choseong(text: str) -> str:
+    """
+    문자열을 초성 문자열로 변환 (한글 음절이 아닌 문자는 그대로 유지)
+
+    Args:
+        text: 변환할 문자열
+
+    Returns:
+        str: 초성 문자열 (예: '삼성전자' -> 'ㅅㅅㅈㅈ')
+    """
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // JUNGSEONG_JONGSEONG])
+        else:
+            chars.append(ch)
+    return ''.join(chars)
+
+
+# 받침 (유니코드 음절 순서, 0은 받침 없음) 중 홑받침 → 같은 초성
+JONGSEONG_TO_CHOSEONG = {
+    1: 'ㄱ', 2: 'ㄲ', 4: 'ㄴ', 7: 'ㄷ', 8: 'ㄹ', 16: 'ㅁ', 17: 'ㅂ', 19: 'ㅅ',
+    20: 'ㅆ', 21: 'ㅇ', 22: 'ㅈ', 23: 'ㅊ', 24: 'ㅋ', 25: 'ㅌ', 26: 'ㅍ', 27: 'ㅎ'
+}
+
+# 입력 중인 마지막 음절의 받침 → (앞 음절에 남는 받침, 다음 음절 초성)
+# 예: '삼성젅'은 '삼성전' + 'ㅈ'을 입력하는 중일 수 있음
+JONGSEONG_SPLIT = {jong: (0, cho) for jong, cho in JONGSEONG_TO_CHOSEONG.items()}
+JONGSEONG_SPLIT.update({
+    3: (1, 'ㅅ'), 5: (4, 'ㅈ'), 6: (4, 'ㅎ'), 9: (8, 'ㄱ'), 10: (8, 'ㅁ'), 11: (8, 'ㅂ'),
+    12: (8, 'ㅅ'), 13: (8, 'ㅌ'), 14: (8, 'ㅍ'), 15: (8, 'ㅎ'), 18: (17, 'ㅂ'),
+})
+
+# 입력 중에 더 이어질 수 있는 받침 / 중성 (예: 'ㄹ' → 'ㄺ', 'ㅗ' → 'ㅘ')
+JONGSEONG_PREFIX = {1: (3,), 4: (5, 6), 8: (9, 10, 11, 12, 13, 14, 15), 17: (18,)}
+JUNGSEONG_PREFIX = {8: (9, 10, 11), 13: (14, 15, 16), 18: (19,)}
+
+
+def _decompose(ch: str) -> Optional[Tuple[int, int, int]]:
+    """한글 음절 → (초성, 중성, 종성) 번호 (음절이 아니면 None)"""
+    code = ord(ch) - HANGUL_BASE
+    if not 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+        return None
+    return code // JUNGSEONG_JONGSEONG, code % JUNGSEONG_JONGSEONG // 28, code % 28
+
+
+def _char_matches(name_ch: str, query_ch: str) -> bool:
+    """음절 또는 초성 한 글자 비교 (검색어 글자가 초성이면 종목명 글자의 초성과 비교)"""
+    if query_ch in CHOSEONG:
+        return to_choseong(name_ch) == query_ch
+    return name_ch == query_ch
+
+
+def _last_char_matches(name: str, pos: int, query_ch: str) -> bool:
+    """
+    검색어 마지막 글자 비교 (IME로 조합 중인 음절 허용)
+
+    '사'는 '삼'의, '사'/'살'은 '삶'의 앞부분이고,
+    '젅'은 '전' 뒤에 다음 음절 초성 'ㅈ'을 입력하는 중일 수 있습니다.
+    """
+    name_ch = name[pos]
+    if _char_matches(name_ch, query_ch):
+        return True
+
+    query_jamo = _decompose(query_ch)
+    name_jamo = _decompose(name_ch)
+    if query_jamo is None or name_jamo is None:
+        return False
+
+    cho, jung, jong = query_jamo
+    name_cho, name_jung, name_jong = name_jamo
+    if name_cho != cho:
+        return False
+    if jong == 0:
+        return name_jung == jung or name_jung in JUNGSEONG_PREFIX.get(jung, ())
+    if name_jung != jung:
+        return False
+    if name_jong in JONGSEONG_PREFIX.get(jong, ()):
+        return True
+
+    remain, next_cho = JONGSEONG_SPLIT[jong]
+    return (
+        name_jong == remain and pos + 1 < len(name)
+        and to_choseong(name[pos + 1]) == next_cho
+    )
+
+
+def match_at(name: str, query: str, pos: int = 0) -> bool:
+    """
+    name[pos:]가 검색어로 시작하는지 확인
+
+    검색어에는 음절과 초성을 섞어 쓸 수 있고('삼성ㅈ'), 마지막 음절은 조합 중일 수 있습니다('삼성젅').
+
+    Args:
+        name: 정규화된 종목명
+        query: 정규화된 검색어
+        pos: 비교 시작 위치
+
+    Returns:
+        bool: 일치 여부
+    """
+    if not query or len(name) - pos < len(query):
+        return False
+    last = len(query) - 1
+    for i, query_ch in enumerate(query[:last]):
+        if not _char_matches(name[pos + i], query_ch):
+            return False
+    return _last_char_matches(name, pos + last, query[last])
+
+
+def _normalize(text: str) -> str:
+    """검색용 정규화 (공백 제거, 영문 대문자)"""
+    return ''.join(text.split()).upper()
+
+
+class SymbolIndex:
+    """
+    불변 종목 검색 인덱스
+
+    정렬된 (키, 종목 번호) 배열에서 이진 탐색으로 접두어 범위를 찾습니다.
+    음절과 초성이 섞인 검색어('삼성ㅈ')는 초성 인덱스로 후보 범위를 찾은 뒤 글자 단위로 확인합니다.
+    생성 후에는 변경되지 않으므로 여러 스레드가 락 없이 읽을 수 있습니다.
+    """
+
+    def __init__(self, symbols: List[Dict]):
+        """
+        Args:
+            symbols: 종목 목록 ({"code", "name", ...})
+        """
+        self.symbols = symbols
+        self._names = [_normalize(s["name"]) for s in symbols]
+        self._choseong_names = [to_choseong(name) for name in self._names]
+
+        self._code_keys, self._code_ids = self._build(
+            (_normalize(s["code"]), i) for i, s in enumerate(symbols)
+        )
+        self._name_keys, self._name_ids = self._build(
+            (_normalize(s["name"]), i) for i, s in enumerate(symbols)
+        )
+        self._choseong_keys, self._choseong_ids = self._build(
+            (chosung, i) for i, chosung in enumerate(self._choseong_names)
+        )
+
+        self._by_code = {s["code"]: s for s in symbols}
+
+    @staticmethod
+    def _build(pairs) -> Tuple[List[str], List[int]]:
+        ordered = sorted(pairs)
+        return [key for key, _ in ordered], [idx for _, idx in ordered]
+
+    @staticmethod
+    def _prefix_range(keys: List[str], prefix: str) -> Tuple[int, int]:
+        """접두어와 일치하는 키의 [시작, 끝) 범위"""
+        lo = bisect.bisect_left(keys, prefix)
+        hi = bisect.bisect_left(keys, prefix + '\uffff', lo)
+        return lo, hi
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def get(self, code: str) -> Optional[Dict]:
+        """종목코드로 종목 조회"""
+        return self._by_code.get(code)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        종목 검색 (종목코드 접두어 → 종목명 접두어 → 초성 / 음절·초성 혼합 접두어 → 종목명 중간 일치 순으로 병합)
+
+        Args:
+            query: 검색어 (종목코드 일부, 종목명 일부, 초성, 또는 '삼성ㅈ'처럼 섞어 입력 중인 글자)
+            limit: 최대 결과 수
+
+        Returns:
+            List[Dict]: 일치하는 종목 목록
+        """
+        prefix = _normalize(query)
+        if not prefix or limit <= 0:
+            return []
+
+        results = []
+        seen = set()
+
+        def add(idx: int) -> bool:
+            if idx not in seen:
+                seen.add(idx)
+                results.append(self.symbols[idx])
+            return len(results) >= limit
+
+        for keys, ids in ((self._code_keys, self._code_ids), (self._name_keys, self._name_ids)):
+            lo, hi = self._prefix_range(keys, prefix)
+            for pos in range(lo, hi):
+                if add(ids[pos]):
+                    return results
+
+        # 초성 범위는 검색어의 초성으로 찾고, 음절이 섞여 있으면 글자 단위로 확인
+        choseong = to_choseong(prefix)
+        lo, hi = self._prefix_range(self._choseong_keys, choseong)
+        for pos in range(lo, hi):
+            idx = self._choseong_ids[pos]
+            if idx not in seen and match_at(self._names[idx], prefix) and add(idx):
+                return results
+
+        # 종목명 중간 일치 (종목 수천 개 수준이라 선형 탐색)
+        for idx, chosung_name in enumerate(self._choseong_names):
+            if idx in seen:
+                continue
+            start = chosung_name.find(choseong, 1)
+            while start != -1:
+                if match_at(self._names[idx], prefix, start):
+                    if add(idx):
+                        return results
+                    break
+                start = chosung_name.find(choseong, start + 1)
+
+        return results
+
+
+class SymbolMaster:
+    """종목 마스터 (백그라운드 갱신 + 락 없는 읽기)"""
+
+    # 종목정보 리스트 TR
+    SYMBOL_LIST_API_ID = "ka10099"
+    STOCK_INFO_ENDPOINT = "/api/dostk/stkinfo"
+
+    # 시장 구분 (0: 코스피, 10: 코스닥)
+    DEFAULT_MARKETS = ("0", "10")
+
+    def __init__(self, kiwoom_client, markets=DEFAULT_MARKETS):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient 인스턴스
+            markets: 불러올 시장 구분 코드 목록
+        """
+        self.client = kiwoom_client
+        self.markets = tuple(markets)
+        self.logger = logging.getLogger(__name__)
+
+        # 검색은 항상 현재 인덱스 참조를 한 번 읽어 사용 (갱신 시 참조만 교체)
+        self._index = SymbolIndex([])
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def index(self) -> SymbolIndex:
+        return self._index
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self._index) > 0
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """종목 검색 (SymbolIndex.search 참조)"""
+        return self._index.search(query, limit)
+
+    def get(self, code: str) -> Optional[Dict]:
+        """종목코드로 종목 조회"""
+        return self._index.get(code)
+
+    def _fetch_symbols(self) -> Tuple[bool, List[Dict]]:
+        """
+        종목 리스트 조회 (연속조회 포함)
+
+        Returns:
+            Tuple[bool, List[Dict]]: (성공 여부, 종목 목록)
+        """
+        symbols = []
+
+        for market in self.markets:
+            cont_yn, next_key = "N", ""
+            while True:
+                success, result = self.client.call_api(
+                    self.SYMBOL_LIST_API_ID,
+                    self.STOCK_INFO_ENDPOINT,
+                    {"mrkt_tp": market},
+                    cont_yn,
+                    next_key
+                )
+                if not success:
+                    self.logger.error(f"종목 리스트 조회 실패 (시장 {market}): {result}")
+                    return False, []
+
+                for item in result["body"].get("list") or []:
+                    code = item.get("code")
+                    if code:
+                        symbols.append({
+                            "code": code,
+                            "name": item.get("name", ""),
+                            "market": item.get("marketName", market),
+                        })
+
+                cont_yn, next_key = result.get("cont_yn", "N"), result.get("next_key", "")
+                if cont_yn != "Y" or not next_key:
+                    break
+
+        return True, symbols
+
+    def refresh(self) -> bool:
+        """
+        종목 리스트를 다시 불러와 인덱스 교체 (호출 스레드에서 실행)
+
+        Returns:
+            bool: 성공 여부
+        """
+        with self._refresh_lock:
+            success, symbols = self._fetch_symbols()
+            if not success:
+                return False
+
+            # 새 인덱스를 완성한 뒤 참조만 교체하므로 읽는 쪽은 대기하지 않음
+            self._index = SymbolIndex(symbols)
+            self.logger.info(f"종목 마스터 갱신 완료 - {len(symbols)}종목")
+            return True
+
+    def refresh_async(self) -> threading.Thread:
+        """
+        백그라운드 스레드에서 갱신 (이미 갱신 중이면 기존 스레드 반환)
+
+        Returns:
+            threading.Thread: 갱신 스레드
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return self._refresh_thread
+
+        self._refresh_thread = threading.Thread(
+            target=self.refresh, name="symbol-master-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+        return self._refresh_thread
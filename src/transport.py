@@ -0,0 +1,192 @@
+"""
+HTTP 전송 계층
+클라이언트와 실제 HTTP 라이브러리 사이의 교체 가능한 계층입니다.
+
+- RequestsTransport: requests 기반 HTTP/1.1 (기본)
+- HttpxTransport: httpx 기반 HTTP/2 다중화 (httpx[http2] 설치 시, 서버가 지원하지 않으면 HTTP/1.1로 협상)
+"""
+
+import logging
+from typing import Dict, Mapping, Tuple, Union
+
+import requests
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class TransportError(Exception):
+    """전송 계층 오류"""
+
+
+class TransportTimeout(TransportError):
+    """요청 시간 초과"""
+
+
+class TransportConnectionError(TransportError):
+    """연결 실패"""
+
+
+class TransportResponse:
+    """전송 계층 공통 응답"""
+
+    __slots__ = ('status_code', 'headers', 'content', 'http_version')
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes, http_version: str = "HTTP/1.1"):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.http_version = http_version
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+
+class Transport:
+    """전송 계층 기본 클래스"""
+
+    protocol = "http1"
+
+    def post(self, url: str, headers: Dict[str, str], body: bytes, timeout: Timeout) -> TransportResponse:
+        """
+        POST 요청
+
+        Args:
+            url: 요청 URL
+            headers: 요청 헤더
+            body: 직렬화된 요청 본문
+            timeout: 타임아웃 (초 또는 (연결, 읽기))
+
+        Returns:
+            TransportResponse: 응답
+
+        Raises:
+            TransportTimeout: 시간 초과
+            TransportConnectionError: 연결 실패
+            TransportError: 그 밖의 전송 오류
+        """
+        raise NotImplementedError
+
+    def head(self, url: str, timeout: Timeout = 5) -> TransportResponse:
+        """HEAD 요청 (커넥션 예열 / keep-alive 용도)"""
+        raise NotImplementedError
+
+    def close(self):
+        """커넥션 풀 정리"""
+
+
+class RequestsTransport(Transport):
+    """requests 기반 HTTP/1.1 전송"""
+
+    protocol = "http1"
+
+    def __init__(self, pool_size: int = 10):
+        """
+        Args:
+            pool_size: 호스트당 커넥션 풀 크기
+        """
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.Timeout as e:
+            raise TransportTimeout(str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise TransportConnectionError(str(e)) from e
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e)) from e
+
+        return TransportResponse(response.status_code, response.headers, response.content, "HTTP/1.1")
+
+    def post(self, url: str, headers: Dict[str, str], body: bytes, timeout: Timeout) -> TransportResponse:
+        return self._request("POST", url, headers=headers, data=body, timeout=timeout)
+
+    def head(self, url: str, timeout: Timeout = 5) -> TransportResponse:
+        return self._request("HEAD", url, timeout=timeout)
+
+    def close(self):
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """httpx 기반 HTTP/2 전송 (적은 수의 커넥션에서 요청 다중화)"""
+
+    protocol = "http2"
+
+    def __init__(self, pool_size: int = 10, prior_knowledge: bool = False):
+        """
+        Args:
+            pool_size: 최대 커넥션 수 (HTTP/2에서는 보통 1~2개면 충분)
+            prior_knowledge: TLS 없이 HTTP/2로 바로 연결 (h2c, 로컬 테스트 서버용)
+
+        Raises:
+            ImportError: httpx 또는 h2가 설치되지 않은 경우
+        """
+        import httpx
+        import h2  # noqa: F401  (http2=True에 필요)
+
+        self._httpx = httpx
+        self.pool_size = pool_size
+        self.client = httpx.Client(
+            http1=not prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    def _timeout(self, timeout: Timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect)
+        return self._httpx.Timeout(timeout)
+
+    def _request(self, method: str, url: str, timeout: Timeout, **kwargs) -> TransportResponse:
+        httpx = self._httpx
+        try:
+            response = self.client.request(method, url, timeout=self._timeout(timeout), **kwargs)
+        except httpx.TimeoutException as e:
+            raise TransportTimeout(str(e)) from e
+        except httpx.ConnectError as e:
+            raise TransportConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+
+        return TransportResponse(response.status_code, response.headers, response.content, response.http_version)
+
+    def post(self, url: str, headers: Dict[str, str], body: bytes, timeout: Timeout) -> TransportResponse:
+        return self._request("POST", url, timeout, headers=headers, content=body)
+
+    def head(self, url: str, timeout: Timeout = 5) -> TransportResponse:
+        return self._request("HEAD", url, timeout)
+
+    def close(self):
+        self.client.close()
+
+
+def create_transport(protocol: str = "http1", pool_size: int = 10, prior_knowledge: bool = False) -> Transport:
+    """
+    전송 계층 생성
+
+    Args:
+        protocol: 'http1', 'http2' 또는 'auto' (http2/auto는 httpx[http2]가 없으면 http1으로 대체)
+        pool_size: 커넥션 풀 크기
+        prior_knowledge: HTTP/2 사전 합의 연결 (h2c)
+
+    Returns:
+        Transport: 전송 계층 인스턴스
+    """
+    if protocol in ("http2", "auto"):
+        try:
+            return HttpxTransport(pool_size=pool_size, prior_knowledge=prior_knowledge)
+        except ImportError:
+            if protocol == "http2":
+                logging.getLogger(__name__).warning(
+                    "httpx[http2]가 설치되지 않아 HTTP/1.1 전송을 사용합니다."
+                )
+
+    return RequestsTransport(pool_size=pool_size)